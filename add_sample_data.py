@@ -0,0 +1,235 @@
+"""
+Load sample data into an AXAI PostgreSQL database.
+
+This script is the default ``sample_data_script`` used by
+``DatabaseInitializer.load_sample_data()``. Connection settings are read
+from the POSTGRES_* environment variables (see
+``PostgresConnectionConfig.from_env``).
+
+All primary keys are generated client-side, so every parent ID is known
+before its children are written and each table is loaded with a single
+``COPY ... FROM STDIN`` stream instead of per-entity INSERT/flush round-trips.
+Rows come from generators and are written as they are produced, so memory
+use does not grow with the size of the seed set. Topic keyword arrays are
+serialized to their PostgreSQL text form up front; JSON properties on the
+graph tables are adapted by ``copy_rows``.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, Sequence, Tuple
+
+# Allow running from a source checkout without installing the package
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from axai_pg.data.config.database import DatabaseManager, PostgresConnectionConfig, copy_rows
+
+TOOL = "sample-data"
+
+# Seed definitions; parents are referenced by natural key (name/username/filename)
+ORGANIZATIONS = ("Tech Corp", "Research Institute")
+
+USERS = (
+    # (username, email, organization)
+    ("johndoe", "john@techcorp.com", "Tech Corp"),
+    ("janesmith", "jane@techcorp.com", "Tech Corp"),
+    ("bobwilson", "bob@research.org", "Research Institute"),
+)
+
+DOCUMENTS = (
+    # (filename, title, content, owner, document_type, status)
+    ("tech_spec.md", "Technical Specification",
+     "This is a technical specification document for the new system.",
+     "johndoe", "specification", "published"),
+    ("proposal.md", "Project Proposal",
+     "Proposal for a new research project on machine learning.",
+     "janesmith", "proposal", "draft"),
+    ("paper.md", "Research Paper",
+     "Findings from our latest study on graph-based document analysis.",
+     "bobwilson", "research", "published"),
+)
+
+SUMMARIES = (
+    # (document, content, status)
+    ("tech_spec.md", "Specification for the new system architecture.", "published"),
+    ("proposal.md", "Proposal for a machine learning research project.", "draft"),
+    ("paper.md", "Study results on graph-based document analysis.", "published"),
+)
+
+TOPICS = (
+    # (name, description, keywords)
+    ("System Architecture", "Software and system design",
+     ["architecture", "system design", "specification"]),
+    ("Machine Learning", "Machine learning methods and applications",
+     ["AI", "machine learning", "neural networks"]),
+    ("Graph Analysis", "Graph-based data analysis",
+     ["graphs", "knowledge graph", "entity relationships"]),
+)
+
+DOCUMENT_TOPICS = (
+    # (document, topic, relevance_score)
+    ("tech_spec.md", "System Architecture", 0.95),
+    ("proposal.md", "Machine Learning", 0.90),
+    ("paper.md", "Machine Learning", 0.60),
+    ("paper.md", "Graph Analysis", 0.85),
+)
+
+GRAPH_ENTITIES = (
+    # (entity_id, document, properties)
+    ("doc-tech-spec", "tech_spec.md", {"keywords": ["architecture", "specification"]}),
+    ("doc-proposal", "proposal.md", {"keywords": ["machine learning", "research"]}),
+    ("doc-paper", "paper.md", {"keywords": ["graphs", "document analysis"]}),
+)
+
+GRAPH_RELATIONSHIPS = (
+    # (source entity, target entity, relationship_type, is_directed, weight, properties)
+    ("doc-proposal", "doc-tech-spec", "references", True, 1.0,
+     {"context": "proposal builds on the specification"}),
+    ("doc-paper", "doc-proposal", "related_to", False, 0.5,
+     {"context": "shared machine learning topic"}),
+)
+
+
+def _text_array(values: Sequence[str]) -> str:
+    """Render a list of strings as a PostgreSQL text[] literal."""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"') for v in values)
+    return "{" + ",".join(f'"{v}"' for v in escaped) + "}"
+
+
+def _new_id(ids: Dict[str, uuid.UUID], key: str) -> uuid.UUID:
+    ids[key] = uuid.uuid4()
+    return ids[key]
+
+
+def iter_organization_rows(org_ids) -> Iterator[Tuple]:
+    for name in ORGANIZATIONS:
+        yield (_new_id(org_ids, name), name)
+
+
+def iter_user_rows(user_ids, org_ids) -> Iterator[Tuple]:
+    for username, email, org in USERS:
+        yield (_new_id(user_ids, username), username, email, org_ids[org])
+
+
+def iter_document_rows(doc_ids, user_ids, user_orgs) -> Iterator[Tuple]:
+    for filename, title, content, owner, document_type, status in DOCUMENTS:
+        yield (
+            _new_id(doc_ids, filename), title, filename, content,
+            user_ids[owner], user_orgs[owner], f"/documents/{filename}",
+            len(content), "text/markdown", document_type, status, False, 1,
+        )
+
+
+def iter_summary_rows(doc_ids) -> Iterator[Tuple]:
+    for document, content, status in SUMMARIES:
+        yield (uuid.uuid4(), doc_ids[document], content, "abstract", TOOL, status)
+
+
+def iter_topic_rows(topic_ids) -> Iterator[Tuple]:
+    for name, description, keywords in TOPICS:
+        yield (_new_id(topic_ids, name), name, description, _text_array(keywords), True)
+
+
+def iter_document_topic_rows(doc_ids, topic_ids) -> Iterator[Tuple]:
+    for document, topic, relevance in DOCUMENT_TOPICS:
+        yield (uuid.uuid4(), doc_ids[document], topic_ids[topic], relevance, TOOL)
+
+
+def iter_graph_entity_rows(entity_ids, doc_ids) -> Iterator[Tuple]:
+    titles = {filename: title for filename, title, *_ in DOCUMENTS}
+    for entity_id, document, properties in GRAPH_ENTITIES:
+        yield (
+            _new_id(entity_ids, entity_id), entity_id, "document",
+            titles[document], properties, doc_ids[document], TOOL, True,
+        )
+
+
+def iter_graph_relationship_rows(entity_ids) -> Iterator[Tuple]:
+    for source, target, relationship_type, is_directed, weight, properties in GRAPH_RELATIONSHIPS:
+        yield (
+            uuid.uuid4(), entity_ids[source], entity_ids[target],
+            relationship_type, is_directed, weight, properties, TOOL, True,
+        )
+
+
+def add_sample_data(session) -> None:
+    """
+    Insert the sample organizations, users, documents, summaries, topics
+    and graph data using one COPY per table.
+
+    Args:
+        session: Active SQLAlchemy session; committed by the caller
+    """
+    connection = session.connection()
+
+    org_ids: Dict[str, uuid.UUID] = {}
+    user_ids: Dict[str, uuid.UUID] = {}
+    doc_ids: Dict[str, uuid.UUID] = {}
+    topic_ids: Dict[str, uuid.UUID] = {}
+    entity_ids: Dict[str, uuid.UUID] = {}
+
+    copy_rows(connection, "organizations", ("id", "name"),
+              iter_organization_rows(org_ids))
+
+    copy_rows(connection, "users", ("id", "username", "email", "org_id"),
+              iter_user_rows(user_ids, org_ids))
+
+    user_orgs = {username: org_ids[org] for username, _, org in USERS}
+    copy_rows(
+        connection,
+        "documents",
+        ("id", "title", "filename", "content", "owner_id", "org_id", "file_path",
+         "size", "content_type", "document_type", "status", "is_deleted", "version"),
+        iter_document_rows(doc_ids, user_ids, user_orgs),
+    )
+
+    copy_rows(
+        connection,
+        "summaries",
+        ("id", "document_id", "content", "summary_type", "tool_agent", "status"),
+        iter_summary_rows(doc_ids),
+    )
+
+    copy_rows(connection, "topics", ("id", "name", "description", "keywords", "is_active"),
+              iter_topic_rows(topic_ids))
+
+    copy_rows(
+        connection,
+        "document_topics",
+        ("id", "document_id", "topic_id", "relevance_score", "extracted_by_tool"),
+        iter_document_topic_rows(doc_ids, topic_ids),
+    )
+
+    copy_rows(
+        connection,
+        "graph_entities",
+        ("id", "entity_id", "entity_type", "name", "properties", "source_file_id",
+         "created_by_tool", "is_active"),
+        iter_graph_entity_rows(entity_ids, doc_ids),
+        json_columns=("properties",),
+    )
+
+    copy_rows(
+        connection,
+        "graph_relationships",
+        ("id", "source_entity_id", "target_entity_id", "relationship_type",
+         "is_directed", "weight", "properties", "created_by_tool", "is_active"),
+        iter_graph_relationship_rows(entity_ids),
+        json_columns=("properties",),
+    )
+
+
+def main() -> int:
+    DatabaseManager.initialize(PostgresConnectionConfig.from_env())
+    db = DatabaseManager.get_instance()
+
+    with db.session_scope() as session:
+        add_sample_data(session)
+
+    print("Sample data loaded successfully")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
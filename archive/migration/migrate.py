@@ -1,5 +1,10 @@
 import asyncio
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import signal
 import sys
 from typing import Optional
@@ -8,15 +13,31 @@ from pathlib import Path
 from .migrator import DatabaseMigrator
 from .health_monitor import HealthMonitor
 from ..config.environments import Environments
-from ..config.database import DatabaseManager
+from ..config.database import DatabaseManager, run_metrics_flusher
 
+# Log records are queued and written by a background listener thread, so
+# file/stdout writes never block the event loop running the migration.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.StreamHandler(sys.stdout), logging.FileHandler('migration.log')]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
+)
+_log_listener.start()
+# Stopped at exit rather than in shutdown() so the final status messages
+# logged after the orchestrator stops are still flushed
+atexit.register(_log_listener.stop)
+
+# Thread/process details aren't part of the log format
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('migration.log')
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -24,18 +45,20 @@ class MigrationOrchestrator:
     """Orchestrates the TypeScript to Python migration process."""
     
     def __init__(self):
-        self.migrator = DatabaseMigrator()
+        self.migrator = DatabaseMigrator(
+            batch_size=int(os.getenv("MIGRATION_BATCH_SIZE", "1000"))
+        )
         self.health_monitor = HealthMonitor()
         self.monitor_task: Optional[asyncio.Task] = None
+        self.metrics_task: Optional[asyncio.Task] = None
         self._shutdown = False
+        # Reports are written here; created once up front
+        self._log_dir = Path("migration_logs")
+        self._log_dir.mkdir(exist_ok=True)
     
     async def start(self):
         """Start the migration process."""
         try:
-            # Create migration directory
-            migration_dir = Path("migration_logs")
-            migration_dir.mkdir(exist_ok=True)
-            
             # Initialize database
             self._initialize_database()
             
@@ -44,6 +67,8 @@ class MigrationOrchestrator:
             self.monitor_task = asyncio.create_task(
                 self.health_monitor.start_monitoring(interval_seconds=30)
             )
+            # Deliver transaction metrics off the migration's critical path
+            self.metrics_task = asyncio.create_task(run_metrics_flusher())
             
             # Execute migration
             logger.info("Starting migration process...")
@@ -83,10 +108,7 @@ class MigrationOrchestrator:
             "health_metrics": self.health_monitor.metrics
         }
         
-        report_file = Path("migration_logs/success_report.json")
-        with report_file.open("w") as f:
-            import json
-            json.dump(report, f, default=str, indent=2)
+        self._write_report(self._log_dir / "success_report.json", report)
         
         logger.info("Success report generated")
     
@@ -100,13 +122,15 @@ class MigrationOrchestrator:
             "errors": self.migrator.stats.get("errors", [])
         }
         
-        report_file = Path("migration_logs/failure_report.json")
-        with report_file.open("w") as f:
-            import json
-            json.dump(report, f, default=str, indent=2)
+        self._write_report(self._log_dir / "failure_report.json", report)
         
         logger.info("Failure report generated")
     
+    @staticmethod
+    def _write_report(report_file: Path, report: dict):
+        """Serialize a report in memory and write it with a single call."""
+        report_file.write_text(json.dumps(report, default=str, indent=2))
+
     async def shutdown(self):
         """Shutdown migration process."""
         if self._shutdown:
@@ -115,32 +139,40 @@ class MigrationOrchestrator:
         self._shutdown = True
         logger.info("Shutting down migration process...")
         
-        # Cancel health monitoring
-        if self.monitor_task:
-            self.monitor_task.cancel()
-            try:
-                await self.monitor_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel health monitoring and flush pending metrics
+        for task in (self.monitor_task, self.metrics_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         logger.info("Migration process shutdown complete")
 
-def handle_signal(signum, frame):
+async def main() -> MigrationOrchestrator:
+    """Run the migration, shutting down cleanly on SIGINT/SIGTERM."""
+    orchestrator = MigrationOrchestrator()
+
+    # Signals are delivered through the running loop, so shutdown() is
+    # scheduled on it instead of from an arbitrary signal-handler frame
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(
+            sig, lambda sig=sig: asyncio.create_task(_handle_signal(orchestrator, sig))
+        )
+
+    await orchestrator.start()
+    return orchestrator
+
+async def _handle_signal(orchestrator: MigrationOrchestrator, sig: signal.Signals):
     """Handle shutdown signals."""
-    logger.info(f"Received signal {signum}")
-    if orchestrator:
-        asyncio.create_task(orchestrator.shutdown())
+    logger.info(f"Received signal {sig.name}")
+    await orchestrator.shutdown()
 
 if __name__ == "__main__":
-    # Register signal handlers
-    orchestrator = None
-    signal.signal(signal.SIGINT, handle_signal)
-    signal.signal(signal.SIGTERM, handle_signal)
-    
     try:
-        # Create and start orchestrator
-        orchestrator = MigrationOrchestrator()
-        asyncio.run(orchestrator.start())
+        orchestrator = asyncio.run(main())
         
         # Exit with success if migration completed
         if orchestrator.migrator.stats.get("errors"):
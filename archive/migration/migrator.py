@@ -1,5 +1,7 @@
+import json
 import logging
 import time
+from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from sqlalchemy import inspect
@@ -15,7 +17,8 @@ logger = logging.getLogger(__name__)
 class DatabaseMigrator:
     """Manages the migration from TypeScript to Python data access layer."""
     
-    def __init__(self):
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = batch_size
         self.py_factory = PythonFactory.get_instance()
         self.ts_factory = TypeScriptFactory.getInstance()
         self.stats: Dict[str, Any] = {
@@ -89,8 +92,8 @@ class DatabaseMigrator:
             # Get document counts for verification
             ts_docs = await self._count_documents(self.ts_factory)
             
-            # Migrate in batches
-            batch_size = 100
+            # Migrate in batches of self.batch_size (MIGRATION_BATCH_SIZE)
+            batch_size = self.batch_size
             offset = 0
             
             while True:
@@ -165,12 +168,9 @@ class DatabaseMigrator:
             })
             
             # Save stats to file
-            import json
-            from pathlib import Path
-            
-            stats_file = Path("migration_stats.json")
-            with stats_file.open("w") as f:
-                json.dump(self.stats, f, default=str, indent=2)
+            Path("migration_stats.json").write_text(
+                json.dumps(self.stats, default=str, indent=2)
+            )
                 
         except Exception as e:
             logger.error(f"Failed to save migration stats: {str(e)}")
@@ -11,65 +11,113 @@ Prerequisites:
 """
 
 import os
+import uuid
+import atexit
+import functools
 import pytest
+from contextlib import contextmanager
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 from axai_pg.utils.db_initializer import DatabaseInitializer, DatabaseInitializerConfig
 from axai_pg.data.config.database import PostgresConnectionConfig
 from axai_pg.data.models import Organization, User, Document
 
+# Built once and reused so the statement's cache key is computed only once
+_HEALTH_STMT = text("SELECT 1")
+
 
 # =============================================================================
-# Example 1: Programmatic Usage with Context Manager
+# Shared Database and Rollback Isolation
 # =============================================================================
 
-def test_programmatic_with_context_manager():
+@functools.lru_cache(maxsize=None)
+def get_shared_engine() -> Engine:
     """
-    Example: Using DatabaseInitializer programmatically with context manager.
+    Create the shared example database once per process.
 
-    This approach is useful for:
-    - Custom test setups
-    - One-off integration tests
-    - Non-pytest testing frameworks
+    Creating a database and its schema is the slow part of these examples,
+    so examples that only need isolation (not a fresh database) share this
+    one and roll back their changes via rollback_session(). The database is
+    dropped when the process exits.
+
+    Returns:
+        Engine connected to the shared database
     """
-    # Configure connection
     conn_config = PostgresConnectionConfig(
         host=os.getenv('POSTGRES_HOST', 'localhost'),
         port=int(os.getenv('POSTGRES_PORT', '5432')),
-        database='test_integration_db',  # Use unique DB name
+        database='test_integration_db',
         username=os.getenv('POSTGRES_USER', 'test_user'),
         password=os.getenv('POSTGRES_PASSWORD', 'test_password'),
     )
 
-    # Configure initializer
-    db_config = DatabaseInitializerConfig(
+    db_init = DatabaseInitializer(DatabaseInitializerConfig(
         connection_config=conn_config,
         auto_create_db=True,
-        auto_drop_on_exit=True,  # Cleanup automatically
-        wait_timeout=30,
-        retry_attempts=5
-    )
+        auto_drop_on_exit=True,
+    ))
+    assert db_init.setup_database(load_sample_data=False)
 
-    # Use context manager for automatic cleanup
-    with DatabaseInitializer(db_config) as db_init:
-        # Setup database with schema
-        assert db_init.setup_database(load_sample_data=False)
+    engine = create_engine(conn_config.get_url())
 
-        # Perform your integration tests
-        with db_init.session_scope() as session:
-            # Create test data
-            org = Organization(name="Test Org")
-            session.add(org)
-            session.flush()
+    @atexit.register
+    def _cleanup():
+        engine.dispose()
+        db_init.teardown_database()
 
-            user = User(username="testuser", email="test@example.com", org_id=org.id)
-            session.add(user)
-            session.commit()
+    return engine
+
+
+@contextmanager
+def rollback_session(engine: Engine):
+    """
+    Yield a session whose changes are rolled back on exit.
+
+    The session joins an outer transaction through a SAVEPOINT, so code under
+    test can call commit() or rollback() freely; nothing is ever persisted.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
 
-            # Query and verify
-            saved_user = session.query(User).filter_by(username="testuser").first()
-            assert saved_user is not None
-            assert saved_user.email == "test@example.com"
 
-    # Database is automatically dropped after context manager exits
+# =============================================================================
+# Example 1: Programmatic Usage with Context Manager
+# =============================================================================
+
+def test_programmatic_with_context_manager():
+    """
+    Example: Using a rollback-isolated session programmatically.
+
+    This approach is useful for:
+    - Custom test setups
+    - One-off integration tests
+    - Non-pytest testing frameworks
+
+    The schema is created once (get_shared_engine) and each test's changes
+    are rolled back, instead of creating and dropping a database per test.
+    """
+    with rollback_session(get_shared_engine()) as session:
+        # Create test data. Assigning the primary key client-side makes
+        # org.id available immediately, so both rows go out in one flush
+        org = Organization(id=uuid.uuid4(), name="Test Org")
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        session.add_all([org, user])
+        session.commit()
+
+        # Query and verify
+        saved_user = session.query(User).filter_by(username="testuser").first()
+        assert saved_user is not None
+        assert saved_user.email == "test@example.com"
+
+    # Everything above is rolled back when the context manager exits
     print("✓ Programmatic test with context manager completed")
 
 
@@ -79,44 +127,31 @@ def test_programmatic_with_context_manager():
 
 def test_manual_lifecycle():
     """
-    Example: Manually managing database lifecycle.
+    Example: Manually managing the test transaction lifecycle.
 
-    This approach gives you full control over when setup and teardown occur.
-    Useful for complex test scenarios.
+    This is what rollback_session() does, spelled out for frameworks where a
+    context manager doesn't fit (e.g. separate setUp/tearDown hooks).
     """
-    conn_config = PostgresConnectionConfig(
-        host=os.getenv('POSTGRES_HOST', 'localhost'),
-        port=int(os.getenv('POSTGRES_PORT', '5432')),
-        database='test_manual_db',
-        username=os.getenv('POSTGRES_USER', 'test_user'),
-        password=os.getenv('POSTGRES_PASSWORD', 'test_password'),
-    )
-
-    db_config = DatabaseInitializerConfig(
-        connection_config=conn_config,
-        auto_create_db=True,
-        auto_drop_on_exit=False,  # Manual control
-    )
-
-    db_init = DatabaseInitializer(db_config)
+    # Setup: open an outer transaction and join the session to it via SAVEPOINT
+    connection = get_shared_engine().connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     try:
-        # Setup
-        assert db_init.setup_database(load_sample_data=False)
-
         # Run tests
-        with db_init.session_scope() as session:
-            org = Organization(name="Manual Test Org")
-            session.add(org)
-            session.commit()
+        org = Organization(name="Manual Test Org")
+        session.add(org)
+        session.commit()
 
-            assert session.query(Organization).count() == 1
+        assert session.query(Organization).count() == 1
 
         print("✓ Manual lifecycle test completed")
 
     finally:
-        # Always cleanup
-        db_init.teardown_database()
+        # Teardown: always roll back, leaving the shared database untouched
+        session.close()
+        transaction.rollback()
+        connection.close()
 
 
 # =============================================================================
@@ -124,7 +159,7 @@ def test_manual_lifecycle():
 # =============================================================================
 
 # Import fixtures from axai_pg
-from axai_pg.testing.fixtures import axai_db_session, axai_test_db
+from axai_pg.testing.fixtures import axai_db_session, axai_test_db, axai_bulk_loader
 
 
 @pytest.mark.axai_integration
@@ -138,17 +173,15 @@ def test_with_pytest_fixture(axai_db_session):
     - Session isolation (rollback after each test)
     - Minimal boilerplate
     """
-    # Create test data
-    org = Organization(name="Pytest Fixture Org")
-    axai_db_session.add(org)
-    axai_db_session.flush()
-
-    user = User(
-        username="fixtureuser",
-        email="fixture@example.com",
-        org_id=org.id
-    )
-    axai_db_session.add(user)
+    # Create test data with Core inserts; no ORM objects or flushes are
+    # needed when the test only reads the rows back
+    org_id = axai_db_session.execute(
+        insert(Organization).values(name="Pytest Fixture Org").returning(Organization.id)
+    ).scalar_one()
+
+    axai_db_session.execute(insert(User), [
+        {"username": "fixtureuser", "email": "fixture@example.com", "org_id": org_id},
+    ])
     axai_db_session.commit()
 
     # Query and verify
@@ -161,46 +194,54 @@ def test_with_pytest_fixture(axai_db_session):
 
 
 @pytest.mark.axai_integration
-def test_with_multiple_operations(axai_db_session):
+def test_with_multiple_operations(axai_db_session, axai_bulk_loader):
     """
     Example: More complex test with multiple related entities.
+
+    Rows are written without ORM objects: Core insert() with lists of dicts
+    for a few parent rows, and axai_bulk_loader (COPY) for the bulk of the
+    test data. Results are read back with select().
     """
     # Create organization
-    org = Organization(name="Complex Test Org")
-    axai_db_session.add(org)
-    axai_db_session.flush()
+    org_id = axai_db_session.execute(
+        insert(Organization).values(name="Complex Test Org").returning(Organization.id)
+    ).scalar_one()
 
     # Create users
-    user1 = User(username="user1", email="user1@example.com", org_id=org.id)
-    user2 = User(username="user2", email="user2@example.com", org_id=org.id)
-    axai_db_session.add_all([user1, user2])
-    axai_db_session.flush()
-
-    # Create documents
-    doc1 = Document(
-        title="Doc 1",
-        content="Content 1",
-        owner_id=user1.id,
-        org_id=org.id,
-        document_type="text",
-        status="draft"
-    )
-    doc2 = Document(
-        title="Doc 2",
-        content="Content 2",
-        owner_id=user2.id,
-        org_id=org.id,
-        document_type="text",
-        status="published"
+    user1_id, user2_id = uuid.uuid4(), uuid.uuid4()
+    axai_db_session.execute(insert(User), [
+        {"id": user1_id, "username": "user1", "email": "user1@example.com", "org_id": org_id},
+        {"id": user2_id, "username": "user2", "email": "user2@example.com", "org_id": org_id},
+    ])
+
+    # Create documents; ids and other Python-side defaults are filled in
+    docs = [
+        ("Doc 1", "Content 1", user1_id, org_id, "text", "draft"),
+        ("Doc 2", "Content 2", user2_id, org_id, "text", "published"),
+    ]
+    axai_bulk_loader.copy(
+        Document,
+        [
+            (title, content, owner_id, doc_org_id, doc_type, status,
+             f"{title.lower().replace(' ', '_')}.txt", f"/documents/{title}.txt",
+             len(content), "text/plain")
+            for title, content, owner_id, doc_org_id, doc_type, status in docs
+        ],
+        columns=("title", "content", "owner_id", "org_id", "document_type", "status",
+                 "filename", "file_path", "size", "content_type"),
     )
-    axai_db_session.add_all([doc1, doc2])
     axai_db_session.commit()
 
     # Verify relationships
-    assert axai_db_session.query(User).filter_by(org_id=org.id).count() == 2
-    assert axai_db_session.query(Document).filter_by(org_id=org.id).count() == 2
-    assert doc1.owner_id == user1.id
-    assert doc2.owner_id == user2.id
+    user_count = axai_db_session.execute(
+        select(func.count()).select_from(User).where(User.org_id == org_id)
+    ).scalar_one()
+    assert user_count == 2
+
+    owners = dict(axai_db_session.execute(
+        select(Document.title, Document.owner_id).where(Document.org_id == org_id)
+    ).all())
+    assert owners == {"Doc 1": user1_id, "Doc 2": user2_id}
 
     print("✓ Complex operations test completed")
 
@@ -213,7 +254,8 @@ def test_with_custom_schema_file():
     """
     Example: Using custom schema file for specialized testing.
 
-    Useful when you need a modified schema for specific tests.
+    Useful when you need a modified schema for specific tests. This needs
+    its own database, so unlike the examples above it creates and drops one.
     """
     conn_config = PostgresConnectionConfig(
         host=os.getenv('POSTGRES_HOST', 'localhost'),
@@ -245,7 +287,7 @@ def test_with_custom_schema_file():
 
         with db_init.session_scope() as session:
             # Verify schema was applied
-            result = session.execute("SELECT 1")
+            result = session.execute(_HEALTH_STMT)
             assert result.scalar() == 1
 
         print("✓ Custom schema test completed")
@@ -259,7 +301,8 @@ def test_database_reset():
     """
     Example: Resetting database to clean state during test.
 
-    Useful for tests that need a completely fresh database.
+    Useful for tests that need a completely fresh database. Resetting is
+    slow (the schema is rebuilt); prefer rollback_session() for isolation.
     """
     conn_config = PostgresConnectionConfig(
         host=os.getenv('POSTGRES_HOST', 'localhost'),
@@ -13,15 +13,19 @@ This file demonstrates how to use DatabaseInitializer for production scenarios:
 
 import os
 import sys
+import atexit
 import logging
+import dataclasses
+import functools
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-from axai_pg.utils.db_initializer import DatabaseInitializer, DatabaseInitializerConfig
-from axai_pg.data.config.database import (
-    PostgresConnectionConfig,
-    PostgresPoolConfig,
-    DatabaseManager
-)
+# axai_pg (and with it SQLAlchemy and the driver) is imported inside the
+# functions that need it, so `--help`-style invocations and unknown
+# commands return without paying that import cost.
+if TYPE_CHECKING:
+    from axai_pg.utils.db_initializer import DatabaseInitializer
+    from axai_pg.data.config.database import PostgresConnectionConfig
 
 # Configure logging
 logging.basicConfig(
@@ -31,45 +35,138 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _health_stmt():
+    """Build the SELECT 1 probe once and reuse it, so its cache key is computed only once."""
+    from sqlalchemy import text
+    return text("SELECT 1")
+
+
 # =============================================================================
-# Example 1: Initial Production Deployment
+# Shared Initializers
 # =============================================================================
 
-def initial_production_setup():
+# Environment-specific configurations
+_ENVIRONMENTS = {
+    'development': {
+        'pool_size': 5,
+        'max_overflow': 5,
+        'load_sample_data': True,
+        'auto_drop_on_exit': False,
+    },
+    'staging': {
+        'pool_size': 8,
+        'max_overflow': 10,
+        'load_sample_data': True,
+        'auto_drop_on_exit': False,
+    },
+    'production': {
+        'pool_size': 20,
+        'max_overflow': 40,
+        'load_sample_data': False,  # Never in production!
+        'auto_drop_on_exit': False,  # NEVER auto-drop in production!
+    }
+}
+
+_initializers: List["DatabaseInitializer"] = []
+
+
+@functools.lru_cache(maxsize=None)
+def _get_env_config() -> "PostgresConnectionConfig":
     """
-    Example: First-time production database setup.
+    Read the POSTGRES_* connection settings once per process.
 
-    This would typically be run during initial deployment to:
-    1. Create the database
-    2. Apply the schema
-    3. Verify the setup
+    Misconfiguration then surfaces on first use rather than being re-parsed
+    by every command. Treat the result as read-only; use
+    dataclasses.replace() to derive variants.
+    """
+    from axai_pg.data.config.database import PostgresConnectionConfig
+    return PostgresConnectionConfig.from_env()
 
-    DO NOT load sample data in production!
+
+@functools.lru_cache(maxsize=None)
+def get_initializer(
+    environment: str = 'production',
+    database: Optional[str] = None,
+    health_check: bool = False,
+) -> "DatabaseInitializer":
     """
-    logger.info("Starting initial production setup...")
+    Get the shared DatabaseInitializer for an environment.
+
+    Cached so that running several operations in one process (e.g. init,
+    then health) reuses one initializer and connection pool instead of
+    building a new one in every function.
+
+    Args:
+        environment: One of 'development', 'staging', 'production'
+        database: Target a database other than POSTGRES_DB
+        health_check: Only probe an existing database: never create it, and
+            give up after a short wait (10s, 3 attempts) so a probe fails fast
+
+    Returns:
+        DatabaseInitializer instance
+    """
+    from axai_pg.utils.db_initializer import DatabaseInitializer, DatabaseInitializerConfig
+    from axai_pg.data.config.database import PostgresPoolConfig
+
+    settings = _ENVIRONMENTS[environment]
 
     # Load configuration from environment (production best practice)
-    conn_config = PostgresConnectionConfig.from_env()
+    conn_config = _get_env_config()
+    if database:
+        conn_config = dataclasses.replace(conn_config, database=database)
 
-    # Configure with production pool settings
     pool_config = PostgresPoolConfig(
-        pool_size=10,          # Larger pool for production
-        max_overflow=20,       # Allow more overflow connections
+        pool_size=settings['pool_size'],
+        max_overflow=settings['max_overflow'],
         pool_timeout=30,       # Connection timeout
         pool_recycle=3600,     # Recycle connections after 1 hour
-        pool_pre_ping=True     # Verify connections before use
+        pool_pre_ping=True,    # Verify connections before use
+        pool_use_lifo=True,    # Let surplus idle connections age out
+        # A database other than the configured one is a one-off target
+        # (blue-green prep): don't keep a pool of idle connections to it
+        use_null_pool=database is not None,
     )
 
     db_config = DatabaseInitializerConfig(
         connection_config=conn_config,
         pool_config=pool_config,
-        auto_create_db=True,
-        auto_drop_on_exit=False,  # NEVER auto-drop in production!
-        wait_timeout=60,
-        retry_attempts=10
+        auto_create_db=not health_check,
+        auto_drop_on_exit=settings['auto_drop_on_exit'],
+        wait_timeout=10 if health_check else 60,
+        retry_attempts=3 if health_check else 10
     )
 
     db_init = DatabaseInitializer(db_config)
+    _initializers.append(db_init)
+    return db_init
+
+
+@atexit.register
+def _teardown_initializers():
+    """Close pooled connections (and drop auto-drop databases) on exit."""
+    for db_init in _initializers:
+        db_init.teardown_database()
+
+
+# =============================================================================
+# Example 1: Initial Production Deployment
+# =============================================================================
+
+def initial_production_setup():
+    """
+    Example: First-time production database setup.
+
+    This would typically be run during initial deployment to:
+    1. Create the database
+    2. Apply the schema
+    3. Verify the setup
+
+    DO NOT load sample data in production!
+    """
+    logger.info("Starting initial production setup...")
+
+    db_init = get_initializer('production')
 
     try:
         # Setup database with schema only (no sample data)
@@ -115,16 +212,7 @@ def apply_schema_update(schema_file_path: str):
     """
     logger.info(f"Applying schema update from {schema_file_path}...")
 
-    conn_config = PostgresConnectionConfig.from_env()
-
-    db_config = DatabaseInitializerConfig(
-        connection_config=conn_config,
-        schema_file=schema_file_path,
-        auto_create_db=False,  # Database should already exist
-        auto_drop_on_exit=False,
-    )
-
-    db_init = DatabaseInitializer(db_config)
+    db_init = get_initializer('production')
 
     try:
         # Apply only the schema (database already exists)
@@ -155,54 +243,12 @@ def environment_specific_setup(environment: str):
     """
     logger.info(f"Setting up database for {environment} environment...")
 
-    conn_config = PostgresConnectionConfig.from_env()
-
-    # Environment-specific configurations
-    env_configs = {
-        'development': {
-            'pool_size': 5,
-            'max_overflow': 5,
-            'load_sample_data': True,
-            'auto_drop_on_exit': False,
-        },
-        'staging': {
-            'pool_size': 8,
-            'max_overflow': 10,
-            'load_sample_data': True,
-            'auto_drop_on_exit': False,
-        },
-        'production': {
-            'pool_size': 20,
-            'max_overflow': 40,
-            'load_sample_data': False,  # Never in production!
-            'auto_drop_on_exit': False,
-        }
-    }
-
-    if environment not in env_configs:
+    if environment not in _ENVIRONMENTS:
         logger.error(f"Unknown environment: {environment}")
         return False
 
-    config = env_configs[environment]
-
-    pool_config = PostgresPoolConfig(
-        pool_size=config['pool_size'],
-        max_overflow=config['max_overflow'],
-        pool_timeout=30,
-        pool_recycle=3600,
-        pool_pre_ping=True
-    )
-
-    db_config = DatabaseInitializerConfig(
-        connection_config=conn_config,
-        pool_config=pool_config,
-        auto_create_db=True,
-        auto_drop_on_exit=config['auto_drop_on_exit'],
-        wait_timeout=60,
-        retry_attempts=10
-    )
-
-    db_init = DatabaseInitializer(db_config)
+    config = _ENVIRONMENTS[environment]
+    db_init = get_initializer(environment)
 
     try:
         success = db_init.setup_database(
@@ -236,16 +282,7 @@ def perform_health_check():
     """
     logger.info("Performing database health check...")
 
-    conn_config = PostgresConnectionConfig.from_env()
-
-    db_config = DatabaseInitializerConfig(
-        connection_config=conn_config,
-        auto_create_db=False,  # Don't create, just check
-        wait_timeout=10,
-        retry_attempts=3
-    )
-
-    db_init = DatabaseInitializer(db_config)
+    db_init = get_initializer('production', health_check=True)
 
     try:
         # Check if we can connect
@@ -258,23 +295,29 @@ def perform_health_check():
             logger.error("❌ Database does not exist")
             return False
 
-        # Initialize DatabaseManager to check table access
-        DatabaseManager.initialize(conn_config)
-        db_manager = DatabaseManager.get_instance()
+        from axai_pg.data.config.database import DatabaseManager
 
-        # Verify we can query tables
-        with db_manager.session_scope() as session:
-            from sqlalchemy import text
-
-            # Check organizations table
-            result = session.execute(text("SELECT COUNT(*) FROM organizations"))
-            org_count = result.scalar()
-
-            # Check users table
-            result = session.execute(text("SELECT COUNT(*) FROM users"))
-            user_count = result.scalar()
+        # Initialize DatabaseManager to check table access (reuses the
+        # pooled engine if this process already initialized one)
+        DatabaseManager.initialize(db_init.get_connection_config())
+        db_manager = DatabaseManager.get_instance()
 
-            logger.info(f"Database health check: {org_count} organizations, {user_count} users")
+        # Verify we can query tables. Both counts come back in one round-trip
+        # on a raw driver connection, skipping SQLAlchemy's statement
+        # compilation and result wrapping (this runs on every probe)
+        conn = db_manager.engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT (SELECT COUNT(*) FROM organizations), "
+                "(SELECT COUNT(*) FROM users)"
+            )
+            org_count, user_count = cursor.fetchone()
+            cursor.close()
+        finally:
+            conn.close()  # Returns the connection to the pool
+
+        logger.info(f"Database health check: {org_count} organizations, {user_count} users")
 
         logger.info("✅ Database health check passed")
         return True
@@ -304,28 +347,8 @@ def prepare_blue_green_database(target_database: str):
     """
     logger.info(f"Preparing blue-green database: {target_database}...")
 
-    # Get base configuration from environment
-    base_config = PostgresConnectionConfig.from_env()
-
-    # Create config for new database
-    conn_config = PostgresConnectionConfig(
-        host=base_config.host,
-        port=base_config.port,
-        database=target_database,  # New database name
-        username=base_config.username,
-        password=base_config.password,
-        schema=base_config.schema
-    )
-
-    db_config = DatabaseInitializerConfig(
-        connection_config=conn_config,
-        auto_create_db=True,
-        auto_drop_on_exit=False,
-        wait_timeout=60,
-        retry_attempts=10
-    )
-
-    db_init = DatabaseInitializer(db_config)
+    # Same environment settings, different database name
+    db_init = get_initializer('production', database=target_database)
 
     try:
         # Setup new database
@@ -337,8 +360,7 @@ def prepare_blue_green_database(target_database: str):
 
         # Verify setup
         with db_init.session_scope() as session:
-            from sqlalchemy import text
-            result = session.execute(text("SELECT 1"))
+            result = session.execute(_health_stmt())
             assert result.scalar() == 1
 
         logger.info(f"✅ Blue-green database {target_database} ready")
@@ -0,0 +1,43 @@
+-- Deploy JSONB columns and GIN indexes for containment filters
+-- requires: 20240115_0002_migrate_existing_schema
+
+BEGIN;
+
+-- JSON stores raw text and cannot be GIN-indexed; convert the filtered columns
+ALTER TABLE documents
+    ALTER COLUMN tags TYPE jsonb USING tags::jsonb,
+    ALTER COLUMN key_terms TYPE jsonb USING key_terms::jsonb,
+    ALTER COLUMN linked_docs TYPE jsonb USING linked_docs::jsonb,
+    ALTER COLUMN graph_nodes TYPE jsonb USING graph_nodes::jsonb;
+
+ALTER TABLE collection_entities
+    ALTER COLUMN properties TYPE jsonb USING properties::jsonb;
+
+ALTER TABLE entity_operations
+    ALTER COLUMN details TYPE jsonb USING details::jsonb;
+
+ALTER TABLE visibility_profiles
+    ALTER COLUMN visible_entity_types TYPE jsonb USING visible_entity_types::jsonb,
+    ALTER COLUMN hidden_entities TYPE jsonb USING hidden_entities::jsonb,
+    ALTER COLUMN enabled_entities TYPE jsonb USING enabled_entities::jsonb;
+
+-- jsonb_path_ops: smaller, faster indexes that support only @>
+CREATE INDEX IF NOT EXISTS idx_documents_metadata_gin
+    ON documents USING gin (metadata jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_documents_tags_gin
+    ON documents USING gin (tags);
+CREATE INDEX IF NOT EXISTS idx_collection_entities_properties_gin
+    ON collection_entities USING gin (properties jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_entity_operations_details_gin
+    ON entity_operations USING gin (details jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_visibility_profiles_visible_entity_types_gin
+    ON visibility_profiles USING gin (visible_entity_types jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_visibility_profiles_hidden_entities_gin
+    ON visibility_profiles USING gin (hidden_entities jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_visibility_profiles_enabled_entities_gin
+    ON visibility_profiles USING gin (enabled_entities jsonb_path_ops);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0001_jsonb_gin_indexes', 'Convert filtered JSON columns to JSONB and add GIN indexes');
+
+COMMIT;
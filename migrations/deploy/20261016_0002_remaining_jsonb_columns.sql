@@ -0,0 +1,33 @@
+-- Deploy JSONB for the remaining JSON columns in the document/collection tables
+-- requires: 20261016_0001_jsonb_gin_indexes
+
+BEGIN;
+
+-- JSONB is stored pre-parsed, so reads skip re-parsing the JSON text
+ALTER TABLE documents
+    ALTER COLUMN graph_relationships TYPE jsonb USING graph_relationships::jsonb;
+
+ALTER TABLE document_versions
+    ALTER COLUMN doc_metadata TYPE jsonb USING doc_metadata::jsonb;
+
+ALTER TABLE collection_entities
+    ALTER COLUMN source_entity_ids TYPE jsonb USING source_entity_ids::jsonb;
+
+ALTER TABLE collection_relationships
+    ALTER COLUMN properties TYPE jsonb USING properties::jsonb,
+    ALTER COLUMN source_relationship_ids TYPE jsonb USING source_relationship_ids::jsonb;
+
+ALTER TABLE document_collection_contexts
+    ALTER COLUMN context_metadata TYPE jsonb USING context_metadata::jsonb;
+
+ALTER TABLE visibility_profiles
+    ALTER COLUMN visible_relationship_types TYPE jsonb USING visible_relationship_types::jsonb,
+    ALTER COLUMN hidden_relationships TYPE jsonb USING hidden_relationships::jsonb,
+    ALTER COLUMN all_entities TYPE jsonb USING all_entities::jsonb,
+    ALTER COLUMN all_relationships TYPE jsonb USING all_relationships::jsonb,
+    ALTER COLUMN enabled_relationships TYPE jsonb USING enabled_relationships::jsonb;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0002_remaining_jsonb_columns', 'Convert remaining document/collection JSON columns to JSONB');
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Deploy covering indexes for document listings and collection edges
+-- requires: 20261016_0002_remaining_jsonb_columns
+
+BEGIN;
+
+-- Org/status listings ordered by updated_at become index-only scans
+DROP INDEX IF EXISTS idx_documents_org_status;
+CREATE INDEX idx_documents_org_status
+    ON documents (org_id, status, updated_at)
+    INCLUDE (id, title, document_type, processing_status);
+
+-- A collection's edges are read without touching the heap
+DROP INDEX IF EXISTS idx_collection_relationships_collection_id;
+CREATE INDEX idx_collection_relationships_collection_id
+    ON collection_relationships (collection_id)
+    INCLUDE (source_entity_id, target_entity_id, relationship_type);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0003_covering_indexes', 'Covering indexes for document listings and collection edges');
+
+COMMIT;
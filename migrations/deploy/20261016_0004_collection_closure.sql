@@ -0,0 +1,37 @@
+-- Deploy closure table for the collection hierarchy
+-- requires: 20261016_0003_covering_indexes
+
+BEGIN;
+
+-- One row per (ancestor, descendant) pair, so subtree reads are a single
+-- indexed join instead of a recursive walk over collections.parent_id
+CREATE TABLE collection_closure (
+    ancestor_id UUID NOT NULL REFERENCES collections(id) ON DELETE CASCADE,
+    descendant_id UUID NOT NULL REFERENCES collections(id) ON DELETE CASCADE,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id),
+    CONSTRAINT collection_closure_depth_non_negative CHECK (depth >= 0)
+);
+
+CREATE INDEX idx_closure_descendant ON collection_closure (descendant_id);
+
+-- Backfill from the existing adjacency list; new rows are maintained by the
+-- application on insert and parent change
+WITH RECURSIVE paths (ancestor_id, descendant_id, depth) AS (
+    SELECT id, id, 0
+    FROM collections
+
+    UNION ALL
+
+    SELECT p.ancestor_id, c.id, p.depth + 1
+    FROM paths p
+    JOIN collections c ON c.parent_id = p.descendant_id
+)
+INSERT INTO collection_closure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth
+FROM paths;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0004_collection_closure', 'Closure table for the collection hierarchy');
+
+COMMIT;
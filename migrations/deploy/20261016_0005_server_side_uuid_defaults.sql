@@ -0,0 +1,27 @@
+-- Deploy server-side UUID defaults for random primary keys
+-- requires: 20261016_0004_collection_closure
+
+BEGIN;
+
+-- uuid_generate_v4() comes from uuid-ossp, which the schema already installs
+-- (gen_random_uuid() would need PostgreSQL 13); bulk inserts that omit id
+-- no longer need a Python-generated key per row
+ALTER TABLE organizations ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE users ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE summaries ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE topics ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE document_topics ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE graph_entities ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE graph_relationships ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE feedback ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE roles ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE user_roles ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE role_permissions ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE audit_logs ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE rate_limits ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE security_policies ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0005_server_side_uuid_defaults', 'Server-side UUID defaults for random primary keys');
+
+COMMIT;
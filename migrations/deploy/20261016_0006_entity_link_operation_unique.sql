@@ -0,0 +1,31 @@
+-- Deploy unique keys for entity links and entity operations
+-- requires: 20261016_0005_server_side_uuid_defaults
+
+BEGIN;
+
+-- Drop exact duplicates left by earlier row-by-row inserts, keeping the oldest row
+DELETE FROM entity_links a
+USING entity_links b
+WHERE a.graph_entity_id = b.graph_entity_id
+  AND a.collection_entity_id = b.collection_entity_id
+  AND a.ctid > b.ctid;
+
+DELETE FROM entity_operations a
+USING entity_operations b
+WHERE a.collection_id = b.collection_id
+  AND a.entity_id = b.entity_id
+  AND a.operation_type = b.operation_type
+  AND a.performed_at = b.performed_at
+  AND a.ctid > b.ctid;
+
+-- Conflict targets for the batched INSERT ... ON CONFLICT DO NOTHING paths
+ALTER TABLE entity_links
+    ADD CONSTRAINT uq_entity_link UNIQUE (graph_entity_id, collection_entity_id);
+
+ALTER TABLE entity_operations
+    ADD CONSTRAINT uq_entity_operation UNIQUE (collection_id, entity_id, operation_type, performed_at);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0006_entity_link_operation_unique', 'Unique keys for entity links and entity operations');
+
+COMMIT;
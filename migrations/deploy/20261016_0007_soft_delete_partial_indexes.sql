@@ -0,0 +1,24 @@
+-- Deploy partial indexes over live (not soft-deleted) documents and collections
+-- requires: 20261016_0006_entity_link_operation_unique
+
+BEGIN;
+
+-- Queries filter on is_deleted = false; index only those rows instead of
+-- the low-selectivity boolean column itself
+DROP INDEX IF EXISTS idx_documents_is_deleted;
+CREATE INDEX idx_documents_live_org
+    ON documents (org_id, status)
+    WHERE is_deleted = false;
+
+DROP INDEX IF EXISTS idx_collections_is_deleted;
+CREATE INDEX idx_collections_live_org
+    ON collections (org_id)
+    WHERE is_deleted = false;
+CREATE INDEX idx_collections_live_parent
+    ON collections (parent_id)
+    WHERE is_deleted = false;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0007_soft_delete_partial_indexes', 'Partial indexes over live documents and collections');
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Deploy BRIN indexes on append-only timestamp columns
+-- requires: 20261016_0007_soft_delete_partial_indexes
+
+BEGIN;
+
+-- entity_operations and document_versions are append-only, so their
+-- timestamps track physical row order; one BRIN summary per 32 pages
+-- replaces a btree entry per row
+DROP INDEX IF EXISTS idx_entity_operations_performed_at;
+CREATE INDEX idx_entity_operations_performed_at_brin
+    ON entity_operations USING brin (performed_at)
+    WITH (pages_per_range = 32);
+
+CREATE INDEX idx_document_versions_created_at_brin
+    ON document_versions USING brin (created_at)
+    WITH (pages_per_range = 32);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0008_brin_timestamp_indexes', 'BRIN indexes on append-only timestamp columns');
+
+COMMIT;
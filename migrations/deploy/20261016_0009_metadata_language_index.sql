@@ -0,0 +1,13 @@
+-- Deploy expression index on documents.metadata->>'language'
+-- requires: 20261016_0008_brin_timestamp_indexes
+
+BEGIN;
+
+-- Indexes only the extracted value, not the whole metadata document
+CREATE INDEX idx_documents_meta_lang
+    ON documents ((metadata ->> 'language'));
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0009_metadata_language_index', 'Expression index on document metadata language');
+
+COMMIT;
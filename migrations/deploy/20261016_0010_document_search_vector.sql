@@ -0,0 +1,19 @@
+-- Deploy generated full-text search column on documents
+-- requires: 20261016_0009_metadata_language_index
+
+BEGIN;
+
+-- Stored generated column: PostgreSQL keeps it in sync with title/content,
+-- no trigger needed. Adding it rewrites the table once.
+ALTER TABLE documents
+    ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))
+    ) STORED;
+
+CREATE INDEX idx_documents_search ON documents USING gin (search_vector);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0010_document_search_vector', 'Generated full-text search column on documents');
+
+COMMIT;
@@ -0,0 +1,77 @@
+-- Deploy pruning of redundant indexes
+-- requires: 20261016_0010_document_search_vector
+
+BEGIN;
+
+-- Org-scoped type/status filters over live documents replace the two
+-- single-column indexes
+CREATE INDEX IF NOT EXISTS idx_documents_org_type_status
+    ON documents (org_id, document_type, status)
+    WHERE is_deleted = false;
+DROP INDEX IF EXISTS idx_documents_type;
+DROP INDEX IF EXISTS idx_documents_status;
+
+CREATE INDEX IF NOT EXISTS idx_users_org ON users (org_id);
+
+-- Each pair is (redundant index, index that already covers it). The
+-- redundant one is only dropped when its replacement exists, so databases
+-- built from older scripts never lose their only index on a column.
+DO $$
+DECLARE
+    pair text[];
+BEGIN
+    FOREACH pair SLICE 1 IN ARRAY ARRAY[
+        ['idx_users_org_id', 'idx_users_org'],
+        ['idx_users_username', 'users_username_key'],
+        ['idx_users_email', 'users_email_key'],
+        ['idx_roles_name', 'roles_name_key'],
+        ['idx_topics_name', 'topics_name_key'],
+        ['idx_user_roles_user_id', 'uq_user_role'],
+        ['idx_user_roles_user', 'uq_user_role'],
+        ['idx_user_roles_role', 'idx_user_roles_role_id'],
+        ['idx_entity_links_graph_entity_id', 'uq_entity_link'],
+        ['idx_entity_links_graph_entity', 'uq_entity_link'],
+        ['idx_entity_links_collection_entity', 'idx_entity_links_collection_entity_id'],
+        ['idx_entity_operations_collection_id', 'uq_entity_operation'],
+        ['idx_entity_operations_collection', 'uq_entity_operation'],
+        ['idx_documents_owner', 'idx_documents_owner_id'],
+        ['idx_documents_filename', 'ix_documents_filename'],
+        ['idx_collections_owner', 'idx_collections_owner_id'],
+        ['idx_collections_org', 'idx_collections_org_id'],
+        ['idx_collection_entities_collection', 'idx_collection_entities_collection_id'],
+        ['idx_collection_relationships_collection', 'idx_collection_relationships_collection_id'],
+        ['idx_doc_collection_contexts_document', 'idx_document_collection_contexts_document_id'],
+        ['idx_doc_collection_contexts_collection', 'idx_document_collection_contexts_collection_id'],
+        ['idx_visibility_profiles_owner', 'idx_visibility_profiles_owner_id'],
+        ['idx_graph_entities_document', 'idx_graph_entities_document_id'],
+        ['idx_graph_entities_source_file', 'idx_graph_entities_source_file_id'],
+        ['idx_graph_entities_source_collection', 'idx_graph_entities_source_collection_id'],
+        ['ix_graph_entities_entity_id', 'idx_graph_entities_entity_id'],
+        ['ix_graph_entities_source_file_id', 'idx_graph_entities_source_file_id'],
+        ['ix_graph_entities_source_collection_id', 'idx_graph_entities_source_collection_id'],
+        ['idx_graph_rel_source', 'idx_graph_relationships_source_entity_id'],
+        ['idx_graph_rel_target', 'idx_graph_relationships_target_entity_id'],
+        ['idx_graph_rel_document', 'idx_graph_relationships_document_id'],
+        ['idx_graph_rel_source_file', 'idx_graph_relationships_source_file_id'],
+        ['idx_graph_rel_source_collection', 'idx_graph_relationships_source_collection_id'],
+        ['ix_graph_relationships_relationship_id', 'idx_graph_relationships_relationship_id'],
+        ['ix_graph_relationships_source_file_id', 'idx_graph_relationships_source_file_id'],
+        ['ix_graph_relationships_source_collection_id', 'idx_graph_relationships_source_collection_id'],
+        ['idx_tokens_user', 'idx_tokens_user_id'],
+        ['idx_tokens_expires', 'idx_tokens_expires_at'],
+        ['idx_audit_logs_user', 'idx_audit_logs_user_id'],
+        ['idx_audit_logs_time', 'idx_audit_logs_action_time'],
+        ['idx_feedback_user', 'idx_feedback_user_id']
+    ]
+    LOOP
+        IF to_regclass(pair[2]) IS NOT NULL THEN
+            EXECUTE format('DROP INDEX IF EXISTS %I', pair[1]);
+        END IF;
+    END LOOP;
+END
+$$;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0011_prune_redundant_indexes', 'Prune redundant indexes');
+
+COMMIT;
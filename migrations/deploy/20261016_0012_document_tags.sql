@@ -0,0 +1,29 @@
+-- Deploy document_tags side table
+-- requires: 20261016_0011_prune_redundant_indexes
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS document_tags (
+    document_id UUID NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (document_id, tag),
+    CONSTRAINT document_tags_tag_not_empty CHECK (length(trim(tag)) > 0)
+);
+
+CREATE INDEX IF NOT EXISTS idx_document_tags_tag ON document_tags (tag, document_id);
+
+COMMENT ON TABLE document_tags IS 'One row per tag on a document';
+
+-- Copy existing JSON tag arrays; documents.tags stays until its readers move
+INSERT INTO document_tags (document_id, tag)
+SELECT DISTINCT d.id, t.tag
+FROM documents d
+CROSS JOIN LATERAL jsonb_array_elements_text(d.tags) AS t(tag)
+WHERE jsonb_typeof(d.tags) = 'array'
+  AND length(trim(t.tag)) > 0
+ON CONFLICT DO NOTHING;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0012_document_tags', 'Normalize document tags into document_tags');
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Deploy deferred checking for cyclic and self-referential foreign keys
+-- requires: 20261016_0012_document_tags
+
+BEGIN;
+
+-- Checked at commit: collection hierarchies can be loaded in any row order,
+-- and a document and its default visibility profile can be inserted together
+ALTER TABLE collections
+    ALTER CONSTRAINT fk_collection_parent DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE visibility_profiles
+    ALTER CONSTRAINT fk_visibility_profile_document DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE documents
+    ALTER CONSTRAINT documents_default_visibility_profile_id_fkey DEFERRABLE INITIALLY DEFERRED;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0013_deferrable_cycle_fks', 'Defer cyclic foreign key checks to commit');
+
+COMMIT;
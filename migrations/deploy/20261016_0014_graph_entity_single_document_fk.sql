@@ -0,0 +1,43 @@
+-- Deploy single document foreign key on graph_entities
+-- requires: 20261016_0013_deferrable_cycle_fks
+
+BEGIN;
+
+-- Refuse to run while an entity links to two different documents: folding
+-- would silently discard one of them. Resolve those rows by hand first.
+DO $$
+DECLARE
+    conflicting integer;
+BEGIN
+    SELECT COUNT(*) INTO conflicting
+    FROM graph_entities
+    WHERE document_id IS NOT NULL
+      AND source_file_id IS NOT NULL
+      AND document_id <> source_file_id;
+
+    IF conflicting > 0 THEN
+        RAISE EXCEPTION '% graph_entities rows have document_id <> source_file_id', conflicting
+            USING HINT = 'SELECT id, document_id, source_file_id FROM graph_entities '
+                         'WHERE document_id <> source_file_id';
+    END IF;
+END
+$$;
+
+-- Fold the legacy document_id link into source_file_id, recording the
+-- origin in source_type
+UPDATE graph_entities
+SET source_file_id = document_id,
+    source_type = COALESCE(source_type, 'document')
+WHERE document_id IS NOT NULL
+  AND source_file_id IS NULL;
+
+-- Drops idx_graph_entities_document_id and the FK along with the column.
+-- Behaviour change: document_id was ON DELETE SET NULL, but source_file_id
+-- is ON DELETE CASCADE, so deleting a document now deletes the entities
+-- folded into source_file_id above instead of orphaning them.
+ALTER TABLE graph_entities DROP COLUMN IF EXISTS document_id;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0014_graph_entity_single_document_fk', 'Drop graph_entities.document_id in favour of source_file_id');
+
+COMMIT;
@@ -0,0 +1,68 @@
+-- Deploy JSONB for the graph, audit, security, feedback, topic and summary JSON columns
+-- requires: 20261016_0014_graph_entity_single_document_fk
+
+-- The index builds below cannot run in a transaction, so a failure part
+-- way through leaves this migration partly applied. Every step is
+-- therefore safe to re-run, and the tracking row is written last: if it
+-- is missing, fix the cause and deploy this file again.
+
+BEGIN;
+
+-- Skip columns already converted so a re-run does not rewrite the tables
+DO $$
+DECLARE
+    col record;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND data_type = 'json'
+          AND (table_name, column_name) IN (
+              ('graph_entities', 'properties'),
+              ('graph_relationships', 'properties'),
+              ('audit_logs', 'details'),
+              ('security_policies', 'policy_data'),
+              ('feedback', 'page_context'),
+              ('document_topics', 'context'),
+              ('summaries', 'config_parameters')
+          )
+    LOOP
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I TYPE jsonb USING %I::jsonb',
+                       col.table_name, col.column_name, col.column_name);
+    END LOOP;
+END
+$$;
+
+COMMIT;
+
+-- A failed concurrent build leaves an invalid index behind, which
+-- IF NOT EXISTS would then keep; drop it so the build is retried
+DO $$
+DECLARE
+    idx record;
+BEGIN
+    FOR idx IN
+        SELECT c.relname FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname IN ('idx_graph_entities_properties_gin',
+                            'idx_graph_relationships_properties_gin',
+                            'idx_audit_logs_details_gin')
+          AND c.relnamespace = current_schema()::regnamespace
+          AND NOT i.indisvalid
+    LOOP
+        EXECUTE format('DROP INDEX %I', idx.relname);
+    END LOOP;
+END
+$$;
+
+-- Built outside the transaction so writes continue while the indexes build
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_graph_entities_properties_gin
+    ON graph_entities USING gin (properties jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_graph_relationships_properties_gin
+    ON graph_relationships USING gin (properties jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_logs_details_gin
+    ON audit_logs USING gin (details jsonb_path_ops);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0015_graph_audit_jsonb', 'Convert remaining JSON columns to JSONB with GIN indexes on graph properties and audit details')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,22 @@
+-- Deploy raw SHA-256 digests for documents.content_hash
+-- requires: 20261016_0015_graph_audit_jsonb
+
+BEGIN;
+
+-- 32 bytes instead of 64 hex characters; anything that is not a hex
+-- SHA-256 cannot be decoded and is cleared
+ALTER TABLE documents
+    ALTER COLUMN content_hash TYPE bytea
+    USING CASE WHEN content_hash ~ '^[0-9a-fA-F]{64}$' THEN decode(content_hash, 'hex') END;
+
+ALTER TABLE documents
+    ADD CONSTRAINT documents_content_hash_sha256 CHECK (octet_length(content_hash) = 32);
+
+CREATE INDEX IF NOT EXISTS idx_documents_content_hash
+    ON documents (content_hash)
+    WHERE content_hash IS NOT NULL;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0016_binary_content_hash', 'Store document content hashes as 32-byte bytea');
+
+COMMIT;
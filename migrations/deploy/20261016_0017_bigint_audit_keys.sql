@@ -0,0 +1,23 @@
+-- Deploy BIGINT identity primary keys for audit_logs and rate_limits
+-- requires: 20261016_0016_binary_content_hash
+
+BEGIN;
+
+-- Nothing references these ids, so the random UUIDs are replaced outright.
+-- Existing rows are numbered in physical (insertion) order.
+ALTER TABLE audit_logs DROP CONSTRAINT audit_logs_pkey;
+ALTER TABLE audit_logs DROP COLUMN id;
+ALTER TABLE audit_logs
+    ADD COLUMN id bigint GENERATED BY DEFAULT AS IDENTITY
+    CONSTRAINT audit_logs_pkey PRIMARY KEY;
+
+ALTER TABLE rate_limits DROP CONSTRAINT rate_limits_pkey;
+ALTER TABLE rate_limits DROP COLUMN id;
+ALTER TABLE rate_limits
+    ADD COLUMN id bigint GENERATED BY DEFAULT AS IDENTITY
+    CONSTRAINT rate_limits_pkey PRIMARY KEY;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0017_bigint_audit_keys', 'Use BIGINT identity keys for audit_logs and rate_limits');
+
+COMMIT;
@@ -0,0 +1,129 @@
+-- Deploy monthly RANGE partitioning of audit_logs on action_time
+-- requires: 20261016_0017_bigint_audit_keys
+
+BEGIN;
+
+ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned;
+
+-- The partition key has to be part of the primary key, so it becomes
+-- NOT NULL; constraints and indexes are added once the old table is gone
+CREATE TABLE audit_logs (
+    id bigint GENERATED BY DEFAULT AS IDENTITY,
+    user_id uuid,
+    username text NOT NULL,
+    action text NOT NULL,
+    action_time timestamp with time zone NOT NULL DEFAULT now(),
+    resource_type text NOT NULL,
+    resource_id uuid,
+    details jsonb
+) PARTITION BY RANGE (action_time);
+
+CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+CREATE OR REPLACE FUNCTION ensure_audit_log_partitions(months_ahead integer DEFAULT 1)
+RETURNS integer AS $$
+DECLARE
+    month_start timestamp;
+    lower_bound timestamptz;
+    upper_bound timestamptz;
+    partition_name text;
+    created integer := 0;
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        month_start := date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => i);
+        partition_name := 'audit_logs_' || to_char(month_start, 'YYYY_MM');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+        lower_bound := month_start AT TIME ZONE 'UTC';
+        upper_bound := (month_start + interval '1 month') AT TIME ZONE 'UTC';
+
+        -- Attaching fails while the default partition holds rows
+        -- for the new range, so move them across first
+        EXECUTE format('CREATE TABLE %I (LIKE audit_logs INCLUDING DEFAULTS)', partition_name);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM audit_logs_default '
+            'WHERE action_time >= $1 AND action_time < $2 RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            partition_name
+        ) USING lower_bound, upper_bound;
+        EXECUTE format(
+            'ALTER TABLE audit_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, lower_bound, upper_bound
+        );
+        created := created + 1;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION drop_audit_log_partitions(older_than timestamptz)
+RETURNS integer AS $$
+DECLARE
+    partition_name text;
+    dropped integer := 0;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'audit_logs'::regclass
+          AND c.relname ~ '^audit_logs_[0-9]{4}_[0-9]{2}$'
+        ORDER BY c.relname
+    LOOP
+        CONTINUE WHEN (to_date(substr(partition_name, 12), 'YYYY_MM') + interval '1 month')
+            AT TIME ZONE 'UTC' > older_than;
+        EXECUTE format('ALTER TABLE audit_logs DETACH PARTITION %I', partition_name);
+        EXECUTE format('DROP TABLE %I', partition_name);
+        dropped := dropped + 1;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+-- One partition for every month that already has rows, so history does
+-- not end up in the default partition
+DO $$
+DECLARE
+    month_start timestamp;
+BEGIN
+    FOR month_start IN
+        SELECT DISTINCT date_trunc('month', action_time AT TIME ZONE 'UTC')
+        FROM audit_logs_unpartitioned
+        WHERE action_time IS NOT NULL
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+            'audit_logs_' || to_char(month_start, 'YYYY_MM'),
+            month_start AT TIME ZONE 'UTC',
+            (month_start + interval '1 month') AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+END;
+$$;
+
+SELECT ensure_audit_log_partitions();
+
+INSERT INTO audit_logs (id, user_id, username, action, action_time, resource_type, resource_id, details)
+SELECT id, user_id, username, action, coalesce(action_time, now()), resource_type, resource_id, details
+FROM audit_logs_unpartitioned;
+
+SELECT setval(
+    pg_get_serial_sequence('audit_logs', 'id'),
+    coalesce((SELECT max(id) FROM audit_logs), 0) + 1,
+    false
+);
+
+DROP TABLE audit_logs_unpartitioned;
+
+ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id, action_time);
+ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_user_id_fkey
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL;
+CREATE INDEX idx_audit_logs_user_id ON audit_logs (user_id);
+CREATE INDEX idx_audit_logs_action_time ON audit_logs (action_time);
+CREATE INDEX idx_audit_logs_resource_type ON audit_logs (resource_type);
+CREATE INDEX idx_audit_logs_details_gin ON audit_logs USING gin (details jsonb_path_ops);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0018_partition_audit_logs', 'Partition audit_logs by month on action_time');
+
+COMMIT;
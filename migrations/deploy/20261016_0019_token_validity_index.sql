@@ -0,0 +1,14 @@
+-- Deploy partial covering index for valid-token lookups
+-- requires: 20261016_0018_partition_audit_logs
+
+-- Built outside a transaction so token writes continue while it builds
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tokens_user_valid
+    ON tokens (user_id, is_revoked, expires_at)
+    INCLUDE (token_type)
+    WHERE is_revoked = false;
+
+-- A boolean on its own is too unselective to be worth an index
+DROP INDEX CONCURRENTLY IF EXISTS idx_tokens_is_revoked;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0019_token_validity_index', 'Replace idx_tokens_is_revoked with a partial covering index for valid tokens');
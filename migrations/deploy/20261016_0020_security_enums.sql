@@ -0,0 +1,21 @@
+-- Deploy native enums for role permission and security policy types
+-- requires: 20261016_0019_token_validity_index
+
+BEGIN;
+
+CREATE TYPE permission_type AS ENUM ('READ', 'CREATE', 'UPDATE', 'DELETE');
+CREATE TYPE policy_type AS ENUM ('ACCESS_CONTROL', 'DATA_PROTECTION', 'AUDIT', 'RATE_LIMIT');
+
+-- The enum now enforces the allowed values
+ALTER TABLE role_permissions DROP CONSTRAINT valid_permission_type;
+ALTER TABLE role_permissions
+    ALTER COLUMN permission_type TYPE permission_type USING permission_type::permission_type;
+
+ALTER TABLE security_policies DROP CONSTRAINT valid_policy_type;
+ALTER TABLE security_policies
+    ALTER COLUMN policy_type TYPE policy_type USING policy_type::policy_type;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0020_security_enums', 'Use native enums for role permission and security policy types');
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Deploy case-insensitive unique name indexes for organizations and roles
+-- requires: 20261016_0020_security_enums
+
+BEGIN;
+
+-- Fails if existing names differ only in case or surrounding spaces;
+-- rename the duplicates before deploying
+CREATE UNIQUE INDEX idx_organizations_name_ci ON organizations (lower(trim(name)));
+CREATE UNIQUE INDEX idx_roles_name_ci ON roles (lower(trim(name)));
+
+DROP INDEX IF EXISTS idx_organizations_name;
+-- Exact duplicates are already rejected by idx_roles_name_ci
+ALTER TABLE roles DROP CONSTRAINT IF EXISTS roles_name_key;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0021_case_insensitive_names', 'Case-insensitive unique name indexes for organizations and roles');
+
+COMMIT;
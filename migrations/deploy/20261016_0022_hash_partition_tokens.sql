@@ -0,0 +1,47 @@
+-- Deploy HASH partitioning of tokens on the JTI
+-- requires: 20261016_0021_case_insensitive_names
+
+BEGIN;
+
+ALTER TABLE tokens RENAME TO tokens_unpartitioned;
+
+CREATE TABLE tokens (
+    id text NOT NULL,
+    token_type text NOT NULL,
+    user_id uuid NOT NULL,
+    expires_at timestamp with time zone NOT NULL,
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    is_revoked boolean NOT NULL
+) PARTITION BY HASH (id);
+
+DO $$
+BEGIN
+    FOR remainder IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE tokens_p%s PARTITION OF tokens FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            remainder, remainder
+        );
+    END LOOP;
+END;
+$$;
+
+INSERT INTO tokens (id, token_type, user_id, expires_at, created_at, is_revoked)
+SELECT id, token_type, user_id, expires_at, created_at, is_revoked
+FROM tokens_unpartitioned;
+
+DROP TABLE tokens_unpartitioned;
+
+ALTER TABLE tokens ADD CONSTRAINT tokens_pkey PRIMARY KEY (id);
+ALTER TABLE tokens ADD CONSTRAINT tokens_id_not_empty CHECK (length(trim(id)) > 0);
+ALTER TABLE tokens ADD CONSTRAINT tokens_token_type_not_empty CHECK (length(trim(token_type)) > 0);
+ALTER TABLE tokens ADD CONSTRAINT tokens_user_id_fkey
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE;
+CREATE INDEX idx_tokens_user_id ON tokens (user_id);
+CREATE INDEX idx_tokens_expires_at ON tokens (expires_at);
+CREATE INDEX idx_tokens_user_valid ON tokens (user_id, is_revoked, expires_at)
+    INCLUDE (token_type) WHERE is_revoked = false;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0022_hash_partition_tokens', 'Hash-partition tokens on id into 16 partitions');
+
+COMMIT;
@@ -0,0 +1,9 @@
+-- Deploy removal of indexes covered by a longer index
+-- requires: 20261016_0022_hash_partition_tokens
+
+-- idx_documents_org_status (org_id, status, updated_at) serves every
+-- lookup idx_documents_org_id did; dropped concurrently so writes continue
+DROP INDEX CONCURRENTLY IF EXISTS idx_documents_org_id;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0023_drop_covered_indexes', 'Drop indexes that are a leading prefix of another index');
@@ -0,0 +1,14 @@
+-- Deploy SMALLINT document versions and rate limit counts
+-- requires: 20261016_0023_drop_covered_indexes
+
+BEGIN;
+
+-- Rewrites both tables; fails if any value is above 32767
+ALTER TABLE documents ALTER COLUMN version TYPE smallint;
+ALTER TABLE document_versions ALTER COLUMN version TYPE smallint;
+ALTER TABLE rate_limits ALTER COLUMN count TYPE smallint USING least(count, 32767);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0024_smallint_counters', 'Store document versions and rate limit counts as SMALLINT');
+
+COMMIT;
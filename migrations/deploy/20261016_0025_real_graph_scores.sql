@@ -0,0 +1,14 @@
+-- Deploy REAL weight and confidence_score on graph_relationships
+-- requires: 20261016_0024_smallint_counters
+
+BEGIN;
+
+-- The range checks carry over unchanged
+ALTER TABLE graph_relationships
+    ALTER COLUMN weight TYPE real USING weight::real,
+    ALTER COLUMN confidence_score TYPE real USING confidence_score::real;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0025_real_graph_scores', 'Store graph relationship weight and confidence as REAL');
+
+COMMIT;
@@ -0,0 +1,36 @@
+-- Deploy database-side UUIDv7 defaults for time-ordered primary keys
+-- requires: 20261016_0025_real_graph_scores
+
+BEGIN;
+
+-- Same layout as models.ids.uuid7(); bulk inserts can omit id and still
+-- get keys that sort in insertion order
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS uuid AS $$
+DECLARE
+    micros bigint := floor(extract(epoch FROM clock_timestamp()) * 1000000);
+    value bytea := uuid_send(uuid_generate_v4());
+BEGIN
+    -- 48-bit Unix time in milliseconds
+    value := overlay(value PLACING substring(int8send(micros / 1000) FROM 3) FROM 1 FOR 6);
+    -- Version 7, then the sub-millisecond fraction; the variant bits
+    -- and the random tail come from uuid_generate_v4()
+    value := overlay(value PLACING int2send((28672 | (mod(micros, 1000) * 4096 / 1000))::smallint) FROM 7 FOR 2);
+    RETURN encode(value, 'hex')::uuid;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+ALTER TABLE documents ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE document_versions ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE document_collection_contexts ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE collections ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE collection_entities ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE collection_relationships ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE entity_links ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE entity_operations ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE visibility_profiles ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0026_server_side_uuid7_defaults', 'Database-side UUIDv7 defaults for time-ordered primary keys');
+
+COMMIT;
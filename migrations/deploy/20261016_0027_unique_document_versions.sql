@@ -0,0 +1,15 @@
+-- Deploy unique (document_id, version) constraint on document_versions
+-- requires: 20261016_0026_server_side_uuid7_defaults
+
+-- Built outside a transaction so version writes continue while it builds.
+-- Fails if a document already has duplicate version numbers; renumber or
+-- remove the duplicates before deploying
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_document_versions_doc_ver
+    ON document_versions (document_id, version);
+
+-- Attaching the finished index only takes a brief lock
+ALTER TABLE document_versions
+    ADD CONSTRAINT uq_document_versions_doc_ver UNIQUE USING INDEX uq_document_versions_doc_ver;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0027_unique_document_versions', 'Unique (document_id, version) constraint on document_versions');
@@ -0,0 +1,14 @@
+-- Deploy MAIN storage for short description columns
+-- requires: 20261016_0027_unique_document_versions
+
+BEGIN;
+
+-- Only changes how new values are stored; existing rows are rewritten
+-- the next time they are updated
+ALTER TABLE feedback ALTER COLUMN description SET STORAGE MAIN;
+ALTER TABLE graph_entities ALTER COLUMN description SET STORAGE MAIN;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0028_description_storage_main', 'Keep feedback and graph entity descriptions in the row');
+
+COMMIT;
@@ -0,0 +1,22 @@
+-- Deploy BRIN indexes on audit_logs.action_time and feedback.created_at
+-- requires: 20261016_0028_description_storage_main
+
+BEGIN;
+
+-- Both tables are written in timestamp order, so one BRIN summary per
+-- 32 pages replaces a btree entry per row. audit_logs is partitioned,
+-- which rules out CONCURRENTLY; BRIN builds are quick regardless
+CREATE INDEX idx_audit_logs_action_time_brin
+    ON audit_logs USING brin (action_time)
+    WITH (pages_per_range = 32);
+DROP INDEX IF EXISTS idx_audit_logs_action_time;
+
+CREATE INDEX idx_feedback_created_at_brin
+    ON feedback USING brin (created_at)
+    WITH (pages_per_range = 32);
+DROP INDEX IF EXISTS idx_feedback_created_at;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0029_brin_audit_and_feedback_timestamps', 'BRIN indexes on audit_logs.action_time and feedback.created_at');
+
+COMMIT;
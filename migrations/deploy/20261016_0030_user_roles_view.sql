@@ -0,0 +1,16 @@
+-- Deploy user_roles_v and drop the stored user_roles.role_name copy
+-- requires: 20261016_0029_brin_audit_and_feedback_timestamps
+
+BEGIN;
+
+-- role_id is NOT NULL, so every assignment keeps its name through roles
+CREATE OR REPLACE VIEW user_roles_v AS
+SELECT ur.id, ur.user_id, ur.role_id, r.name AS role_name, ur.assigned_at, ur.assigned_by
+FROM user_roles ur JOIN roles r ON r.id = ur.role_id;
+
+ALTER TABLE user_roles DROP COLUMN role_name;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0030_user_roles_view', 'Read user role names through user_roles_v instead of a stored copy');
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Deploy UUIDv7 key defaults for topics, document_topics and users
+-- requires: 20261016_0030_user_roles_view
+
+BEGIN;
+
+-- Existing random keys stay; new rows append at the right edge of the
+-- primary key index instead of landing on random leaf pages
+ALTER TABLE topics ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE document_topics ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE users ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0031_uuid7_topics_and_users', 'UUIDv7 key defaults for topics, document_topics and users');
+
+COMMIT;
@@ -0,0 +1,85 @@
+-- Deploy triggers maintaining collection_closure
+-- requires: 20261016_0031_uuid7_topics_and_users
+
+BEGIN;
+
+-- The closure used to be kept by ORM events, which missed Core and COPY
+-- inserts and children inserted before their parent. Triggers cover every
+-- insert path; a collection inserted after its children adopts their
+-- subtrees.
+CREATE OR REPLACE FUNCTION collection_closure_link(collection_id uuid, parent_id uuid)
+RETURNS void AS $$
+    INSERT INTO collection_closure (ancestor_id, descendant_id, depth)
+    SELECT above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+    FROM collection_closure above, collection_closure below
+    WHERE above.descendant_id = parent_id AND below.ancestor_id = collection_id
+    ON CONFLICT DO NOTHING;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION collection_closure_after_insert()
+RETURNS trigger AS $$
+BEGIN
+    INSERT INTO collection_closure (ancestor_id, descendant_id, depth)
+    VALUES (NEW.id, NEW.id, 0)
+    ON CONFLICT DO NOTHING;
+
+    -- Children loaded before their parent
+    INSERT INTO collection_closure (ancestor_id, descendant_id, depth)
+    SELECT NEW.id, below.descendant_id, below.depth + 1
+    FROM collections child
+    JOIN collection_closure below ON below.ancestor_id = child.id
+    WHERE child.parent_id = NEW.id AND child.id <> NEW.id
+    ON CONFLICT DO NOTHING;
+
+    IF NEW.parent_id IS NOT NULL THEN
+        PERFORM collection_closure_link(NEW.id, NEW.parent_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION collection_closure_after_move()
+RETURNS trigger AS $$
+BEGIN
+    -- Detach the subtree from its old ancestors, keeping its internal paths
+    DELETE FROM collection_closure
+    WHERE descendant_id IN (SELECT descendant_id FROM collection_closure WHERE ancestor_id = NEW.id)
+      AND ancestor_id NOT IN (SELECT descendant_id FROM collection_closure WHERE ancestor_id = NEW.id);
+
+    IF NEW.parent_id IS NOT NULL THEN
+        PERFORM collection_closure_link(NEW.id, NEW.parent_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_collection_closure_insert
+    AFTER INSERT ON collections
+    FOR EACH ROW EXECUTE FUNCTION collection_closure_after_insert();
+
+CREATE TRIGGER trg_collection_closure_move
+    AFTER UPDATE OF parent_id ON collections
+    FOR EACH ROW WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+    EXECUTE FUNCTION collection_closure_after_move();
+
+-- Rebuild from the adjacency list to repair rows the ORM events missed
+DELETE FROM collection_closure;
+
+WITH RECURSIVE paths (ancestor_id, descendant_id, depth) AS (
+    SELECT id, id, 0
+    FROM collections
+
+    UNION ALL
+
+    SELECT p.ancestor_id, c.id, p.depth + 1
+    FROM paths p
+    JOIN collections c ON c.parent_id = p.descendant_id
+)
+INSERT INTO collection_closure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth
+FROM paths;
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0032_collection_closure_triggers', 'Maintain collection_closure with triggers on collections');
+
+COMMIT;
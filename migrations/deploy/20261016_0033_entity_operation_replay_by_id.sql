@@ -0,0 +1,18 @@
+-- Deploy entity operations keyed for replay by id instead of by timestamp
+-- requires: 20261016_0032_collection_closure_triggers
+
+BEGIN;
+
+-- performed_at defaults to the transaction's now(), so two operations of
+-- the same type on the same entity in one transaction collided on
+-- uq_entity_operation. EntityOperation.bulk_insert() now skips replays by
+-- primary key instead.
+ALTER TABLE entity_operations DROP CONSTRAINT uq_entity_operation;
+
+-- uq_entity_operation also served lookups by collection_id
+CREATE INDEX idx_entity_operations_collection_id ON entity_operations (collection_id);
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('20261016_0033_entity_operation_replay_by_id', 'Allow repeated entity operations within one transaction');
+
+COMMIT;
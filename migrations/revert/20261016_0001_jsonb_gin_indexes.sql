@@ -0,0 +1,33 @@
+-- Revert JSONB columns and GIN indexes for containment filters
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_documents_metadata_gin;
+DROP INDEX IF EXISTS idx_documents_tags_gin;
+DROP INDEX IF EXISTS idx_collection_entities_properties_gin;
+DROP INDEX IF EXISTS idx_entity_operations_details_gin;
+DROP INDEX IF EXISTS idx_visibility_profiles_visible_entity_types_gin;
+DROP INDEX IF EXISTS idx_visibility_profiles_hidden_entities_gin;
+DROP INDEX IF EXISTS idx_visibility_profiles_enabled_entities_gin;
+
+ALTER TABLE documents
+    ALTER COLUMN tags TYPE json USING tags::json,
+    ALTER COLUMN key_terms TYPE json USING key_terms::json,
+    ALTER COLUMN linked_docs TYPE json USING linked_docs::json,
+    ALTER COLUMN graph_nodes TYPE json USING graph_nodes::json;
+
+ALTER TABLE collection_entities
+    ALTER COLUMN properties TYPE json USING properties::json;
+
+ALTER TABLE entity_operations
+    ALTER COLUMN details TYPE json USING details::json;
+
+ALTER TABLE visibility_profiles
+    ALTER COLUMN visible_entity_types TYPE json USING visible_entity_types::json,
+    ALTER COLUMN hidden_entities TYPE json USING hidden_entities::json,
+    ALTER COLUMN enabled_entities TYPE json USING enabled_entities::json;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0001_jsonb_gin_indexes';
+
+COMMIT;
@@ -0,0 +1,31 @@
+-- Revert JSONB for the remaining JSON columns in the document/collection tables
+
+BEGIN;
+
+ALTER TABLE documents
+    ALTER COLUMN graph_relationships TYPE json USING graph_relationships::json;
+
+ALTER TABLE document_versions
+    ALTER COLUMN doc_metadata TYPE json USING doc_metadata::json;
+
+ALTER TABLE collection_entities
+    ALTER COLUMN source_entity_ids TYPE json USING source_entity_ids::json;
+
+ALTER TABLE collection_relationships
+    ALTER COLUMN properties TYPE json USING properties::json,
+    ALTER COLUMN source_relationship_ids TYPE json USING source_relationship_ids::json;
+
+ALTER TABLE document_collection_contexts
+    ALTER COLUMN context_metadata TYPE json USING context_metadata::json;
+
+ALTER TABLE visibility_profiles
+    ALTER COLUMN visible_relationship_types TYPE json USING visible_relationship_types::json,
+    ALTER COLUMN hidden_relationships TYPE json USING hidden_relationships::json,
+    ALTER COLUMN all_entities TYPE json USING all_entities::json,
+    ALTER COLUMN all_relationships TYPE json USING all_relationships::json,
+    ALTER COLUMN enabled_relationships TYPE json USING enabled_relationships::json;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0002_remaining_jsonb_columns';
+
+COMMIT;
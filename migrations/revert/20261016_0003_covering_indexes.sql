@@ -0,0 +1,14 @@
+-- Revert covering indexes for document listings and collection edges
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_documents_org_status;
+CREATE INDEX idx_documents_org_status ON documents (org_id, status);
+
+DROP INDEX IF EXISTS idx_collection_relationships_collection_id;
+CREATE INDEX idx_collection_relationships_collection_id ON collection_relationships (collection_id);
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0003_covering_indexes';
+
+COMMIT;
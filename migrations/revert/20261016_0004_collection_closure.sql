@@ -0,0 +1,10 @@
+-- Revert closure table for the collection hierarchy
+
+BEGIN;
+
+DROP TABLE IF EXISTS collection_closure;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0004_collection_closure';
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- Revert server-side UUID defaults for random primary keys
+
+BEGIN;
+
+ALTER TABLE organizations ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE users ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE summaries ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE topics ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE document_topics ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE graph_entities ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE graph_relationships ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE feedback ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE roles ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE user_roles ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE role_permissions ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE audit_logs ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE rate_limits ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE security_policies ALTER COLUMN id DROP DEFAULT;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0005_server_side_uuid_defaults';
+
+COMMIT;
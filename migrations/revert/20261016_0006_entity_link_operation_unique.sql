@@ -0,0 +1,11 @@
+-- Revert unique keys for entity links and entity operations
+
+BEGIN;
+
+ALTER TABLE entity_links DROP CONSTRAINT IF EXISTS uq_entity_link;
+ALTER TABLE entity_operations DROP CONSTRAINT IF EXISTS uq_entity_operation;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0006_entity_link_operation_unique';
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Revert partial indexes over live (not soft-deleted) documents and collections
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_documents_live_org;
+CREATE INDEX idx_documents_is_deleted ON documents (is_deleted);
+
+DROP INDEX IF EXISTS idx_collections_live_org;
+DROP INDEX IF EXISTS idx_collections_live_parent;
+CREATE INDEX idx_collections_is_deleted ON collections (is_deleted);
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0007_soft_delete_partial_indexes';
+
+COMMIT;
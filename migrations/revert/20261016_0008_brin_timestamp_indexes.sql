@@ -0,0 +1,13 @@
+-- Revert BRIN indexes on append-only timestamp columns
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_entity_operations_performed_at_brin;
+CREATE INDEX idx_entity_operations_performed_at ON entity_operations (performed_at);
+
+DROP INDEX IF EXISTS idx_document_versions_created_at_brin;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0008_brin_timestamp_indexes';
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- Revert expression index on documents.metadata->>'language'
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_documents_meta_lang;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0009_metadata_language_index';
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Revert generated full-text search column on documents
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_documents_search;
+ALTER TABLE documents DROP COLUMN IF EXISTS search_vector;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0010_document_search_vector';
+
+COMMIT;
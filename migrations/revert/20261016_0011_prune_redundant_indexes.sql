@@ -0,0 +1,29 @@
+-- Revert pruning of redundant indexes
+--
+-- Restores the indexes the models declared before this change; copies that
+-- only the schema builder created are recreated by its older version.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_documents_type ON documents (document_type);
+CREATE INDEX IF NOT EXISTS idx_documents_status ON documents (status);
+DROP INDEX IF EXISTS idx_documents_org_type_status;
+
+CREATE INDEX IF NOT EXISTS idx_users_username ON users (username);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users (email);
+CREATE INDEX IF NOT EXISTS idx_users_org_id ON users (org_id);
+CREATE INDEX IF NOT EXISTS idx_roles_name ON roles (name);
+CREATE INDEX IF NOT EXISTS idx_user_roles_user_id ON user_roles (user_id);
+CREATE INDEX IF NOT EXISTS idx_entity_links_graph_entity_id ON entity_links (graph_entity_id);
+CREATE INDEX IF NOT EXISTS idx_entity_operations_collection_id ON entity_operations (collection_id);
+CREATE INDEX IF NOT EXISTS ix_graph_entities_entity_id ON graph_entities (entity_id);
+CREATE INDEX IF NOT EXISTS ix_graph_entities_source_file_id ON graph_entities (source_file_id);
+CREATE INDEX IF NOT EXISTS ix_graph_entities_source_collection_id ON graph_entities (source_collection_id);
+CREATE INDEX IF NOT EXISTS ix_graph_relationships_relationship_id ON graph_relationships (relationship_id);
+CREATE INDEX IF NOT EXISTS ix_graph_relationships_source_file_id ON graph_relationships (source_file_id);
+CREATE INDEX IF NOT EXISTS ix_graph_relationships_source_collection_id ON graph_relationships (source_collection_id);
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0011_prune_redundant_indexes';
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- Revert document_tags side table
+
+BEGIN;
+
+DROP TABLE IF EXISTS document_tags;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0012_document_tags';
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Revert deferred checking for cyclic and self-referential foreign keys
+
+BEGIN;
+
+ALTER TABLE collections
+    ALTER CONSTRAINT fk_collection_parent NOT DEFERRABLE;
+ALTER TABLE visibility_profiles
+    ALTER CONSTRAINT fk_visibility_profile_document NOT DEFERRABLE;
+ALTER TABLE documents
+    ALTER CONSTRAINT documents_default_visibility_profile_id_fkey NOT DEFERRABLE;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0013_deferrable_cycle_fks';
+
+COMMIT;
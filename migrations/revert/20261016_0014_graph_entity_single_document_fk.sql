@@ -0,0 +1,17 @@
+-- Revert single document foreign key on graph_entities
+
+BEGIN;
+
+ALTER TABLE graph_entities
+    ADD COLUMN IF NOT EXISTS document_id UUID REFERENCES documents(id) ON DELETE SET NULL;
+
+UPDATE graph_entities
+SET document_id = source_file_id
+WHERE source_type = 'document';
+
+CREATE INDEX IF NOT EXISTS idx_graph_entities_document_id ON graph_entities (document_id);
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0014_graph_entity_single_document_fk';
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- Revert JSONB for the graph, audit, security, feedback, topic and summary JSON columns
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_graph_entities_properties_gin;
+DROP INDEX CONCURRENTLY IF EXISTS idx_graph_relationships_properties_gin;
+DROP INDEX CONCURRENTLY IF EXISTS idx_audit_logs_details_gin;
+
+BEGIN;
+
+ALTER TABLE graph_entities
+    ALTER COLUMN properties TYPE json USING properties::json;
+
+ALTER TABLE graph_relationships
+    ALTER COLUMN properties TYPE json USING properties::json;
+
+ALTER TABLE audit_logs
+    ALTER COLUMN details TYPE json USING details::json;
+
+ALTER TABLE security_policies
+    ALTER COLUMN policy_data TYPE json USING policy_data::json;
+
+ALTER TABLE feedback
+    ALTER COLUMN page_context TYPE json USING page_context::json;
+
+ALTER TABLE document_topics
+    ALTER COLUMN context TYPE json USING context::json;
+
+ALTER TABLE summaries
+    ALTER COLUMN config_parameters TYPE json USING config_parameters::json;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0015_graph_audit_jsonb';
+
+COMMIT;
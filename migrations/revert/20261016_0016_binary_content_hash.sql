@@ -0,0 +1,16 @@
+-- Revert raw SHA-256 digests for documents.content_hash
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_documents_content_hash;
+
+ALTER TABLE documents DROP CONSTRAINT IF EXISTS documents_content_hash_sha256;
+
+ALTER TABLE documents
+    ALTER COLUMN content_hash TYPE varchar(64)
+    USING encode(content_hash, 'hex');
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0016_binary_content_hash';
+
+COMMIT;
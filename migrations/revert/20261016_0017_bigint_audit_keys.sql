@@ -0,0 +1,20 @@
+-- Revert BIGINT identity primary keys for audit_logs and rate_limits
+
+BEGIN;
+
+ALTER TABLE audit_logs DROP CONSTRAINT audit_logs_pkey;
+ALTER TABLE audit_logs DROP COLUMN id;
+ALTER TABLE audit_logs
+    ADD COLUMN id uuid NOT NULL DEFAULT uuid_generate_v4()
+    CONSTRAINT audit_logs_pkey PRIMARY KEY;
+
+ALTER TABLE rate_limits DROP CONSTRAINT rate_limits_pkey;
+ALTER TABLE rate_limits DROP COLUMN id;
+ALTER TABLE rate_limits
+    ADD COLUMN id uuid NOT NULL DEFAULT uuid_generate_v4()
+    CONSTRAINT rate_limits_pkey PRIMARY KEY;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0017_bigint_audit_keys';
+
+COMMIT;
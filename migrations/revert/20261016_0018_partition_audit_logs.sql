@@ -0,0 +1,44 @@
+-- Revert monthly RANGE partitioning of audit_logs on action_time
+
+BEGIN;
+
+CREATE TABLE audit_logs_unpartitioned (
+    id bigint GENERATED BY DEFAULT AS IDENTITY,
+    user_id uuid,
+    username text NOT NULL,
+    action text NOT NULL,
+    action_time timestamp with time zone DEFAULT now(),
+    resource_type text NOT NULL,
+    resource_id uuid,
+    details jsonb
+);
+
+INSERT INTO audit_logs_unpartitioned
+    (id, user_id, username, action, action_time, resource_type, resource_id, details)
+SELECT id, user_id, username, action, action_time, resource_type, resource_id, details
+FROM audit_logs;
+
+SELECT setval(
+    pg_get_serial_sequence('audit_logs_unpartitioned', 'id'),
+    coalesce((SELECT max(id) FROM audit_logs_unpartitioned), 0) + 1,
+    false
+);
+
+-- Drops every partition with it
+DROP TABLE audit_logs;
+DROP FUNCTION ensure_audit_log_partitions(integer);
+DROP FUNCTION drop_audit_log_partitions(timestamptz);
+
+ALTER TABLE audit_logs_unpartitioned RENAME TO audit_logs;
+ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id);
+ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_user_id_fkey
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL;
+CREATE INDEX idx_audit_logs_user_id ON audit_logs (user_id);
+CREATE INDEX idx_audit_logs_action_time ON audit_logs (action_time);
+CREATE INDEX idx_audit_logs_resource_type ON audit_logs (resource_type);
+CREATE INDEX idx_audit_logs_details_gin ON audit_logs USING gin (details jsonb_path_ops);
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0018_partition_audit_logs';
+
+COMMIT;
@@ -0,0 +1,7 @@
+-- Revert partial covering index for valid-token lookups
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tokens_is_revoked ON tokens (is_revoked);
+DROP INDEX CONCURRENTLY IF EXISTS idx_tokens_user_valid;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0019_token_validity_index';
@@ -0,0 +1,21 @@
+-- Revert native enums for role permission and security policy types
+
+BEGIN;
+
+ALTER TABLE role_permissions
+    ALTER COLUMN permission_type TYPE text USING permission_type::text;
+ALTER TABLE role_permissions ADD CONSTRAINT valid_permission_type
+    CHECK (permission_type IN ('READ', 'CREATE', 'UPDATE', 'DELETE'));
+
+ALTER TABLE security_policies
+    ALTER COLUMN policy_type TYPE text USING policy_type::text;
+ALTER TABLE security_policies ADD CONSTRAINT valid_policy_type
+    CHECK (policy_type IN ('ACCESS_CONTROL', 'DATA_PROTECTION', 'AUDIT', 'RATE_LIMIT'));
+
+DROP TYPE permission_type;
+DROP TYPE policy_type;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0020_security_enums';
+
+COMMIT;
@@ -0,0 +1,14 @@
+-- Revert case-insensitive unique name indexes for organizations and roles
+
+BEGIN;
+
+ALTER TABLE roles ADD CONSTRAINT roles_name_key UNIQUE (name);
+CREATE INDEX idx_organizations_name ON organizations (name);
+
+DROP INDEX idx_roles_name_ci;
+DROP INDEX idx_organizations_name_ci;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0021_case_insensitive_names';
+
+COMMIT;
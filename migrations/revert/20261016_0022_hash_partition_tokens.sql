@@ -0,0 +1,35 @@
+-- Revert HASH partitioning of tokens on the JTI
+
+BEGIN;
+
+CREATE TABLE tokens_unpartitioned (
+    id text NOT NULL,
+    token_type text NOT NULL,
+    user_id uuid NOT NULL,
+    expires_at timestamp with time zone NOT NULL,
+    created_at timestamp with time zone NOT NULL DEFAULT now(),
+    is_revoked boolean NOT NULL
+);
+
+INSERT INTO tokens_unpartitioned (id, token_type, user_id, expires_at, created_at, is_revoked)
+SELECT id, token_type, user_id, expires_at, created_at, is_revoked
+FROM tokens;
+
+-- Drops every partition with it
+DROP TABLE tokens;
+
+ALTER TABLE tokens_unpartitioned RENAME TO tokens;
+ALTER TABLE tokens ADD CONSTRAINT tokens_pkey PRIMARY KEY (id);
+ALTER TABLE tokens ADD CONSTRAINT tokens_id_not_empty CHECK (length(trim(id)) > 0);
+ALTER TABLE tokens ADD CONSTRAINT tokens_token_type_not_empty CHECK (length(trim(token_type)) > 0);
+ALTER TABLE tokens ADD CONSTRAINT tokens_user_id_fkey
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE;
+CREATE INDEX idx_tokens_user_id ON tokens (user_id);
+CREATE INDEX idx_tokens_expires_at ON tokens (expires_at);
+CREATE INDEX idx_tokens_user_valid ON tokens (user_id, is_revoked, expires_at)
+    INCLUDE (token_type) WHERE is_revoked = false;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0022_hash_partition_tokens';
+
+COMMIT;
@@ -0,0 +1,6 @@
+-- Revert removal of indexes covered by a longer index
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_org_id ON documents (org_id);
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0023_drop_covered_indexes';
@@ -0,0 +1,12 @@
+-- Revert SMALLINT document versions and rate limit counts
+
+BEGIN;
+
+ALTER TABLE documents ALTER COLUMN version TYPE integer;
+ALTER TABLE document_versions ALTER COLUMN version TYPE integer;
+ALTER TABLE rate_limits ALTER COLUMN count TYPE integer;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0024_smallint_counters';
+
+COMMIT;
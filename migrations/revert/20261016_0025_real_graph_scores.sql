@@ -0,0 +1,12 @@
+-- Revert REAL weight and confidence_score on graph_relationships
+
+BEGIN;
+
+ALTER TABLE graph_relationships
+    ALTER COLUMN weight TYPE numeric(10, 5) USING weight::numeric(10, 5),
+    ALTER COLUMN confidence_score TYPE numeric(5, 4) USING confidence_score::numeric(5, 4);
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0025_real_graph_scores';
+
+COMMIT;
@@ -0,0 +1,20 @@
+-- Revert database-side UUIDv7 defaults for time-ordered primary keys
+
+BEGIN;
+
+ALTER TABLE documents ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE document_versions ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE document_collection_contexts ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE collections ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE collection_entities ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE collection_relationships ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE entity_links ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE entity_operations ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE visibility_profiles ALTER COLUMN id DROP DEFAULT;
+
+DROP FUNCTION uuid_generate_v7();
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0026_server_side_uuid7_defaults';
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- Revert unique (document_id, version) constraint on document_versions
+
+BEGIN;
+
+ALTER TABLE document_versions DROP CONSTRAINT IF EXISTS uq_document_versions_doc_ver;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0027_unique_document_versions';
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Revert MAIN storage for short description columns
+
+BEGIN;
+
+ALTER TABLE graph_entities ALTER COLUMN description SET STORAGE EXTENDED;
+ALTER TABLE feedback ALTER COLUMN description SET STORAGE EXTENDED;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0028_description_storage_main';
+
+COMMIT;
@@ -0,0 +1,14 @@
+-- Revert BRIN indexes on audit_logs.action_time and feedback.created_at
+
+BEGIN;
+
+CREATE INDEX idx_feedback_created_at ON feedback (created_at);
+DROP INDEX IF EXISTS idx_feedback_created_at_brin;
+
+CREATE INDEX idx_audit_logs_action_time ON audit_logs (action_time);
+DROP INDEX IF EXISTS idx_audit_logs_action_time_brin;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0029_brin_audit_and_feedback_timestamps';
+
+COMMIT;
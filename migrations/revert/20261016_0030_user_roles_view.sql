@@ -0,0 +1,14 @@
+-- Revert user_roles_v and restore user_roles.role_name
+
+BEGIN;
+
+ALTER TABLE user_roles ADD COLUMN role_name text;
+UPDATE user_roles ur SET role_name = r.name FROM roles r WHERE r.id = ur.role_id;
+ALTER TABLE user_roles ALTER COLUMN role_name SET NOT NULL;
+
+DROP VIEW IF EXISTS user_roles_v;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0030_user_roles_view';
+
+COMMIT;
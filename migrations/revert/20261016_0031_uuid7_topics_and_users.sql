@@ -0,0 +1,12 @@
+-- Revert UUIDv7 key defaults for topics, document_topics and users
+
+BEGIN;
+
+ALTER TABLE topics ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE document_topics ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+ALTER TABLE users ALTER COLUMN id SET DEFAULT uuid_generate_v4();
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0031_uuid7_topics_and_users';
+
+COMMIT;
@@ -0,0 +1,14 @@
+-- Revert triggers maintaining collection_closure
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_collection_closure_insert ON collections;
+DROP TRIGGER IF EXISTS trg_collection_closure_move ON collections;
+DROP FUNCTION IF EXISTS collection_closure_after_insert();
+DROP FUNCTION IF EXISTS collection_closure_after_move();
+DROP FUNCTION IF EXISTS collection_closure_link(uuid, uuid);
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0032_collection_closure_triggers';
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- Revert entity operations keyed for replay by id instead of by timestamp
+
+BEGIN;
+
+-- Operations repeated within one transaction cannot coexist under the key;
+-- keep the oldest of each
+DELETE FROM entity_operations a
+USING entity_operations b
+WHERE a.collection_id = b.collection_id
+  AND a.entity_id = b.entity_id
+  AND a.operation_type = b.operation_type
+  AND a.performed_at = b.performed_at
+  AND a.ctid > b.ctid;
+
+ALTER TABLE entity_operations
+    ADD CONSTRAINT uq_entity_operation UNIQUE (collection_id, entity_id, operation_type, performed_at);
+
+DROP INDEX IF EXISTS idx_entity_operations_collection_id;
+
+DELETE FROM schema_migrations
+WHERE version = '20261016_0033_entity_operation_replay_by_id';
+
+COMMIT;
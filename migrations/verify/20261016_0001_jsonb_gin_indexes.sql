@@ -0,0 +1,32 @@
+-- Verify JSONB columns and GIN indexes for containment filters
+
+BEGIN;
+
+-- Every converted column is jsonb
+SELECT 1/(COUNT(*) = 9)::int FROM information_schema.columns
+WHERE data_type = 'jsonb'
+  AND (table_name, column_name) IN (
+    ('documents', 'tags'),
+    ('documents', 'key_terms'),
+    ('documents', 'linked_docs'),
+    ('documents', 'graph_nodes'),
+    ('collection_entities', 'properties'),
+    ('entity_operations', 'details'),
+    ('visibility_profiles', 'visible_entity_types'),
+    ('visibility_profiles', 'hidden_entities'),
+    ('visibility_profiles', 'enabled_entities')
+  );
+
+-- Every GIN index exists
+SELECT 1/(COUNT(*) = 7)::int FROM pg_indexes
+WHERE indexname IN (
+    'idx_documents_metadata_gin',
+    'idx_documents_tags_gin',
+    'idx_collection_entities_properties_gin',
+    'idx_entity_operations_details_gin',
+    'idx_visibility_profiles_visible_entity_types_gin',
+    'idx_visibility_profiles_hidden_entities_gin',
+    'idx_visibility_profiles_enabled_entities_gin'
+);
+
+ROLLBACK;
@@ -0,0 +1,22 @@
+-- Verify JSONB for the remaining JSON columns in the document/collection tables
+
+BEGIN;
+
+-- Every converted column is jsonb
+SELECT 1/(COUNT(*) = 11)::int FROM information_schema.columns
+WHERE data_type = 'jsonb'
+  AND (table_name, column_name) IN (
+    ('documents', 'graph_relationships'),
+    ('document_versions', 'doc_metadata'),
+    ('collection_entities', 'source_entity_ids'),
+    ('collection_relationships', 'properties'),
+    ('collection_relationships', 'source_relationship_ids'),
+    ('document_collection_contexts', 'context_metadata'),
+    ('visibility_profiles', 'visible_relationship_types'),
+    ('visibility_profiles', 'hidden_relationships'),
+    ('visibility_profiles', 'all_entities'),
+    ('visibility_profiles', 'all_relationships'),
+    ('visibility_profiles', 'enabled_relationships')
+  );
+
+ROLLBACK;
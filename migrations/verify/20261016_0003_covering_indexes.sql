@@ -0,0 +1,13 @@
+-- Verify covering indexes for document listings and collection edges
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE indexname = 'idx_documents_org_status'
+  AND indexdef LIKE '%INCLUDE (id, title, document_type, processing_status)%';
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE indexname = 'idx_collection_relationships_collection_id'
+  AND indexdef LIKE '%INCLUDE (source_entity_id, target_entity_id, relationship_type)%';
+
+ROLLBACK;
@@ -0,0 +1,19 @@
+-- Verify closure table for the collection hierarchy
+
+BEGIN;
+
+SELECT ancestor_id, descendant_id, depth
+FROM collection_closure
+WHERE FALSE;
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE indexname = 'idx_closure_descendant';
+
+-- Every collection has its depth-0 self row
+SELECT 1/(COUNT(*) = 0)::int
+FROM collections c
+LEFT JOIN collection_closure cc
+    ON cc.ancestor_id = c.id AND cc.descendant_id = c.id AND cc.depth = 0
+WHERE cc.ancestor_id IS NULL;
+
+ROLLBACK;
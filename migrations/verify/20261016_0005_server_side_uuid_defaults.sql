@@ -0,0 +1,27 @@
+-- Verify server-side UUID defaults for random primary keys
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 14)::int
+FROM information_schema.columns
+WHERE table_schema = current_schema()
+  AND column_name = 'id'
+  AND column_default = 'uuid_generate_v4()'
+  AND table_name IN (
+      'organizations',
+      'users',
+      'summaries',
+      'topics',
+      'document_topics',
+      'graph_entities',
+      'graph_relationships',
+      'feedback',
+      'roles',
+      'user_roles',
+      'role_permissions',
+      'audit_logs',
+      'rate_limits',
+      'security_policies'
+  );
+
+ROLLBACK;
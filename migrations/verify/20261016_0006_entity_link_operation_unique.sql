@@ -0,0 +1,10 @@
+-- Verify unique keys for entity links and entity operations
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int
+FROM pg_constraint
+WHERE contype = 'u'
+  AND conname IN ('uq_entity_link', 'uq_entity_operation');
+
+ROLLBACK;
@@ -0,0 +1,10 @@
+-- Verify partial indexes over live (not soft-deleted) documents and collections
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 3)::int
+FROM pg_indexes
+WHERE indexname IN ('idx_documents_live_org', 'idx_collections_live_org', 'idx_collections_live_parent')
+  AND indexdef LIKE '%WHERE (is_deleted = false)%';
+
+ROLLBACK;
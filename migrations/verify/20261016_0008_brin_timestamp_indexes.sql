@@ -0,0 +1,10 @@
+-- Verify BRIN indexes on append-only timestamp columns
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int
+FROM pg_indexes
+WHERE indexname IN ('idx_entity_operations_performed_at_brin', 'idx_document_versions_created_at_brin')
+  AND indexdef LIKE '%USING brin%';
+
+ROLLBACK;
@@ -0,0 +1,9 @@
+-- Verify expression index on documents.metadata->>'language'
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE indexname = 'idx_documents_meta_lang'
+  AND indexdef LIKE '%(metadata ->> ''language''::text)%';
+
+ROLLBACK;
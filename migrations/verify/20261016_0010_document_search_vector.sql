@@ -0,0 +1,13 @@
+-- Verify generated full-text search column on documents
+
+BEGIN;
+
+SELECT search_vector
+FROM documents
+WHERE FALSE;
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE indexname = 'idx_documents_search'
+  AND indexdef LIKE '%USING gin (search_vector)%';
+
+ROLLBACK;
@@ -0,0 +1,12 @@
+-- Verify pruning of redundant indexes
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE indexname = 'idx_documents_org_type_status'
+  AND indexdef LIKE '%WHERE (is_deleted = false)%';
+
+SELECT 1/(COUNT(*) = 0)::int FROM pg_indexes
+WHERE indexname IN ('idx_documents_type', 'idx_documents_status');
+
+ROLLBACK;
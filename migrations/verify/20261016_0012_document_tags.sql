@@ -0,0 +1,10 @@
+-- Verify document_tags side table
+
+BEGIN;
+
+SELECT document_id, tag FROM document_tags WHERE false;
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE tablename = 'document_tags' AND indexname = 'idx_document_tags_tag';
+
+ROLLBACK;
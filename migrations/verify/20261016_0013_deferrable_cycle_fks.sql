@@ -0,0 +1,10 @@
+-- Verify deferred checking for cyclic and self-referential foreign keys
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 3)::int FROM pg_constraint
+WHERE conname IN ('fk_collection_parent', 'fk_visibility_profile_document',
+                  'documents_default_visibility_profile_id_fkey')
+  AND condeferrable AND condeferred;
+
+ROLLBACK;
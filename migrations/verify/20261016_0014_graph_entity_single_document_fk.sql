@@ -0,0 +1,8 @@
+-- Verify single document foreign key on graph_entities
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 0)::int FROM information_schema.columns
+WHERE table_name = 'graph_entities' AND column_name = 'document_id';
+
+ROLLBACK;
@@ -0,0 +1,25 @@
+-- Verify JSONB for the graph, audit, security, feedback, topic and summary JSON columns
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 7)::int FROM information_schema.columns
+WHERE data_type = 'jsonb'
+  AND (table_name, column_name) IN (
+      ('graph_entities', 'properties'),
+      ('graph_relationships', 'properties'),
+      ('audit_logs', 'details'),
+      ('security_policies', 'policy_data'),
+      ('feedback', 'page_context'),
+      ('document_topics', 'context'),
+      ('summaries', 'config_parameters')
+  );
+
+-- Concurrent builds that failed leave invalid indexes behind
+SELECT 1/(COUNT(*) = 3)::int FROM pg_index i
+JOIN pg_class c ON c.oid = i.indexrelid
+WHERE c.relname IN ('idx_graph_entities_properties_gin',
+                    'idx_graph_relationships_properties_gin',
+                    'idx_audit_logs_details_gin')
+  AND i.indisvalid;
+
+ROLLBACK;
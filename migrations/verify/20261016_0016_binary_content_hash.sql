@@ -0,0 +1,11 @@
+-- Verify raw SHA-256 digests for documents.content_hash
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM information_schema.columns
+WHERE table_name = 'documents' AND column_name = 'content_hash' AND data_type = 'bytea';
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE tablename = 'documents' AND indexname = 'idx_documents_content_hash';
+
+ROLLBACK;
@@ -0,0 +1,12 @@
+-- Verify BIGINT identity primary keys for audit_logs and rate_limits
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int FROM information_schema.columns
+WHERE table_schema = current_schema()
+  AND column_name = 'id'
+  AND data_type = 'bigint'
+  AND is_identity = 'YES'
+  AND table_name IN ('audit_logs', 'rate_limits');
+
+ROLLBACK;
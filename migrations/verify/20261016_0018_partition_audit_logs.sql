@@ -0,0 +1,15 @@
+-- Verify monthly RANGE partitioning of audit_logs on action_time
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_partitioned_table p
+JOIN pg_class c ON c.oid = p.partrelid
+WHERE c.relname = 'audit_logs' AND p.partstrat = 'r';
+
+SELECT 1/COUNT(*) FROM pg_class
+WHERE relname = 'audit_logs_' || to_char(now() AT TIME ZONE 'UTC', 'YYYY_MM');
+
+SELECT 1/COUNT(*) FROM pg_proc WHERE proname = 'ensure_audit_log_partitions';
+SELECT 1/COUNT(*) FROM pg_proc WHERE proname = 'drop_audit_log_partitions';
+
+ROLLBACK;
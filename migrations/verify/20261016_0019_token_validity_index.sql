@@ -0,0 +1,13 @@
+-- Verify partial covering index for valid-token lookups
+
+BEGIN;
+
+-- Concurrent builds that failed leave invalid indexes behind
+SELECT 1/COUNT(*) FROM pg_index i
+JOIN pg_class c ON c.oid = i.indexrelid
+WHERE c.relname = 'idx_tokens_user_valid'
+  AND i.indisvalid;
+
+SELECT 1/(COUNT(*) = 0)::int FROM pg_class WHERE relname = 'idx_tokens_is_revoked';
+
+ROLLBACK;
@@ -0,0 +1,12 @@
+-- Verify native enums for role permission and security policy types
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int FROM information_schema.columns
+WHERE data_type = 'USER-DEFINED'
+  AND (table_name, column_name, udt_name) IN (
+      ('role_permissions', 'permission_type', 'permission_type'),
+      ('security_policies', 'policy_type', 'policy_type')
+  );
+
+ROLLBACK;
@@ -0,0 +1,10 @@
+-- Verify case-insensitive unique name indexes for organizations and roles
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int FROM pg_index i
+JOIN pg_class c ON c.oid = i.indexrelid
+WHERE c.relname IN ('idx_organizations_name_ci', 'idx_roles_name_ci')
+  AND i.indisunique;
+
+ROLLBACK;
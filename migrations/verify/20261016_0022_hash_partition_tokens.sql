@@ -0,0 +1,12 @@
+-- Verify HASH partitioning of tokens on the JTI
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_partitioned_table p
+JOIN pg_class c ON c.oid = p.partrelid
+WHERE c.relname = 'tokens' AND p.partstrat = 'h';
+
+SELECT 1/(COUNT(*) = 16)::int FROM pg_inherits
+WHERE inhparent = 'tokens'::regclass;
+
+ROLLBACK;
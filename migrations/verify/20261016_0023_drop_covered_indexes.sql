@@ -0,0 +1,10 @@
+-- Verify removal of indexes covered by a longer index
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 0)::int FROM pg_class WHERE relname = 'idx_documents_org_id';
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE indexname = 'idx_documents_org_status'
+  AND indexdef LIKE '%(org_id, %';
+
+ROLLBACK;
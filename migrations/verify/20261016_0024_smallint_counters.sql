@@ -0,0 +1,13 @@
+-- Verify SMALLINT document versions and rate limit counts
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 3)::int FROM information_schema.columns
+WHERE data_type = 'smallint'
+  AND (table_name, column_name) IN (
+      ('documents', 'version'),
+      ('document_versions', 'version'),
+      ('rate_limits', 'count')
+  );
+
+ROLLBACK;
@@ -0,0 +1,10 @@
+-- Verify REAL weight and confidence_score on graph_relationships
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int FROM information_schema.columns
+WHERE table_name = 'graph_relationships'
+  AND column_name IN ('weight', 'confidence_score')
+  AND data_type = 'real';
+
+ROLLBACK;
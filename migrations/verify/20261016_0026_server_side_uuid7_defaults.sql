@@ -0,0 +1,14 @@
+-- Verify database-side UUIDv7 defaults for time-ordered primary keys
+
+BEGIN;
+
+SELECT 1/(uuid_generate_v7()::text ~ '^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab]')::int;
+
+SELECT 1/(COUNT(*) = 9)::int FROM information_schema.columns
+WHERE column_name = 'id'
+  AND column_default = 'uuid_generate_v7()'
+  AND table_name IN ('documents', 'document_versions', 'document_collection_contexts',
+                     'collections', 'collection_entities', 'collection_relationships',
+                     'entity_links', 'entity_operations', 'visibility_profiles');
+
+ROLLBACK;
@@ -0,0 +1,10 @@
+-- Verify unique (document_id, version) constraint on document_versions
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_constraint
+WHERE conname = 'uq_document_versions_doc_ver'
+  AND conrelid = 'document_versions'::regclass
+  AND contype = 'u';
+
+ROLLBACK;
@@ -0,0 +1,10 @@
+-- Verify MAIN storage for short description columns
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int FROM pg_attribute
+WHERE attrelid IN ('feedback'::regclass, 'graph_entities'::regclass)
+  AND attname = 'description'
+  AND attstorage = 'm';
+
+ROLLBACK;
@@ -0,0 +1,10 @@
+-- Verify BRIN indexes on audit_logs.action_time and feedback.created_at
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int FROM pg_class c
+JOIN pg_am a ON a.oid = c.relam
+WHERE c.relname IN ('idx_audit_logs_action_time_brin', 'idx_feedback_created_at_brin')
+  AND a.amname = 'brin';
+
+ROLLBACK;
@@ -0,0 +1,10 @@
+-- Verify user_roles_v and the dropped user_roles.role_name
+
+BEGIN;
+
+SELECT role_name FROM user_roles_v WHERE false;
+
+SELECT 1/(COUNT(*) = 0)::int FROM information_schema.columns
+WHERE table_name = 'user_roles' AND column_name = 'role_name';
+
+ROLLBACK;
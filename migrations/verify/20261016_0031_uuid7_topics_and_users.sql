@@ -0,0 +1,10 @@
+-- Verify UUIDv7 key defaults for topics, document_topics and users
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 3)::int FROM information_schema.columns
+WHERE column_name = 'id'
+  AND column_default = 'uuid_generate_v7()'
+  AND table_name IN ('topics', 'document_topics', 'users');
+
+ROLLBACK;
@@ -0,0 +1,16 @@
+-- Verify triggers maintaining collection_closure
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 2)::int FROM pg_trigger
+WHERE tgrelid = 'collections'::regclass
+  AND tgname IN ('trg_collection_closure_insert', 'trg_collection_closure_move');
+
+-- Every collection has its depth-0 row
+SELECT 1/(COUNT(*) = 0)::int
+FROM collections c
+LEFT JOIN collection_closure cc
+    ON cc.ancestor_id = c.id AND cc.descendant_id = c.id
+WHERE cc.ancestor_id IS NULL;
+
+ROLLBACK;
@@ -0,0 +1,11 @@
+-- Verify entity operations keyed for replay by id instead of by timestamp
+
+BEGIN;
+
+SELECT 1/(COUNT(*) = 0)::int FROM pg_constraint
+WHERE conname = 'uq_entity_operation';
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE indexname = 'idx_entity_operations_collection_id';
+
+ROLLBACK;
@@ -1,16 +1,50 @@
-from typing import Dict, Optional, Callable
+from typing import Any, Deque, Dict, Iterable, Mapping, Optional, Callable, Sequence, Tuple
 from dataclasses import dataclass
+from psycopg import sql as psycopg_sql
+from psycopg.types.json import Jsonb
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
-from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.engine import Engine, URL
 from contextlib import contextmanager
+from collections import deque
 import os
 import time
+import asyncio
 import logging
+import threading
+
+# Placeholder for attributes a repr() finds unloaded
+_NOT_LOADED = object()
+
+def _repr_value(value) -> str:
+    if value is _NOT_LOADED:
+        return "<not loaded>"
+    if type(value) is str:
+        return f"'{value}'"
+    return str(value)
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
-    pass
+
+    # Attributes shown by repr(), in order; each model sets its own
+    __repr_fields__: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = ", ".join(f"{name}={{}}" for name in cls.__repr_fields__)
+        cls._repr_format = f"<{cls.__name__}({fields})>"
+
+    def __repr__(self):
+        # Read straight from the instance dict: repr() of an expired or
+        # detached object (e.g. in a log line after commit) never emits
+        # SQL or raises, and skips the attribute instrumentation
+        loaded = self.__dict__
+        # Objects never loaded from the database have nothing to load yet
+        missing = _NOT_LOADED if loaded['_sa_instance_state'].key is not None else None
+        return self._repr_format.format(
+            *[_repr_value(loaded.get(name, missing)) for name in self.__repr_fields__]
+        )
 
 # Monitoring hooks - will be set by monitoring system
 _metrics_handler: Optional[Callable] = None
@@ -22,15 +56,120 @@ def set_monitoring_handlers(metrics_func: Callable, alert_func: Callable):
     _metrics_handler = metrics_func
     _alert_handler = alert_func
 
-@dataclass
+# Metrics recorded on the transaction path are buffered here while a
+# run_metrics_flusher() task is running, so a slow metrics backend never adds
+# latency to session_scope. Bounded: the oldest entries are dropped first.
+_metric_queue: Deque[Tuple[str, Optional[float], Dict]] = deque(maxlen=10000)
+_metrics_flusher_running = False
+
+def _record_metric(name: str, value: Optional[float], labels: Dict) -> None:
+    if _metrics_flusher_running:
+        _metric_queue.append((name, value, labels))
+    elif _metrics_handler is not None:
+        _metrics_handler(name, value, labels)
+
+def flush_metrics() -> int:
+    """Deliver all buffered metrics to the metrics handler; returns how many."""
+    count = 0
+    while _metric_queue:
+        name, value, labels = _metric_queue.popleft()
+        if _metrics_handler is not None:
+            _metrics_handler(name, value, labels)
+        count += 1
+    return count
+
+async def run_metrics_flusher(interval: float = 1.0) -> None:
+    """
+    Buffer transaction metrics and deliver them every ``interval`` seconds.
+
+    Run as a background task; cancel it to stop. Delivery happens in a
+    worker thread so the handler can block without stalling the event loop.
+    Anything still buffered is flushed when the task ends.
+    """
+    global _metrics_flusher_running
+    _metrics_flusher_running = True
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(flush_metrics)
+    finally:
+        _metrics_flusher_running = False
+        flush_metrics()
+
+def copy_rows(connection, table: str, columns: Sequence[str], records: Iterable[Sequence],
+              json_columns: Sequence[str] = ()) -> int:
+    """
+    Stream rows into a table with COPY FROM STDIN on an open connection.
+
+    The rows commit or roll back with the connection's transaction, so this
+    works on a session's connection (``session.connection()``) as well as
+    one from ``engine.begin()``.
+
+    Args:
+        connection: SQLAlchemy Connection to write on
+        table: Target table name, optionally schema-qualified ("schema.table")
+        columns: Column names, in the same order as each record
+        records: Row tuples (any iterable, consumed lazily); None is written as NULL
+        json_columns: Columns holding dicts or lists to write as JSON; COPY
+            has no column types to adapt them by
+
+    Returns:
+        Number of rows written
+    """
+    statement = psycopg_sql.SQL("COPY {} ({}) FROM STDIN").format(
+        psycopg_sql.Identifier(*table.split(".")),
+        psycopg_sql.SQL(", ").join(map(psycopg_sql.Identifier, columns)),
+    )
+    wrap_json = [name in json_columns for name in columns]
+    count = 0
+    with connection.connection.driver_connection.cursor() as cursor:
+        with cursor.copy(statement) as copy:
+            for record in records:
+                if json_columns:
+                    record = [
+                        Jsonb(value) if is_json and value is not None else value
+                        for value, is_json in zip(record, wrap_json)
+                    ]
+                copy.write_row(record)
+                count += 1
+    return count
+
+@dataclass(frozen=True, slots=True)
 class PostgresPoolConfig:
     pool_size: int = 5
     max_overflow: int = 5
     pool_timeout: int = 30
     pool_recycle: int = 1800
     pool_pre_ping: bool = True
+    # Reuse the most recently returned connection so idle ones can time out
+    pool_use_lifo: bool = True
+    # Open/close a connection per checkout; for short-lived CLI commands
+    use_null_pool: bool = False
+    # Bulk write tuning: rows per multi-row INSERT ... VALUES batch
+    insertmanyvalues_page_size: int = 1000
+    # Server-side prepare a statement after it has run this many times (psycopg 3)
+    prepare_threshold: Optional[int] = 5
+    # Compiled-SQL cache entries kept per engine (SQLAlchemy default: 500)
+    query_cache_size: int = 1200
+
+    @classmethod
+    def from_env(cls) -> 'PostgresPoolConfig':
+        """Create pool config from environment variables, sized for the host's CPUs."""
+        return cls(
+            pool_size=int(os.getenv('POSTGRES_POOL_SIZE', max(10, (os.cpu_count() or 4) * 2))),
+            max_overflow=int(os.getenv('POSTGRES_MAX_OVERFLOW', '20')),
+            pool_timeout=int(os.getenv('POSTGRES_POOL_TIMEOUT', '30')),
+            # Recycle before a proxy or server idle timeout closes the
+            # connection under the pool; pre-ping catches the rest
+            pool_recycle=int(os.getenv('POSTGRES_POOL_RECYCLE', '1800')),
+            pool_pre_ping=os.getenv('POSTGRES_POOL_PRE_PING', 'true').lower() == 'true',
+        )
+
+# Default server-side limits for application connections, in milliseconds
+STATEMENT_TIMEOUT_MS = 30000
+IDLE_IN_TRANSACTION_TIMEOUT_MS = 60000
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PostgresConnectionConfig:
     host: str
     port: int
@@ -39,24 +178,76 @@ class PostgresConnectionConfig:
     password: str
     schema: str = "public"
     ssl_mode: str = "prefer"
+    # Identifies this service's connections in pg_stat_activity
+    application_name: str = "axai-pg"
+    # Server-side limits in milliseconds (0 leaves the server default);
+    # bound how long a runaway query or an abandoned transaction can hold
+    # a pool slot
+    statement_timeout_ms: int = STATEMENT_TIMEOUT_MS
+    idle_in_transaction_timeout_ms: int = IDLE_IN_TRANSACTION_TIMEOUT_MS
 
     @classmethod
-    def from_env(cls) -> 'PostgresConnectionConfig':
-        """Create config from environment variables."""
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> 'PostgresConnectionConfig':
+        """
+        Create config from environment variables.
+
+        Args:
+            env: Snapshot of the environment to read; defaults to os.environ
+        """
+        if env is None:
+            env = os.environ
         return cls(
-            host=os.getenv('POSTGRES_HOST', 'localhost'),
-            port=int(os.getenv('POSTGRES_PORT', '5432')),
-            database=os.getenv('POSTGRES_DB', 'documents'),
-            username=os.getenv('POSTGRES_USER', 'postgres'),
-            password=os.getenv('POSTGRES_PASSWORD', ''),
-            schema=os.getenv('POSTGRES_SCHEMA', 'public'),
-            ssl_mode=os.getenv('POSTGRES_SSL_MODE', 'prefer')
+            host=env.get('POSTGRES_HOST', 'localhost'),
+            port=int(env.get('POSTGRES_PORT', '5432')),
+            database=env.get('POSTGRES_DB', 'documents'),
+            username=env.get('POSTGRES_USER', 'postgres'),
+            password=env.get('POSTGRES_PASSWORD', ''),
+            schema=env.get('POSTGRES_SCHEMA', 'public'),
+            ssl_mode=env.get('POSTGRES_SSL_MODE', 'prefer'),
+            application_name=env.get('POSTGRES_APPLICATION_NAME', 'axai-pg'),
+            statement_timeout_ms=int(env.get('DB_STMT_TIMEOUT_MS', STATEMENT_TIMEOUT_MS)),
+            idle_in_transaction_timeout_ms=int(env.get('DB_IDLE_TX_TIMEOUT_MS', IDLE_IN_TRANSACTION_TIMEOUT_MS)),
+        )
+
+    def connect_args(self) -> Dict[str, Any]:
+        """libpq parameters for each new connection; the server applies them at connection start."""
+        args: Dict[str, Any] = {
+            "sslmode": self.ssl_mode,
+            "application_name": self.application_name,
+        }
+        options = []
+        if self.statement_timeout_ms:
+            options.append(f"-c statement_timeout={self.statement_timeout_ms}")
+        if self.idle_in_transaction_timeout_ms:
+            options.append(f"-c idle_in_transaction_session_timeout={self.idle_in_transaction_timeout_ms}")
+        if options:
+            args["options"] = " ".join(options)
+        return args
+
+    def get_url(self, database: Optional[str] = None) -> URL:
+        """Build the SQLAlchemy URL (psycopg 3 driver), optionally for another database."""
+        return URL.create(
+            "postgresql+psycopg",
+            username=self.username,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=database or self.database,
         )
 
 class DatabaseManager:
     _instance = None
     _engine: Optional[Engine] = None
     _SessionFactory = None
+    _engine_key: Optional[Tuple] = None
+    _initialized = False
+    # Seconds a healthy check_health() result is reused
+    HEALTH_TTL = 5.0
+    _health_cache: Optional[Tuple[float, Dict]] = None
+    _health_lock: Optional[asyncio.Lock] = None
+    _health_lock_loop = None
+    # Guards singleton construction and (re-)initialization across threads
+    _lock = threading.Lock()
 
     def __init__(self):
         raise RuntimeError("Use DatabaseManager.get_instance()")
@@ -64,9 +255,12 @@ class DatabaseManager:
     @classmethod
     def get_instance(cls) -> 'DatabaseManager':
         if cls._instance is None:
-            cls._instance = object.__new__(cls)
-            cls._instance._engine = None
-            cls._instance._SessionFactory = None
+            with cls._lock:
+                if cls._instance is None:
+                    instance = object.__new__(cls)
+                    instance._engine = None
+                    instance._SessionFactory = None
+                    cls._instance = instance
         return cls._instance
 
     @classmethod
@@ -79,21 +273,78 @@ class DatabaseManager:
         if pool_config is None:
             pool_config = PostgresPoolConfig()
 
+        # Both configs are frozen: any change to credentials, connection
+        # arguments or pool settings needs an engine of its own
+        key = (conn_config, pool_config)
+
+        with cls._lock:
+            # Already initialized with these settings: keep the pooled engine
+            if instance._initialized and instance._engine_key == key:
+                return
+
+            # New settings: close the previous pool's connections rather than
+            # leaving them open until process exit
+            if instance._engine is not None:
+                instance._engine.dispose()
+
+            instance._engine = cls._create_engine(conn_config, pool_config)
+            instance._engine_key = key
+            # Committed objects keep their loaded state; serializing them
+            # after the scope ends must not trigger a SELECT per attribute.
+            instance._SessionFactory = sessionmaker(
+                bind=instance._engine, expire_on_commit=False
+            )
+            instance._health_cache = None
+            instance._initialized = True
+
+    def dispose(self) -> None:
+        """
+        Close the engine's pooled connections.
+
+        The manager is left uninitialized; the next ``initialize()`` builds
+        a fresh engine.
+        """
+        with self._lock:
+            if self._engine is not None:
+                self._engine.dispose()
+            self._engine = None
+            self._SessionFactory = None
+            self._engine_key = None
+            self._health_cache = None
+            self._initialized = False
+
+    @staticmethod
+    def _create_engine(
+        conn_config: PostgresConnectionConfig,
+        pool_config: PostgresPoolConfig
+    ) -> Engine:
         # Construct connection URL
-        url = f"postgresql://{conn_config.username}:{conn_config.password}@{conn_config.host}:{conn_config.port}/{conn_config.database}"
+        url = conn_config.get_url()
+
+        if pool_config.use_null_pool:
+            pool_args = {"poolclass": NullPool}
+        else:
+            pool_args = {
+                "pool_size": pool_config.pool_size,
+                "max_overflow": pool_config.max_overflow,
+                "pool_timeout": pool_config.pool_timeout,
+                "pool_recycle": pool_config.pool_recycle,
+                "pool_use_lifo": pool_config.pool_use_lifo,
+            }
 
         # Configure engine with retry mechanism
-        instance._engine = create_engine(
+        return create_engine(
             url,
-            pool_size=pool_config.pool_size,
-            max_overflow=pool_config.max_overflow,
-            pool_timeout=pool_config.pool_timeout,
-            pool_recycle=pool_config.pool_recycle,
             pool_pre_ping=pool_config.pool_pre_ping,
+            insertmanyvalues_page_size=pool_config.insertmanyvalues_page_size,
+            query_cache_size=pool_config.query_cache_size,
+            connect_args={
+                "prepare_threshold": pool_config.prepare_threshold,
+                **conn_config.connect_args(),
+            },
             execution_options={"schema_translate_map": {None: conn_config.schema}},
+            **pool_args,
         )
-        
-        instance._SessionFactory = sessionmaker(bind=instance._engine)
 
     @property
     def engine(self) -> Engine:
@@ -101,48 +352,122 @@ class DatabaseManager:
             raise RuntimeError("DatabaseManager not initialized. Call initialize() first.")
         return self._engine
 
+    def bulk_insert(self, table: str, columns: Sequence[str], records: Iterable[Sequence]) -> int:
+        """
+        Load rows into a table with a single COPY FROM STDIN, in one transaction.
+
+        Much faster than row-at-a-time (or even batched) INSERTs for bulk
+        loads, and holds only one pooled connection for the whole load.
+
+        Args:
+            table: Target table name, optionally schema-qualified ("schema.table")
+            columns: Column names, in the same order as each record
+            records: Row tuples (any iterable, consumed lazily)
+
+        Returns:
+            Number of rows written
+        """
+        with self.engine.begin() as conn:
+            return copy_rows(conn, table, columns, records)
+
     @contextmanager
-    def session_scope(self):
-        """Provide a transactional scope around a series of operations."""
+    def session_scope(self, no_expire: bool = True):
+        """
+        Provide a transactional scope around a series of operations.
+
+        Objects loaded in the scope are not expired on commit, so they can be
+        read (e.g. serialized into reports) after the scope ends without
+        reloading. Pass ``no_expire=False`` to expire everything after commit
+        when later reads must see fresh database state.
+        """
         if self._SessionFactory is None:
             raise RuntimeError("DatabaseManager not initialized. Call initialize() first.")
             
         session = self._SessionFactory()
-        start_time = time.time()
-        
+        start = time.perf_counter()
+        committed = False
+
         try:
             yield session
             session.commit()
-        except Exception as e:
+            committed = True
+            if not no_expire:
+                session.expire_all()
+        except Exception:
             session.rollback()
             # Monitor will catch and log the error
             raise
         finally:
-            duration = time.time() - start_time
-            if duration > 1.0:  # Log slow transactions
-                if _metrics_handler:
-                    _metrics_handler(
-                        "Transaction",
-                        duration,
-                        {"type": "transaction", "status": "commit" if not session.is_active else "rollback"}
-                    )
+            duration = time.perf_counter() - start
+            if _metrics_handler is not None and duration > 1.0:  # Log slow transactions
+                _record_metric(
+                    "Transaction",
+                    duration,
+                    {"type": "transaction", "status": "commit" if committed else "rollback"}
+                )
             session.close()
 
     async def check_health(self) -> Dict[str, any]:
-        """Check database connectivity and return health metrics."""
-        
+        """
+        Check database connectivity and return health metrics.
+
+        The blocking driver calls run in a worker thread, so awaiting this
+        doesn't stall the event loop while the database responds. A healthy
+        result is reused for HEALTH_TTL seconds, and concurrent callers share
+        a single in-flight check, so frequent probes don't each take a pooled
+        connection.
+        """
+        cached = self._cached_health()
+        if cached is not None:
+            return cached
+
+        async with self._get_health_lock():
+            # Another caller may have refreshed the result while we waited
+            cached = self._cached_health()
+            if cached is not None:
+                return cached
+
+            result = await asyncio.to_thread(self._check_health_sync)
+            if result["status"] == "healthy":
+                self._health_cache = (time.monotonic(), result)
+            return result
+
+    def _cached_health(self) -> Optional[Dict[str, any]]:
+        cache = self._health_cache
+        if cache is None or time.monotonic() - cache[0] >= self.HEALTH_TTL:
+            return None
+        # Pool counters are in-process, so report them fresh
+        return {**cache[1], "pool": self._pool_status()}
+
+    def _get_health_lock(self) -> asyncio.Lock:
+        # asyncio.Lock is bound to the loop it is first used on
+        loop = asyncio.get_running_loop()
+        if self._health_lock is None or self._health_lock_loop is not loop:
+            self._health_lock = asyncio.Lock()
+            self._health_lock_loop = loop
+        return self._health_lock
+
+    def _pool_status(self) -> Dict[str, int]:
+        pool = self.engine.pool
+        # NullPool (use_null_pool) keeps no connections to count
+        if not isinstance(pool, QueuePool):
+            return {}
+        return {
+            "size": pool.size(),
+            "checkedin": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "checkedout": pool.checkedout(),
+        }
+
+    def _check_health_sync(self) -> Dict[str, any]:
         try:
-            with self.session_scope() as session:
-                # Execute simple query to verify connection
-                session.execute("SELECT 1")
-                
+            # A bare autocommit connection is enough to verify connectivity:
+            # one round-trip, with no session, BEGIN/COMMIT or compilation
+            with self._engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("SELECT 1")
+
                 # Get connection pool status
-                pool_status = {
-                    "size": self.engine.pool.size(),
-                    "checkedin": self.engine.pool.checkedin(),
-                    "overflow": self.engine.pool.overflow(),
-                    "checkedout": self.engine.pool.checkedout(),
-                }
+                pool_status = self._pool_status()
                 
                 # Update monitoring metrics if handler is set
                 if _metrics_handler:
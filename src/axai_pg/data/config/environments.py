@@ -1,14 +1,25 @@
-from typing import Dict, Any
+from typing import Any, Mapping
+from types import MappingProxyType
 from dataclasses import dataclass
+import functools
 from .database import PostgresPoolConfig, PostgresConnectionConfig
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EnvironmentConfig:
     pool_config: PostgresPoolConfig
-    extra_settings: Dict[str, Any]
+    extra_settings: Mapping[str, Any]
+
+    def __post_init__(self):
+        # Presets are cached and shared, so the settings must be read-only too
+        object.__setattr__(self, "extra_settings", MappingProxyType(dict(self.extra_settings)))
+
+    def __hash__(self):
+        # A mappingproxy is not hashable; the settings values are scalars
+        return hash((self.pool_config, frozenset(self.extra_settings.items())))
 
 class Environments:
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_development_config() -> EnvironmentConfig:
         """Development environment with minimal pool settings."""
         return EnvironmentConfig(
@@ -27,6 +38,7 @@ class Environments:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_test_config() -> EnvironmentConfig:
         """Test environment with minimal pool settings."""
         return EnvironmentConfig(
@@ -45,36 +57,38 @@ class Environments:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_production_config() -> EnvironmentConfig:
-        """Production environment with conservative initial pool settings."""
+        """Production environment; pool sizing comes from POSTGRES_POOL_* or the CPU count."""
         return EnvironmentConfig(
-            pool_config=PostgresPoolConfig(
-                pool_size=5,
-                max_overflow=5,
-                pool_timeout=30,
-                pool_recycle=1800,
-                pool_pre_ping=True
-            ),
+            pool_config=PostgresPoolConfig.from_env(),
             extra_settings={
                 "echo": False,
                 "echo_pool": False,
                 "timeout": 60,
-                "pool_reset_on_return": "commit",  # Reset transaction state on connection return
+                "pool_reset_on_return": "rollback",  # Discard any unfinished transaction on connection return
                 "max_identifier_length": 63,  # PostgreSQL maximum identifier length
             }
         )
 
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop the cached presets, e.g. after POSTGRES_POOL_* variables change."""
+        cls.get_development_config.cache_clear()
+        cls.get_test_config.cache_clear()
+        cls.get_production_config.cache_clear()
+
     @classmethod
     def get_config(cls, environment: str) -> EnvironmentConfig:
         """Get configuration for specified environment."""
-        env_map = {
-            "development": cls.get_development_config,
-            "test": cls.get_test_config,
-            "production": cls.get_production_config,
-        }
-        
-        config_getter = env_map.get(environment.lower())
+        config_getter = _ENV_MAP.get(environment.lower())
         if not config_getter:
             raise ValueError(f"Unknown environment: {environment}")
             
         return config_getter()
+
+_ENV_MAP = {
+    "development": Environments.get_development_config,
+    "test": Environments.get_test_config,
+    "production": Environments.get_production_config,
+}
@@ -1,10 +1,12 @@
 from typing import Optional
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .database import PostgresConnectionConfig, PostgresPoolConfig
 from .environments import Environments, EnvironmentConfig
 
-@dataclass
+_VALID_ENVS = frozenset(("development", "test", "production"))
+
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     """Application settings including database configuration."""
     environment: str
@@ -13,33 +15,36 @@ class AppSettings:
     debug_mode: bool
     log_sql: bool
     connection_timeout: int
+    _engine_settings: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    # Connection settings without a usable default
+    REQUIRED_ENV = ("POSTGRES_HOST", "POSTGRES_DB", "POSTGRES_USER", "POSTGRES_PASSWORD")
 
     @classmethod
     def load_from_env(cls) -> 'AppSettings':
         """Load and validate all application settings from environment variables."""
+        # Read from one snapshot so concurrent changes can't mix two environments
+        env = dict(os.environ)
+
         # Determine environment
-        environment = os.getenv('APP_ENV', 'development').lower()
-        if environment not in ('development', 'test', 'production'):
+        environment = env.get('APP_ENV', 'development').lower()
+        if environment not in _VALID_ENVS:
             raise ValueError(f"Invalid environment: {environment}")
 
+        missing = [name for name in cls.REQUIRED_ENV if name not in env]
+        if missing:
+            raise ValueError(f"Required environment variables are not set: {', '.join(missing)}")
+
         # Load environment-specific configuration
         env_config = Environments.get_config(environment)
 
         # Load database configuration
-        conn_config = PostgresConnectionConfig(
-            host=cls._require_env('POSTGRES_HOST'),
-            port=int(os.getenv('POSTGRES_PORT', '5432')),
-            database=cls._require_env('POSTGRES_DB'),
-            username=cls._require_env('POSTGRES_USER'),
-            password=cls._require_env('POSTGRES_PASSWORD'),
-            schema=os.getenv('POSTGRES_SCHEMA', 'public'),
-            ssl_mode=os.getenv('POSTGRES_SSL_MODE', 'prefer')
-        )
+        conn_config = PostgresConnectionConfig.from_env(env)
 
         # Load additional settings
-        debug_mode = os.getenv('DEBUG', 'false').lower() == 'true'
-        log_sql = os.getenv('LOG_SQL', 'false').lower() == 'true'
-        connection_timeout = int(os.getenv('DB_CONNECTION_TIMEOUT', '30'))
+        debug_mode = env.get('DEBUG', 'false').lower() == 'true'
+        log_sql = env.get('LOG_SQL', 'false').lower() == 'true'
+        connection_timeout = int(env.get('DB_CONNECTION_TIMEOUT', '30'))
 
         return cls(
             environment=environment,
@@ -50,13 +55,15 @@ class AppSettings:
             connection_timeout=connection_timeout
         )
 
-    @staticmethod
-    def _require_env(name: str) -> str:
-        """Get a required environment variable or raise an error."""
-        value = os.getenv(name)
-        if value is None:
-            raise ValueError(f"Required environment variable {name} is not set")
-        return value
+    # Server-side timeouts travel with conn_config, so DatabaseManager
+    # engines get them too
+    @property
+    def statement_timeout_ms(self) -> int:
+        return self.conn_config.statement_timeout_ms
+
+    @property
+    def idle_in_transaction_timeout_ms(self) -> int:
+        return self.conn_config.idle_in_transaction_timeout_ms
 
     def validate(self) -> None:
         """Validate the configuration settings."""
@@ -80,9 +87,21 @@ class AppSettings:
         # Validate timeouts
         if self.connection_timeout < 1:
             raise ValueError("Connection timeout must be positive")
+        if self.statement_timeout_ms < 0 or self.idle_in_transaction_timeout_ms < 0:
+            raise ValueError("Statement and idle transaction timeouts must be non-negative")
 
     def get_engine_settings(self) -> dict:
-        """Get SQLAlchemy engine configuration dictionary."""
+        """
+        Get SQLAlchemy engine configuration dictionary.
+
+        Built once per settings instance; the returned dict is shared, so
+        copy it before modifying.
+        """
+        if self._engine_settings is None:
+            object.__setattr__(self, "_engine_settings", self._build_engine_settings())
+        return self._engine_settings
+
+    def _build_engine_settings(self) -> dict:
         return {
             "pool_size": self.env_config.pool_config.pool_size,
             "max_overflow": self.env_config.pool_config.max_overflow,
@@ -92,7 +111,7 @@ class AppSettings:
             "echo": self.log_sql,
             "connect_args": {
                 "connect_timeout": self.connection_timeout,
-                "sslmode": self.conn_config.ssl_mode
+                **self.conn_config.connect_args(),
             },
             **self.env_config.extra_settings
         }
@@ -118,4 +137,5 @@ class Settings:
     def reload(cls) -> AppSettings:
         """Force reload settings from environment."""
         cls._instance = None
+        Environments.cache_clear()
         return cls.load()
@@ -7,21 +7,25 @@ from ..config.database import Base
 # Import all models for easy access
 from .organization import Organization
 from .user import User
-from .document import Document, DocumentVersion
+from .document import Document, DocumentVersion, DocumentTag
 from .summary import Summary
 from .graph import GraphEntity, GraphRelationship, SourceType
 from .topic import Topic, DocumentTopic
 from .base import BaseModel
+from .ids import uuid7
 from .security import (
     Role,
     UserRole,
     RolePermission,
     AuditLog,
     RateLimit,
-    SecurityPolicy
+    SecurityPolicy,
+    PermissionType,
+    PolicyType
 )
 from .collection import (
     Collection,
+    CollectionClosure,
     CollectionEntity,
     CollectionRelationship,
     EntityLink,
@@ -36,10 +40,12 @@ from .feedback import Feedback
 __all__ = [
     'Base',
     'BaseModel',
+    'uuid7',
     'User',
     'Organization',
     'Document',
     'DocumentVersion',
+    'DocumentTag',
     'Summary',
     'Topic',
     'DocumentTopic',
@@ -52,7 +58,10 @@ __all__ = [
     'AuditLog',
     'RateLimit',
     'SecurityPolicy',
+    'PermissionType',
+    'PolicyType',
     'Collection',
+    'CollectionClosure',
     'CollectionEntity',
     'CollectionRelationship',
     'EntityLink',
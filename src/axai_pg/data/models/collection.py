@@ -1,10 +1,12 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, CheckConstraint, Index, Boolean, Table, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, CheckConstraint, Index, Boolean, Table, PrimaryKeyConstraint, UniqueConstraint, Enum as SQLEnum
+from sqlalchemy import DDL, event, select, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, insert as pg_insert
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 import enum
 from ..config.database import Base
+# SourceType is defined once in graph.py; kept importable from here
+from .graph import SourceType  # noqa: F401
 
 # Association table for many-to-many relationship between documents and collections
 document_collection_association = Table(
@@ -23,9 +25,10 @@ class Collection(Base):
     Collections can generate merged entity views and manage visibility profiles.
     """
     __tablename__ = 'collections'
+    __repr_fields__ = ('id', 'name')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     name = Column(Text, nullable=False)
@@ -36,7 +39,8 @@ class Collection(Base):
     org_id = Column(UUID(as_uuid=True), ForeignKey('organizations.id', ondelete='CASCADE'), nullable=True)
 
     # Hierarchy (from market-ui)
-    parent_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE', use_alter=True, name='fk_collection_parent'), nullable=True)
+    # Deferred to commit so a hierarchy can be loaded in any row order
+    parent_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE', name='fk_collection_parent', deferrable=True, initially='DEFERRED'), nullable=True)
 
     # Soft Delete (from market-ui)
     is_deleted = Column(Boolean, nullable=False, default=False)
@@ -72,18 +76,132 @@ class Collection(Base):
         Index('idx_collections_org_id', 'org_id'),
         Index('idx_collections_is_graph_generated', 'is_graph_generated'),
         Index('idx_collections_parent_id', 'parent_id'),
-        Index('idx_collections_is_deleted', 'is_deleted'),
+        # Partial indexes covering only live (not soft-deleted) collections
+        Index('idx_collections_live_org', 'org_id', postgresql_where=text('is_deleted = false')),
+        Index('idx_collections_live_parent', 'parent_id', postgresql_where=text('is_deleted = false')),
     )
 
-    def __repr__(self):
-        return f"<Collection(id={self.id}, name='{self.name}')>"
+    @classmethod
+    def subtree(cls, ancestor_id, include_self=True):
+        """
+        Select a collection's descendants through the closure table.
 
+        Args:
+            ancestor_id: ID of the collection at the root of the subtree
+            include_self: Whether the root collection itself is returned
 
-class SourceType(enum.Enum):
-    """Enum for entity/relationship source types"""
-    file = "file"
-    collection_generated = "collection_generated"
-    document = "document"
+        Returns:
+            A ``select(Collection)`` joined to ``collection_closure``
+        """
+        closure = CollectionClosure.__table__
+        query = select(cls).join(closure, closure.c.descendant_id == cls.id)\
+            .where(closure.c.ancestor_id == ancestor_id)
+        if not include_self:
+            query = query.where(closure.c.depth > 0)
+        return query
+
+
+class CollectionClosure(Base):
+    """
+    Transitive closure of the collection hierarchy.
+
+    Holds one row per (ancestor, descendant) pair, including a depth-0 row
+    linking each collection to itself, so a whole subtree is read with one
+    indexed join instead of a recursive walk over ``parent_id``. Rows are
+    maintained by the triggers on ``collections`` below and removed by the
+    foreign key cascades when a collection is deleted.
+    """
+    __tablename__ = 'collection_closure'
+    __repr_fields__ = ('ancestor_id', 'descendant_id', 'depth')
+
+    ancestor_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=False)
+    descendant_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=False)
+    depth = Column(Integer, nullable=False)
+
+    # Table Constraints
+    __table_args__ = (
+        PrimaryKeyConstraint('ancestor_id', 'descendant_id'),
+        CheckConstraint("depth >= 0", name="collection_closure_depth_non_negative"),
+        Index('idx_closure_descendant', 'descendant_id'),
+    )
+
+
+# The closure is kept by triggers on collections, so it also follows Core
+# inserts, COPY loads and rows whose parent arrives later in the transaction
+# (parent_id is deferrable). A new collection first adopts the subtrees of
+# children that were inserted before it, then links its whole subtree to
+# the parent's ancestors; whichever of parent and child comes second makes
+# the link, so each path is added once.
+COLLECTION_CLOSURE_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION collection_closure_link(collection_id uuid, parent_id uuid)
+RETURNS void AS $$
+    INSERT INTO collection_closure (ancestor_id, descendant_id, depth)
+    SELECT above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+    FROM collection_closure above, collection_closure below
+    WHERE above.descendant_id = parent_id AND below.ancestor_id = collection_id
+    ON CONFLICT DO NOTHING;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION collection_closure_after_insert()
+RETURNS trigger AS $$
+BEGIN
+    INSERT INTO collection_closure (ancestor_id, descendant_id, depth)
+    VALUES (NEW.id, NEW.id, 0)
+    ON CONFLICT DO NOTHING;
+
+    -- Children loaded before their parent
+    INSERT INTO collection_closure (ancestor_id, descendant_id, depth)
+    SELECT NEW.id, below.descendant_id, below.depth + 1
+    FROM collections child
+    JOIN collection_closure below ON below.ancestor_id = child.id
+    WHERE child.parent_id = NEW.id AND child.id <> NEW.id
+    ON CONFLICT DO NOTHING;
+
+    IF NEW.parent_id IS NOT NULL THEN
+        PERFORM collection_closure_link(NEW.id, NEW.parent_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION collection_closure_after_move()
+RETURNS trigger AS $$
+BEGIN
+    -- Detach the subtree from its old ancestors, keeping its internal paths
+    DELETE FROM collection_closure
+    WHERE descendant_id IN (SELECT descendant_id FROM collection_closure WHERE ancestor_id = NEW.id)
+      AND ancestor_id NOT IN (SELECT descendant_id FROM collection_closure WHERE ancestor_id = NEW.id);
+
+    IF NEW.parent_id IS NOT NULL THEN
+        PERFORM collection_closure_link(NEW.id, NEW.parent_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+COLLECTION_CLOSURE_TRIGGERS = """
+CREATE TRIGGER trg_collection_closure_insert
+    AFTER INSERT ON collections
+    FOR EACH ROW EXECUTE FUNCTION collection_closure_after_insert();
+
+CREATE TRIGGER trg_collection_closure_move
+    AFTER UPDATE OF parent_id ON collections
+    FOR EACH ROW WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+    EXECUTE FUNCTION collection_closure_after_move();
+"""
+
+event.listen(CollectionClosure.__table__, 'after_create', DDL(COLLECTION_CLOSURE_FUNCTIONS))
+event.listen(CollectionClosure.__table__, 'after_create', DDL(COLLECTION_CLOSURE_TRIGGERS))
+event.listen(
+    CollectionClosure.__table__, 'before_drop',
+    DDL(
+        "DROP TRIGGER IF EXISTS trg_collection_closure_insert ON collections; "
+        "DROP TRIGGER IF EXISTS trg_collection_closure_move ON collections; "
+        "DROP FUNCTION IF EXISTS collection_closure_after_insert(), collection_closure_after_move(), "
+        "collection_closure_link(uuid, uuid)"
+    ),
+)
 
 
 class CollectionEntity(Base):
@@ -94,9 +212,10 @@ class CollectionEntity(Base):
     providing a unified view of entities across documents.
     """
     __tablename__ = 'collection_entities'
+    __repr_fields__ = ('id', 'entity_id', 'name')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=False)
@@ -106,10 +225,10 @@ class CollectionEntity(Base):
     # Merged Data
     name = Column(Text, nullable=False)
     description = Column(Text)
-    properties = Column(JSON)
+    properties = Column(JSONB)
 
     # Source Tracking
-    source_entity_ids = Column(JSON)  # Array of original entity IDs that were merged
+    source_entity_ids = Column(JSONB)  # Array of original entity IDs that were merged
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -126,11 +245,10 @@ class CollectionEntity(Base):
         Index('idx_collection_entities_collection_id', 'collection_id'),
         Index('idx_collection_entities_entity_id', 'entity_id'),
         Index('idx_collection_entities_entity_type', 'entity_type'),
+        Index('idx_collection_entities_properties_gin', 'properties', postgresql_using='gin',
+              postgresql_ops={'properties': 'jsonb_path_ops'}),
     )
 
-    def __repr__(self):
-        return f"<CollectionEntity(id={self.id}, entity_id='{self.entity_id}', name='{self.name}')>"
-
 
 class CollectionRelationship(Base):
     """
@@ -140,9 +258,10 @@ class CollectionRelationship(Base):
     potentially merging relationships from multiple source files.
     """
     __tablename__ = 'collection_relationships'
+    __repr_fields__ = ('collection_id', 'source_entity_id', 'target_entity_id')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=False)
@@ -152,10 +271,10 @@ class CollectionRelationship(Base):
 
     # Metadata
     description = Column(Text)
-    properties = Column(JSON)
+    properties = Column(JSONB)
 
     # Source Tracking
-    source_relationship_ids = Column(JSON)  # Array of original relationship IDs
+    source_relationship_ids = Column(JSONB)  # Array of original relationship IDs
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -168,14 +287,13 @@ class CollectionRelationship(Base):
     __table_args__ = (
         CheckConstraint("length(trim(source_entity_id)) > 0", name="collection_relationships_source_not_empty"),
         CheckConstraint("length(trim(target_entity_id)) > 0", name="collection_relationships_target_not_empty"),
-        Index('idx_collection_relationships_collection_id', 'collection_id'),
+        # Covering index: a collection's edges are read without heap fetches
+        Index('idx_collection_relationships_collection_id', 'collection_id',
+              postgresql_include=['source_entity_id', 'target_entity_id', 'relationship_type']),
         Index('idx_collection_relationships_source', 'source_entity_id'),
         Index('idx_collection_relationships_target', 'target_entity_id'),
     )
 
-    def __repr__(self):
-        return f"<CollectionRelationship(collection_id={self.collection_id}, {self.source_entity_id} -> {self.target_entity_id})>"
-
 
 class EntityLink(Base):
     """
@@ -185,9 +303,10 @@ class EntityLink(Base):
     enabling tracking of which source entities contribute to merged views.
     """
     __tablename__ = 'entity_links'
+    __repr_fields__ = ('graph_entity_id', 'collection_entity_id')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     graph_entity_id = Column(UUID(as_uuid=True), ForeignKey('graph_entities.id', ondelete='CASCADE'), nullable=False)
@@ -207,12 +326,30 @@ class EntityLink(Base):
 
     # Table Constraints
     __table_args__ = (
-        Index('idx_entity_links_graph_entity_id', 'graph_entity_id'),
+        # uq_entity_link also serves lookups by graph_entity_id
+        UniqueConstraint('graph_entity_id', 'collection_entity_id', name='uq_entity_link'),
         Index('idx_entity_links_collection_entity_id', 'collection_entity_id'),
     )
 
-    def __repr__(self):
-        return f"<EntityLink(graph_entity_id={self.graph_entity_id}, collection_entity_id={self.collection_entity_id})>"
+    @classmethod
+    def bulk_upsert(cls, session, rows):
+        """
+        Insert many links in one batched statement, skipping existing pairs.
+
+        Args:
+            session: Active SQLAlchemy session
+            rows: Dicts of column values; each needs graph_entity_id and
+                collection_entity_id
+
+        Returns:
+            Number of links actually inserted
+        """
+        if not rows:
+            return 0
+        stmt = pg_insert(cls).on_conflict_do_nothing(
+            index_elements=['graph_entity_id', 'collection_entity_id']
+        ).returning(cls.id)
+        return len(session.scalars(stmt, rows).all())
 
 
 class OperationType(enum.Enum):
@@ -232,9 +369,10 @@ class EntityOperation(Base):
     including merges, splits, and manual edits.
     """
     __tablename__ = 'entity_operations'
+    __repr_fields__ = ('id', 'operation_type', 'entity_id')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=False)
@@ -243,7 +381,7 @@ class EntityOperation(Base):
 
     # Operation Details
     description = Column(Text)
-    details = Column(JSON)  # Structured operation details
+    details = Column(JSONB)  # Structured operation details
 
     # Actor
     performed_by_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True)
@@ -259,11 +397,35 @@ class EntityOperation(Base):
     __table_args__ = (
         Index('idx_entity_operations_collection_id', 'collection_id'),
         Index('idx_entity_operations_entity_id', 'entity_id'),
-        Index('idx_entity_operations_performed_at', 'performed_at'),
+        # Append-only audit trail: BRIN is a fraction of a btree's size for time ranges
+        Index('idx_entity_operations_performed_at_brin', 'performed_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+        Index('idx_entity_operations_details_gin', 'details', postgresql_using='gin',
+              postgresql_ops={'details': 'jsonb_path_ops'}),
     )
 
-    def __repr__(self):
-        return f"<EntityOperation(id={self.id}, operation_type={self.operation_type}, entity_id='{self.entity_id}')>"
+    @classmethod
+    def bulk_insert(cls, session, rows):
+        """
+        Record many operations in one batched statement.
+
+        Rows whose ``id`` is already recorded are skipped, so a batch built
+        with ids up front (``uuid7()``) can be replayed harmlessly. Rows
+        without an id get one from the database and are always recorded,
+        even when the same operation on the same entity repeats within one
+        transaction.
+
+        Args:
+            session: Active SQLAlchemy session
+            rows: Dicts of column values
+
+        Returns:
+            Number of operations actually inserted
+        """
+        if not rows:
+            return 0
+        stmt = pg_insert(cls).on_conflict_do_nothing(index_elements=['id']).returning(cls.id)
+        return len(session.scalars(stmt, rows).all())
 
 
 class DocumentCollectionContext(Base):
@@ -274,9 +436,10 @@ class DocumentCollectionContext(Base):
     allowing different views or summaries per collection.
     """
     __tablename__ = 'document_collection_contexts'
+    __repr_fields__ = ('document_id', 'collection_id')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=False)
@@ -284,7 +447,7 @@ class DocumentCollectionContext(Base):
 
     # Context Data
     context_summary = Column(Text)
-    context_metadata = Column(JSON)
+    context_metadata = Column(JSONB)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -300,9 +463,6 @@ class DocumentCollectionContext(Base):
         Index('idx_document_collection_contexts_collection_id', 'collection_id'),
     )
 
-    def __repr__(self):
-        return f"<DocumentCollectionContext(document_id={self.document_id}, collection_id={self.collection_id})>"
-
 
 class VisibilityProfile(Base):
     """
@@ -312,9 +472,10 @@ class VisibilityProfile(Base):
     Can be shared across collections or document-specific.
     """
     __tablename__ = 'visibility_profiles'
+    __repr_fields__ = ('id', 'name')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     name = Column(Text, nullable=False)
@@ -324,24 +485,27 @@ class VisibilityProfile(Base):
     owner_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
 
     # Scope (from market-ui) - Links to specific file or collection
-    file_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE', use_alter=True, name='fk_visibility_profile_document'), nullable=True)
-    collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE', use_alter=True, name='fk_visibility_profile_collection'), nullable=True)
+    # documents <-> visibility_profiles is the only FK cycle, so this is the
+    # one constraint added by ALTER after both tables exist; both sides are
+    # checked at commit so a document and its default profile insert together
+    file_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE', use_alter=True, name='fk_visibility_profile_document', deferrable=True, initially='DEFERRED'), nullable=True)
+    collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE', name='fk_visibility_profile_collection'), nullable=True)
     version_id = Column(Text, nullable=True)  # "DEFAULT" or collection_id
 
     # Profile Type (from market-ui)
     profile_type = Column(String(20), nullable=False)  # 'FILE', 'COLLECTION', 'GLOBAL'
 
     # Visibility Configuration
-    visible_entity_types = Column(JSON)  # Array of entity types to show
-    visible_relationship_types = Column(JSON)  # Array of relationship types to show
-    hidden_entities = Column(JSON)  # Array of specific entity IDs to hide
-    hidden_relationships = Column(JSON)  # Array of specific relationship IDs to hide
+    visible_entity_types = Column(JSONB)  # Array of entity types to show
+    visible_relationship_types = Column(JSONB)  # Array of relationship types to show
+    hidden_entities = Column(JSONB)  # Array of specific entity IDs to hide
+    hidden_relationships = Column(JSONB)  # Array of specific relationship IDs to hide
 
     # Extended visibility config (from market-ui)
-    all_entities = Column(JSON)  # All available entity types/IDs
-    enabled_entities = Column(JSON)  # Currently enabled entity types/IDs
-    all_relationships = Column(JSON)  # All available relationship types
-    enabled_relationships = Column(JSON)  # Currently enabled relationship types
+    all_entities = Column(JSONB)  # All available entity types/IDs
+    enabled_entities = Column(JSONB)  # Currently enabled entity types/IDs
+    all_relationships = Column(JSONB)  # All available relationship types
+    enabled_relationships = Column(JSONB)  # Currently enabled relationship types
 
     # Flags (from market-ui)
     auto_include_new = Column(Boolean, nullable=False, default=True)  # Auto-include new entities
@@ -366,7 +530,10 @@ class VisibilityProfile(Base):
         Index('idx_visibility_profiles_owner_id', 'owner_id'),
         Index('idx_visibility_profiles_file_id', 'file_id'),
         Index('idx_visibility_profiles_collection_id', 'collection_id'),
+        Index('idx_visibility_profiles_visible_entity_types_gin', 'visible_entity_types',
+              postgresql_using='gin', postgresql_ops={'visible_entity_types': 'jsonb_path_ops'}),
+        Index('idx_visibility_profiles_hidden_entities_gin', 'hidden_entities',
+              postgresql_using='gin', postgresql_ops={'hidden_entities': 'jsonb_path_ops'}),
+        Index('idx_visibility_profiles_enabled_entities_gin', 'enabled_entities',
+              postgresql_using='gin', postgresql_ops={'enabled_entities': 'jsonb_path_ops'}),
     )
-
-    def __repr__(self):
-        return f"<VisibilityProfile(id={self.id}, name='{self.name}')>"
@@ -1,8 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, CheckConstraint, Index, Boolean
-from sqlalchemy.dialects.postgresql import UUID, JSONB, JSON
+from sqlalchemy import Column, Integer, SmallInteger, String, Text, DateTime, ForeignKey, CheckConstraint, UniqueConstraint, Index, Boolean, Computed, LargeBinary, select, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-import uuid
+from sqlalchemy.orm import relationship, deferred
 from ..config.database import Base
 
 class Document(Base):
@@ -17,16 +16,18 @@ class Document(Base):
     Includes file storage metadata, versioning, summaries, topics, and graph relationships.
     """
     __tablename__ = 'documents'
+    __repr_fields__ = ('id', 'title', 'version')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Identification Fields
     title = Column(Text, nullable=False)
     filename = Column(Text, nullable=False, index=True)  # From market-ui: File storage name
 
     # Content (nullable for binary files)
-    content = Column(Text, nullable=True)  # Made nullable for binary file support
+    # Deferred: large text stays out of list queries until accessed (or undefer_group('body'))
+    content = deferred(Column(Text, nullable=True), group='body')  # Made nullable for binary file support
 
     # Ownership & Organization (both nullable for flexibility)
     owner_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
@@ -48,13 +49,13 @@ class Document(Base):
     deleted_at = Column(DateTime(timezone=True))  # From market-ui: Deletion timestamp
 
     # Versioning
-    version = Column(Integer, nullable=False, default=1)
+    version = Column(SmallInteger, nullable=False, default=1)  # 2 bytes; caps a document at 32767 versions
     version_id = Column(String)  # From market-ui: Version identifier (collection_id or "DEFAULT")
     description = Column(Text)  # From market-ui: Document description
 
     # Content Analysis (from axai-pg)
     word_count = Column(Integer)
-    content_hash = Column(String(64))
+    content_hash = Column(LargeBinary(32))  # Raw SHA-256 digest (hashlib.sha256(...).digest())
 
     # Source & References
     source = Column(String(100))  # Origin system
@@ -62,40 +63,56 @@ class Document(Base):
 
     # Search & Metadata (from market-ui)
     topics = Column(Text)  # Legacy: Comma-separated topics
-    tags = Column(JSON)  # Array of tags
-    key_terms = Column(JSON)  # Array of key terms
-    linked_docs = Column(JSON)  # Array of linked document IDs
-    summary = Column(Text)  # Quick summary text (separate from Summary table)
+    # Transitional: superseded by the document_tags table (tags_rel); deferred
+    # until remaining readers move over and the column is dropped
+    tags = deferred(Column(JSONB))  # Array of tags
+    key_terms = Column(JSONB)  # Array of key terms
+    linked_docs = Column(JSONB)  # Array of linked document IDs
+    summary = deferred(Column(Text), group='body')  # Quick summary text (separate from Summary table)
 
     # Legacy Graph Data (from market-ui - deprecated, use graph_entities table)
-    graph_nodes = Column(JSON)  # Legacy graph nodes
-    graph_relationships = Column(JSON)  # Legacy graph relationships
+    # Deferred so these blobs are never fetched by default; to be dropped once
+    # no caller reads them
+    graph_nodes = deferred(Column(JSONB), group='legacy_graph')  # Legacy graph nodes
+    graph_relationships = deferred(Column(JSONB), group='legacy_graph')  # Legacy graph relationships
 
     # Graph Management (from market-ui)
-    default_visibility_profile_id = Column(UUID(as_uuid=True), ForeignKey('visibility_profiles.id'))
+    default_visibility_profile_id = Column(UUID(as_uuid=True), ForeignKey('visibility_profiles.id', deferrable=True, initially='DEFERRED'))
     entities_last_updated = Column(DateTime(timezone=True))
     relationships_last_updated = Column(DateTime(timezone=True))
 
     # Metadata
     document_metadata = Column(JSONB, name='metadata')
 
+    # Full-text search: maintained by PostgreSQL from title and content
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))", persisted=True),
+    ))
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    owner = relationship("User", back_populates="owned_documents")
-    organization = relationship("Organization", back_populates="documents")
-    versions = relationship("DocumentVersion", back_populates="document", lazy="dynamic", cascade="all, delete-orphan")
-    summaries = relationship("Summary", back_populates="document", lazy="dynamic", cascade="all, delete-orphan")
-    topics_rel = relationship("DocumentTopic", back_populates="document", lazy="dynamic", cascade="all, delete-orphan")
-    graph_entity = relationship("GraphEntity", back_populates="document", foreign_keys="GraphEntity.document_id", uselist=False, cascade="all, delete-orphan")
-    graph_relationships_rel = relationship("GraphRelationship", back_populates="document", foreign_keys="GraphRelationship.document_id", lazy="dynamic", cascade="all, delete-orphan")
+    # Per-document children are small, so they load with one
+    # ``WHERE document_id IN (...)`` query per batch of documents instead of
+    # one query per document. Unbounded sets (collections, graph_entities)
+    # stay dynamic. Owner and organization are read with nearly every
+    # document, so they are batched the same way.
+    owner = relationship("User", back_populates="owned_documents", lazy="selectin")
+    organization = relationship("Organization", back_populates="documents", lazy="selectin")
+    versions = relationship("DocumentVersion", back_populates="document", lazy="selectin", cascade="all, delete-orphan")
+    summaries = relationship("Summary", back_populates="document", lazy="selectin", cascade="all, delete-orphan")
+    topics_rel = relationship("DocumentTopic", back_populates="document", lazy="selectin", cascade="all, delete-orphan")
+    tags_rel = relationship("DocumentTag", back_populates="document", lazy="selectin", cascade="all, delete-orphan")
+    graph_relationships_rel = relationship("GraphRelationship", back_populates="document", foreign_keys="GraphRelationship.document_id", lazy="selectin", cascade="all, delete-orphan")
 
     # From market-ui
     collections = relationship("Collection", secondary="document_collection_association", back_populates="documents", lazy="dynamic")
-    graph_entities = relationship("GraphEntity", back_populates="source_file", lazy="dynamic", foreign_keys="GraphEntity.source_file_id")
-    collection_contexts = relationship("DocumentCollectionContext", back_populates="document", lazy="dynamic", cascade="all, delete-orphan")
+    # The database cascades entity deletes; the ORM does not load them first
+    graph_entities = relationship("GraphEntity", back_populates="source_file", lazy="dynamic", foreign_keys="GraphEntity.source_file_id", cascade="all, delete-orphan", passive_deletes=True)
+    collection_contexts = relationship("DocumentCollectionContext", back_populates="document", lazy="selectin", cascade="all, delete-orphan")
     default_visibility_profile = relationship("VisibilityProfile", foreign_keys=[default_visibility_profile_id])
 
     # Table Constraints
@@ -106,39 +123,88 @@ class Document(Base):
             name="documents_valid_status"
         ),
         CheckConstraint("version > 0", name="documents_valid_version"),
+        CheckConstraint("octet_length(content_hash) = 32", name="documents_content_hash_sha256"),
         CheckConstraint(
             "processing_status IN ('pending', 'processing', 'complete', 'error')",
             name="documents_valid_processing_status"
         ),
-        Index('idx_documents_org_id', 'org_id'),
         Index('idx_documents_owner_id', 'owner_id'),
-        Index('idx_documents_type', 'document_type'),
-        Index('idx_documents_status', 'status'),
-        Index('idx_documents_org_status', 'org_id', 'status'),
-        Index('idx_documents_is_deleted', 'is_deleted'),
+        # Type/status filters are always org-scoped and exclude soft-deleted rows
+        Index('idx_documents_org_type_status', 'org_id', 'document_type', 'status',
+              postgresql_where=text('is_deleted = false')),
+        # Covering index: org/status listings ordered by updated_at are
+        # answered by an index-only scan without heap fetches. Its leading
+        # org_id also serves plain org_id lookups and the organizations FK
+        Index('idx_documents_org_status', 'org_id', 'status', 'updated_at',
+              postgresql_include=['id', 'title', 'document_type', 'processing_status']),
+        # Partial index: live-document lookups skip soft-deleted rows entirely
+        Index('idx_documents_live_org', 'org_id', 'status', postgresql_where=text('is_deleted = false')),
         Index('idx_documents_version_id', 'version_id'),
+        # Dedup lookups by digest; half the size of the old hex string index
+        Index('idx_documents_content_hash', 'content_hash', postgresql_where=text('content_hash IS NOT NULL')),
+        # GIN indexes for JSONB containment (@>) filters
+        Index('idx_documents_metadata_gin', 'metadata', postgresql_using='gin',
+              postgresql_ops={'metadata': 'jsonb_path_ops'}),
+        Index('idx_documents_tags_gin', 'tags', postgresql_using='gin'),
+        Index('idx_documents_search', 'search_vector', postgresql_using='gin'),
+        # Expression index for equality filters on metadata->>'language'
+        Index('idx_documents_meta_lang', document_metadata['language'].astext),
     )
 
-    def __repr__(self):
-        return f"<Document(id={self.id}, title='{self.title}', version={self.version})>"
+    @classmethod
+    def tagged(cls, tag):
+        """
+        Select documents carrying a tag through the document_tags table.
+
+        Args:
+            tag: Tag to match exactly
+
+        Returns:
+            A ``select(Document)`` joined to ``document_tags``
+        """
+        return select(cls).join(DocumentTag, DocumentTag.document_id == cls.id)\
+            .where(DocumentTag.tag == tag)
+
+
+class DocumentTag(Base):
+    """
+    One tag on one document.
+
+    Replaces the ``documents.tags`` JSON array: adding or removing a tag
+    touches a single small row, and lookups by tag are a range scan on
+    ``(tag, document_id)``.
+    """
+    __tablename__ = 'document_tags'
+    __repr_fields__ = ('document_id', 'tag')
+
+    document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), primary_key=True)
+    tag = Column(Text, primary_key=True)
+
+    document = relationship("Document", back_populates="tags_rel")
+
+    __table_args__ = (
+        CheckConstraint("length(trim(tag)) > 0", name="document_tags_tag_not_empty"),
+        Index('idx_document_tags_tag', 'tag', 'document_id'),
+    )
 
 class DocumentVersion(Base):
     """Historical versions of documents for version control."""
     __tablename__ = 'document_versions'
+    __repr_fields__ = ('document_id', 'version')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=False)
-    version = Column(Integer, nullable=False)
-    content = Column(Text, nullable=False)
+    version = Column(SmallInteger, nullable=False)  # Matches Document.version
+    content = deferred(Column(Text, nullable=False), group='body')  # Loaded on access, like Document.content
     title = Column(Text, nullable=False)
     status = Column(String(20), nullable=False)
     created_by_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     change_description = Column(Text)
-    doc_metadata = Column(JSON)
+    doc_metadata = Column(JSONB)
 
     # File Storage Metadata (from market-ui FileVersion)
     file_path = Column(Text, nullable=False)
@@ -148,10 +214,14 @@ class DocumentVersion(Base):
     document = relationship("Document", back_populates="versions")
     created_by = relationship("User", back_populates="document_versions")
 
-    # Unique constraint for document_id and version combination
     __table_args__ = (
         CheckConstraint("version > 0", name="document_versions_valid_version"),
+        # One row per document version. The index behind it also serves
+        # "latest version of a document" (ORDER BY version DESC LIMIT 1)
+        # with a backward scan, so no separate descending index is needed
+        UniqueConstraint('document_id', 'version', name='uq_document_versions_doc_ver'),
+        # Versions are append-only, so created_at follows physical row order
+        # and a BRIN summary per 32 pages serves time-range scans
+        Index('idx_document_versions_created_at_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
     )
-
-    def __repr__(self):
-        return f"<DocumentVersion(document_id={self.document_id}, version={self.version})>"
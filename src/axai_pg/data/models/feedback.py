@@ -1,8 +1,7 @@
-from sqlalchemy import Column, Text, DateTime, ForeignKey, CheckConstraint, Index
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, DDL, Text, DateTime, ForeignKey, CheckConstraint, Index, event
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 from ..config.database import Base
 
 class Feedback(Base):
@@ -13,16 +12,17 @@ class Feedback(Base):
     Supports both authenticated (user_id) and anonymous (user_email) feedback.
     """
     __tablename__ = 'feedback'
+    __repr_fields__ = ('id', 'type', 'user_id')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
 
     # Core Fields
     type = Column(Text, nullable=False)
     description = Column(Text, nullable=False)
 
     # Context and Metadata
-    page_context = Column(JSON, nullable=True)
+    page_context = Column(JSONB, nullable=True)
 
     # User Identification (one of these should be populated)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
@@ -41,8 +41,15 @@ class Feedback(Base):
         CheckConstraint("length(trim(description)) > 0", name="feedback_description_not_empty"),
         Index('idx_feedback_user_id', 'user_id'),
         Index('idx_feedback_type', 'type'),
-        Index('idx_feedback_created_at', 'created_at'),
+        # Append-only in practice; BRIN instead of a btree entry per row
+        Index('idx_feedback_created_at_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
     )
 
-    def __repr__(self):
-        return f"<Feedback(id={self.id}, type='{self.type}', user_id={self.user_id})>"
+# Feedback text is rarely more than a few paragraphs; keep it in the row,
+# compressed if it has to be
+event.listen(
+    Feedback.__table__,
+    'after_create',
+    DDL("ALTER TABLE feedback ALTER COLUMN description SET STORAGE MAIN"),
+)
@@ -1,8 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Numeric, Boolean, CheckConstraint, Index, Enum as SQLEnum
+from sqlalchemy import Column, DDL, Integer, String, Text, DateTime, ForeignKey, REAL, Boolean, CheckConstraint, Index, event, Enum as SQLEnum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 import enum
 from ..config.database import Base
 
@@ -20,26 +19,26 @@ class GraphEntity(Base):
     collections, or documents, and are tracked with source metadata.
     """
     __tablename__ = 'graph_entities'
+    __repr_fields__ = ('id', 'entity_type', 'name')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
 
     # Core Identity Fields (from market-ui)
-    entity_id = Column(Text, nullable=False, index=True)
+    entity_id = Column(Text, nullable=False)
     entity_type = Column(String(50), nullable=False)
 
     # Entity Data
     name = Column(String(255), nullable=False)
     description = Column(Text)
-    properties = Column(JSON)
+    properties = Column(JSONB)
 
     # Source Tracking (from market-ui)
+    # source_file_id is the only link to a document; source_type records
+    # whether the entity came from a file or a document
     source_type = Column(SQLEnum(SourceType), nullable=True)
-    source_file_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=True, index=True)
-    source_collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=True, index=True)
-
-    # Legacy document relationship (nullable for non-document entities)
-    document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='SET NULL'), nullable=True)
+    source_file_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=True)
+    source_collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=True)
 
     # Timestamps and Metadata
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -48,18 +47,21 @@ class GraphEntity(Base):
     is_active = Column(Boolean, nullable=False, default=True)
 
     # Relationships
-    document = relationship("Document", back_populates="graph_entity", foreign_keys=[document_id])
     source_file = relationship("Document", back_populates="graph_entities", foreign_keys=[source_file_id])
     source_collection = relationship("Collection", back_populates="graph_entities")
-    entity_links = relationship("EntityLink", back_populates="graph_entity", lazy="dynamic", cascade="all, delete-orphan")
+    # Plain collections so callers can batch them with selectinload(); edges
+    # go with their entity, unloaded ones through the database cascade
+    entity_links = relationship("EntityLink", back_populates="graph_entity", cascade="all, delete-orphan")
     outgoing_relationships = relationship("GraphRelationship",
                                        foreign_keys="GraphRelationship.source_entity_id",
                                        back_populates="source_entity",
-                                       lazy="dynamic")
+                                       cascade="all, delete",
+                                       passive_deletes=True)
     incoming_relationships = relationship("GraphRelationship",
                                        foreign_keys="GraphRelationship.target_entity_id",
                                        back_populates="target_entity",
-                                       lazy="dynamic")
+                                       cascade="all, delete",
+                                       passive_deletes=True)
 
     # Table Constraints
     __table_args__ = (
@@ -67,11 +69,18 @@ class GraphEntity(Base):
         Index('idx_graph_entities_entity_type', 'entity_type'),
         Index('idx_graph_entities_source_file_id', 'source_file_id'),
         Index('idx_graph_entities_source_collection_id', 'source_collection_id'),
-        Index('idx_graph_entities_document_id', 'document_id'),
+        Index('idx_graph_entities_properties_gin', 'properties', postgresql_using='gin',
+              postgresql_ops={'properties': 'jsonb_path_ops'}),
     )
 
-    def __repr__(self):
-        return f"<GraphEntity(id={self.id}, entity_type='{self.entity_type}', name='{self.name}')>"
+# Descriptions are short text; MAIN compresses a long one in the row
+# instead of moving it out to the TOAST table, so entity reads stay on
+# the heap page
+event.listen(
+    GraphEntity.__table__,
+    'after_create',
+    DDL("ALTER TABLE graph_entities ALTER COLUMN description SET STORAGE MAIN"),
+)
 
 class GraphRelationship(Base):
     """
@@ -81,31 +90,34 @@ class GraphRelationship(Base):
     Supports source tracking from files, collections, or documents.
     """
     __tablename__ = 'graph_relationships'
+    __repr_fields__ = ('id', 'relationship_type', 'source_entity_id', 'target_entity_id')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
 
     # Core Fields (renamed from source_node_id/target_node_id)
     source_entity_id = Column(UUID(as_uuid=True), ForeignKey('graph_entities.id', ondelete='CASCADE'), nullable=False)
     target_entity_id = Column(UUID(as_uuid=True), ForeignKey('graph_entities.id', ondelete='CASCADE'), nullable=False)
 
     # Relationship Identity (from market-ui)
-    relationship_id = Column(Text, nullable=True, index=True)
+    relationship_id = Column(Text, nullable=True)
     relationship_type = Column(String(50), nullable=False)
 
     # Source Tracking (from market-ui)
     source_type = Column(SQLEnum(SourceType), nullable=True)
-    source_file_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=True, index=True)
-    source_collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=True, index=True)
+    source_file_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=True)
+    source_collection_id = Column(UUID(as_uuid=True), ForeignKey('collections.id', ondelete='CASCADE'), nullable=True)
 
     # Legacy document relationship (nullable for non-document relationships)
     document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='SET NULL'), nullable=True)
 
     # Relationship Metadata
     is_directed = Column(Boolean, nullable=False, default=True)
-    weight = Column(Numeric(10, 5))
-    confidence_score = Column(Numeric(5, 4))
-    properties = Column(JSON)
+    # float4: scores never need decimal exactness, and aggregating them
+    # over many edges uses hardware arithmetic instead of numeric routines
+    weight = Column(REAL)
+    confidence_score = Column(REAL)
+    properties = Column(JSONB)
 
     # Timestamps and Metadata
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -114,8 +126,9 @@ class GraphRelationship(Base):
     is_active = Column(Boolean, nullable=False, default=True)
 
     # Relationships
-    source_entity = relationship("GraphEntity", foreign_keys=[source_entity_id], back_populates="outgoing_relationships")
-    target_entity = relationship("GraphEntity", foreign_keys=[target_entity_id], back_populates="incoming_relationships")
+    # Both endpoints are needed whenever an edge is rendered
+    source_entity = relationship("GraphEntity", foreign_keys=[source_entity_id], back_populates="outgoing_relationships", lazy="selectin")
+    target_entity = relationship("GraphEntity", foreign_keys=[target_entity_id], back_populates="incoming_relationships", lazy="selectin")
     document = relationship("Document", back_populates="graph_relationships_rel", foreign_keys=[document_id])
     source_file = relationship("Document", foreign_keys=[source_file_id], overlaps="graph_relationships_rel,document")
     source_collection = relationship("Collection", back_populates="graph_relationships")
@@ -132,7 +145,6 @@ class GraphRelationship(Base):
         Index('idx_graph_relationships_source_file_id', 'source_file_id'),
         Index('idx_graph_relationships_source_collection_id', 'source_collection_id'),
         Index('idx_graph_relationships_document_id', 'document_id'),
+        Index('idx_graph_relationships_properties_gin', 'properties', postgresql_using='gin',
+              postgresql_ops={'properties': 'jsonb_path_ops'}),
     )
-
-    def __repr__(self):
-        return f"<GraphRelationship(id={self.id}, type='{self.relationship_type}', source={self.source_entity_id}, target={self.target_entity_id})>"
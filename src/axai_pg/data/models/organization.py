@@ -1,8 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, CheckConstraint, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, CheckConstraint, Index, select
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 from ..config.database import Base
 
 class Organization(Base):
@@ -13,9 +12,10 @@ class Organization(Base):
     This model implements multi-tenancy at the organization level.
     """
     __tablename__ = 'organizations'
+    __repr_fields__ = ('id', 'name')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
 
     # Core Fields
     name = Column(Text, nullable=False)
@@ -23,15 +23,30 @@ class Organization(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    users = relationship("User", back_populates="organization", lazy="dynamic", cascade="all, delete-orphan")
-    documents = relationship("Document", back_populates="organization", lazy="dynamic", cascade="all, delete-orphan")
-    collections = relationship("Collection", back_populates="organization", lazy="dynamic", cascade="all, delete-orphan")
+    # Tenant-wide sets are unbounded, so they are never loaded implicitly:
+    # org.documents.select() builds a statement to filter, paginate or
+    # stream with queries.stream(); deletes cascade in the database
+    users = relationship("User", back_populates="organization", lazy="write_only", cascade="all, delete-orphan", passive_deletes=True)
+    documents = relationship("Document", back_populates="organization", lazy="write_only", cascade="all, delete-orphan", passive_deletes=True)
+    collections = relationship("Collection", back_populates="organization", lazy="write_only", cascade="all, delete-orphan", passive_deletes=True)
 
     # Table Constraints
     __table_args__ = (
         CheckConstraint("length(trim(name)) > 0", name="organizations_name_not_empty"),
-        Index('idx_organizations_name', 'name'),
+        # Names are matched case-insensitively, and case variants of an
+        # existing name are rejected
+        Index('idx_organizations_name_ci', func.lower(func.trim(name)), unique=True),
     )
 
-    def __repr__(self):
-        return f"<Organization(id={self.id}, name='{self.name}')>"
+    @classmethod
+    def named(cls, name):
+        """
+        Select the organization with a name, ignoring case and surrounding spaces.
+
+        Args:
+            name: Organization name to look up
+
+        Returns:
+            A ``select(Organization)`` that uses idx_organizations_name_ci
+        """
+        return select(cls).where(func.lower(func.trim(cls.name)) == func.lower(func.trim(name)))
@@ -0,0 +1,75 @@
+"""
+Prebuilt statements for hot lookup paths.
+
+Each statement is constructed once at import time and executed with bound
+parameters, e.g. ``session.execute(GET_DOCUMENT_BY_ID, {"id": doc_id})``.
+Reusing the same statement object skips rebuilding the query on every call
+and always hits the engine's compiled-SQL cache.
+
+Root queries that hand objects to API code are built with ``strict()``:
+the relationships they need are loaded up front and every other
+relationship raises on access instead of quietly issuing one query per row.
+Generic list paths use ``loader_options()``, which adds the same
+``raiseload('*')`` only when ``AXAI_STRICT_LOADING=true`` (set in CI), so an
+undeclared relationship access fails tests without failing production
+requests.
+"""
+
+from functools import lru_cache
+from typing import Iterator
+import os
+
+from sqlalchemy import Select, bindparam, select
+from sqlalchemy.orm import Session, raiseload, selectinload, undefer
+
+from .document import Document
+from .collection import Collection
+
+
+def strict(statement: Select, *loaders) -> Select:
+    """Apply the given eager loaders and ``raiseload('*')`` for everything else."""
+    return statement.options(*loaders, raiseload('*'))
+
+
+def strict_loading_enabled() -> bool:
+    """Whether AXAI_STRICT_LOADING asks for undeclared lazy loads to raise."""
+    return os.getenv('AXAI_STRICT_LOADING', 'false').lower() == 'true'
+
+
+def loader_options(*loaders) -> tuple:
+    """Return the eager loaders, plus ``raiseload('*')`` under strict loading."""
+    if strict_loading_enabled():
+        return (*loaders, raiseload('*'))
+    return loaders
+
+
+def stream(session: Session, statement: Select, batch_size: int = 1000) -> Iterator:
+    """
+    Iterate over the ORM objects a statement returns, ``batch_size`` at a time.
+
+    Rows are fetched from a server-side cursor (``yield_per``), so large
+    result sets, e.g. ``organization.documents.select()`` in a reporting
+    job, are never fully materialized in memory.
+    """
+    return session.scalars(statement.execution_options(yield_per=batch_size))
+
+
+@lru_cache(maxsize=None)
+def by_id(model_class) -> Select:
+    """Return the shared ``SELECT ... WHERE id = :id`` statement for a model."""
+    return select(model_class).where(model_class.id == bindparam("id"))
+
+
+GET_DOCUMENT_BY_ID = by_id(Document)
+GET_COLLECTION_BY_ID = by_id(Collection)
+
+# For updates that copy the current content into a version row, without a
+# second SELECT for the deferred column
+GET_DOCUMENT_WITH_CONTENT_BY_ID = GET_DOCUMENT_BY_ID.options(undefer(Document.content))
+
+# Documents with the children API responses include
+DOCUMENTS_WITH_CHILDREN = strict(
+    select(Document),
+    selectinload(Document.versions),
+    selectinload(Document.topics_rel),
+)
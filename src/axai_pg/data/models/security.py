@@ -1,9 +1,27 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint, CheckConstraint, JSON, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, BigInteger, DDL, Identity, SmallInteger, String, Text, ForeignKey, DateTime, UniqueConstraint, CheckConstraint, Index, PrimaryKeyConstraint, event, select, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
+from sqlalchemy.ext.associationproxy import association_proxy
 from ..config.database import Base
+import enum
+
+
+class PermissionType(str, enum.Enum):
+    """Operations a role permission grants on a resource"""
+    READ = "READ"
+    CREATE = "CREATE"
+    UPDATE = "UPDATE"
+    DELETE = "DELETE"
+
+
+class PolicyType(str, enum.Enum):
+    """Kinds of security policy"""
+    ACCESS_CONTROL = "ACCESS_CONTROL"
+    DATA_PROTECTION = "DATA_PROTECTION"
+    AUDIT = "AUDIT"
+    RATE_LIMIT = "RATE_LIMIT"
+
 
 class Role(Base):
     """
@@ -13,12 +31,13 @@ class Role(Base):
     with descriptions and optional legacy permissions field.
     """
     __tablename__ = 'roles'
+    __repr_fields__ = ('id', 'name')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
 
     # Core Fields
-    name = Column(Text, nullable=False, unique=True)
+    name = Column(Text, nullable=False)
     description = Column(Text)
     permissions = Column(Text)  # Legacy comma-separated permissions
 
@@ -27,52 +46,82 @@ class Role(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    user_roles = relationship("UserRole", back_populates="role", lazy="dynamic")
+    # One row per user holding the role; query with role.user_roles.select()
+    user_roles = relationship("UserRole", back_populates="role", lazy="write_only")
 
     # Table Constraints
     __table_args__ = (
         CheckConstraint("length(trim(name)) > 0", name="roles_name_not_empty"),
-        Index('idx_roles_name', 'name'),
+        # Unique ignoring case, which also covers exact duplicates
+        Index('idx_roles_name_ci', func.lower(func.trim(name)), unique=True),
     )
 
-    def __repr__(self):
-        return f"<Role(id={self.id}, name='{self.name}')>"
+    @classmethod
+    def named(cls, name):
+        """
+        Select the role with a name, ignoring case and surrounding spaces.
+
+        Args:
+            name: Role name to look up
+
+        Returns:
+            A ``select(Role)`` that uses idx_roles_name_ci
+        """
+        return select(cls).where(func.lower(func.trim(cls.name)) == func.lower(func.trim(name)))
 
 class UserRole(Base):
     """
     Model for user role assignments.
 
     Updated to reference Role table via role_id for normalized role management.
-    Maintains backward compatibility with role_name field.
+    Only role_id is stored; role_name reads through to Role.name, and SQL
+    readers get the same join from the user_roles_v view.
     """
     __tablename__ = 'user_roles'
+    __repr_fields__ = ('user_id', 'role_id')
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     role_id = Column(UUID(as_uuid=True), ForeignKey('roles.id', ondelete='CASCADE'), nullable=False)
-    role_name = Column(Text, nullable=False)  # Legacy field for backward compatibility
     assigned_at = Column(DateTime(timezone=True), server_default=func.now())
     assigned_by = Column(UUID(as_uuid=True), ForeignKey('users.id'))
 
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
     assigner = relationship("User", foreign_keys=[assigned_by])
-    role = relationship("Role", back_populates="user_roles")
+    role = relationship("Role", back_populates="user_roles", lazy="selectin")
+    # Legacy name, read from the role loaded above instead of a stored copy
+    role_name = association_proxy("role", "name")
 
     __table_args__ = (
+        # uq_user_role also serves lookups by user_id
         UniqueConstraint('user_id', 'role_id', name='uq_user_role'),
-        Index('idx_user_roles_user_id', 'user_id'),
         Index('idx_user_roles_role_id', 'role_id'),
     )
 
+# Role names for SQL that still reads them from user_roles; roles exists
+# by now, since user_roles references it
+event.listen(
+    UserRole.__table__,
+    'after_create',
+    DDL(
+        "CREATE OR REPLACE VIEW user_roles_v AS "
+        "SELECT ur.id, ur.user_id, ur.role_id, r.name AS role_name, ur.assigned_at, ur.assigned_by "
+        "FROM user_roles ur JOIN roles r ON r.id = ur.role_id"
+    ),
+)
+event.listen(UserRole.__table__, 'before_drop', DDL("DROP VIEW IF EXISTS user_roles_v"))
+
 class RolePermission(Base):
     """Model for role-based permissions."""
     __tablename__ = 'role_permissions'
+    __repr_fields__ = ('role_name', 'resource_name', 'permission_type')
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
     role_name = Column(Text, nullable=False)
     resource_name = Column(Text, nullable=False)
-    permission_type = Column(Text, nullable=False)
+    # Native enum: 4 bytes per row and in uq_role_permission instead of the string
+    permission_type = Column(SQLEnum(PermissionType, name='permission_type'), nullable=False)
     granted_at = Column(DateTime(timezone=True), server_default=func.now())
     granted_by = Column(UUID(as_uuid=True), ForeignKey('users.id'))
     
@@ -80,10 +129,6 @@ class RolePermission(Base):
     granter = relationship("User", foreign_keys=[granted_by])
     
     __table_args__ = (
-        CheckConstraint(
-            "permission_type IN ('READ', 'CREATE', 'UPDATE', 'DELETE')",
-            name='valid_permission_type'
-        ),
         UniqueConstraint('role_name', 'resource_name', 'permission_type', 
                         name='uq_role_permission'),
     )
@@ -96,42 +141,65 @@ class AuditLog(Base):
     - action_type → action
     - table_affected → resource_type
     - record_id → resource_id
-    - details: Text → JSON for structured data
+    - details: Text → JSONB for structured data
     Added user_id FK in addition to username for better referential integrity.
+
+    Partitioned by month on ``action_time``: queries over a time window only
+    touch the matching partitions, and retention drops whole partitions
+    (``drop_audit_log_partitions()``) instead of deleting rows. Monthly
+    partitions are created by ``ensure_audit_log_partitions()``; rows
+    outside them land in ``audit_logs_default``.
     """
     __tablename__ = 'audit_logs'
+    __repr_fields__ = ('id', 'username', 'action')
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Append-only and nothing references it: a sequential 8-byte key keeps
+    # inserts at the right edge of the primary key index
+    id = Column(BigInteger, Identity(), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
     username = Column(Text, nullable=False)
     action = Column(Text, nullable=False)
-    action_time = Column(DateTime(timezone=True), server_default=func.now())
+    action_time = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     resource_type = Column(Text, nullable=False)
     resource_id = Column(UUID(as_uuid=True))  # Can reference records from different tables
-    details = Column(JSON)  # Changed from Text to JSON for structured logging
+    details = Column(JSONB)  # Changed from Text to JSONB for structured logging
 
     # Relationships
     user = relationship("User")
 
     # Table Constraints
     __table_args__ = (
+        # The partition key has to be part of the primary key
+        PrimaryKeyConstraint('id', 'action_time', name='audit_logs_pkey'),
         Index('idx_audit_logs_user_id', 'user_id'),
-        Index('idx_audit_logs_action_time', 'action_time'),
+        # Rows arrive in action_time order, so within each monthly partition
+        # a BRIN summary per 32 pages narrows time-range scans
+        Index('idx_audit_logs_action_time_brin', 'action_time', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
         Index('idx_audit_logs_resource_type', 'resource_type'),
+        Index('idx_audit_logs_details_gin', 'details', postgresql_using='gin',
+              postgresql_ops={'details': 'jsonb_path_ops'}),
+        {'postgresql_partition_by': 'RANGE (action_time)'},
     )
 
-    def __repr__(self):
-        return f"<AuditLog(id={self.id}, username='{self.username}', action='{self.action}')>"
+# A partitioned table rejects rows no partition accepts, so it is created
+# with a catch-all partition
+event.listen(
+    AuditLog.__table__,
+    'after_create',
+    DDL("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT"),
+)
 
 class RateLimit(Base):
     """Model for rate limiting."""
     __tablename__ = 'rate_limits'
+    __repr_fields__ = ('user_id', 'action_type', 'window_start', 'count')
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(BigInteger, Identity(), primary_key=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     action_type = Column(Text, nullable=False)
     window_start = Column(DateTime(timezone=True), server_default=func.now())
-    count = Column(Integer, default=1)
+    count = Column(SmallInteger, default=1)  # Saturates at 32767; see bump_rate_limit()
     
     # Relationships
     user = relationship("User")
@@ -144,22 +212,16 @@ class RateLimit(Base):
 class SecurityPolicy(Base):
     """Model for security policies."""
     __tablename__ = 'security_policies'
+    __repr_fields__ = ('id', 'name', 'policy_type')
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
     name = Column(Text, nullable=False, unique=True)
     description = Column(Text)
-    policy_type = Column(Text, nullable=False)
-    policy_data = Column(JSON, nullable=False)
+    policy_type = Column(SQLEnum(PolicyType, name='policy_type'), nullable=False)
+    policy_data = Column(JSONB, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     created_by = Column(UUID(as_uuid=True), ForeignKey('users.id'))
     
     # Relationships
     creator = relationship("User", foreign_keys=[created_by])
-    
-    __table_args__ = (
-        CheckConstraint(
-            "policy_type IN ('ACCESS_CONTROL', 'DATA_PROTECTION', 'AUDIT', 'RATE_LIMIT')",
-            name='valid_policy_type'
-        ),
-    )
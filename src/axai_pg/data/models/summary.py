@@ -1,16 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Numeric, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, CheckConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from ..config.database import Base
 
 class Summary(Base):
     """Document summaries generated by various tools/agents."""
     __tablename__ = 'summaries'
+    __repr_fields__ = ('id', 'document_id', 'summary_type')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
     
     # Core Fields
     document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=False)
@@ -19,7 +19,7 @@ class Summary(Base):
     target_audience = Column(String(50))
     tool_agent = Column(String(100), nullable=False)
     tool_version = Column(String(50))
-    config_parameters = Column(JSON)
+    config_parameters = Column(JSONB)
     confidence_score = Column(Numeric(5, 4))
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
@@ -39,6 +39,3 @@ class Summary(Base):
         CheckConstraint("status IN ('draft', 'published', 'archived')",
                        name="summaries_valid_status"),
     )
-
-    def __repr__(self):
-        return f"<Summary(id={self.id}, document_id={self.document_id}, type='{self.summary_type}')>"
@@ -1,17 +1,25 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, CheckConstraint, Index
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, CheckConstraint, Index, DDL, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..config.database import Base
 
+# Changing this needs a migration that rebuilds the table
+TOKEN_PARTITIONS = 16
+
 class Token(Base):
     """
     JWT token management for authentication.
 
     From market-ui integration - tracks issued tokens with revocation support.
     Uses JTI (JWT ID) as primary key for efficient token lookups.
+
+    Hash-partitioned on the JTI into ``TOKEN_PARTITIONS`` tables
+    (``tokens_p0`` ...), so the per-request validation lookup descends one
+    small btree instead of a single large one.
     """
     __tablename__ = 'tokens'
+    __repr_fields__ = ('id', 'user_id', 'token_type')
 
     # Primary Key (JTI - JWT ID)
     id = Column(Text, primary_key=True)
@@ -26,7 +34,7 @@ class Token(Base):
     is_revoked = Column(Boolean, nullable=False, default=False)
 
     # Relationships
-    user = relationship("User", back_populates="tokens")
+    user = relationship("User", back_populates="tokens", lazy="selectin")
 
     # Table Constraints
     __table_args__ = (
@@ -34,8 +42,19 @@ class Token(Base):
         CheckConstraint("length(trim(token_type)) > 0", name="tokens_token_type_not_empty"),
         Index('idx_tokens_user_id', 'user_id'),
         Index('idx_tokens_expires_at', 'expires_at'),
-        Index('idx_tokens_is_revoked', 'is_revoked'),
+        # "Valid tokens for a user": only live tokens are indexed, and
+        # token_type is carried along so the lookup is an index-only scan
+        Index('idx_tokens_user_valid', 'user_id', 'is_revoked', 'expires_at',
+              postgresql_include=['token_type'],
+              postgresql_where=text('is_revoked = false')),
+        {'postgresql_partition_by': 'HASH (id)'},
     )
 
-    def __repr__(self):
-        return f"<Token(id='{self.id}', user_id={self.user_id}, token_type='{self.token_type}')>"
+@event.listens_for(Token.__table__, 'after_create')
+def _create_token_partitions(target, connection, **kw):
+    """Create the hash partitions; the parent table accepts no rows without them."""
+    for remainder in range(TOKEN_PARTITIONS):
+        connection.execute(DDL(
+            f"CREATE TABLE tokens_p{remainder} PARTITION OF tokens "
+            f"FOR VALUES WITH (MODULUS {TOKEN_PARTITIONS}, REMAINDER {remainder})"
+        ))
@@ -1,16 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, ARRAY, Numeric, Boolean, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, ARRAY, Numeric, Boolean, CheckConstraint, insert
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
-from ..config.database import Base
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from ..config.database import Base, copy_rows
 
 class Topic(Base):
     """Topics extracted from document content for categorization and discovery."""
     __tablename__ = 'topics'
+    __repr_fields__ = ('id', 'name')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
     
     # Core Fields
     name = Column(String(100), nullable=False, unique=True)
@@ -36,21 +36,19 @@ class Topic(Base):
                        name="topics_no_self_reference"),
     )
 
-    def __repr__(self):
-        return f"<Topic(id={self.id}, name='{self.name}')>"
-
 class DocumentTopic(Base):
     """Junction table connecting documents to their topics with relevance scores."""
     __tablename__ = 'document_topics'
+    __repr_fields__ = ('document_id', 'topic_id', 'relevance_score')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
     
     # Core Fields
     document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=False)
     topic_id = Column(UUID(as_uuid=True), ForeignKey('topics.id', ondelete='CASCADE'), nullable=False)
     relevance_score = Column(Numeric(5, 4), nullable=False)
-    context = Column(JSON)
+    context = Column(JSONB)
     extracted_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     extracted_by_tool = Column(String(100), nullable=False)
@@ -65,5 +63,36 @@ class DocumentTopic(Base):
                        name="document_topics_valid_relevance"),
     )
 
-    def __repr__(self):
-        return f"<DocumentTopic(document_id={self.document_id}, topic_id={self.topic_id}, score={self.relevance_score})>"
+    # Batches at least this large are streamed with COPY instead of INSERT
+    COPY_THRESHOLD = 10000
+
+    @classmethod
+    def bulk_insert(cls, session, rows):
+        """
+        Link many documents to topics in as few round trips as possible.
+
+        Smaller batches are one executemany INSERT, which SQLAlchemy sends as
+        multi-row VALUES pages. Batches of COPY_THRESHOLD rows or more are
+        streamed with COPY FROM STDIN on the session's connection, so they
+        still commit or roll back with the session.
+
+        Args:
+            session: Active SQLAlchemy session
+            rows: Dicts of column values, all with the same keys; each needs
+                document_id, topic_id, relevance_score and extracted_by_tool
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        if len(rows) < cls.COPY_THRESHOLD:
+            session.execute(insert(cls), rows)
+            return len(rows)
+
+        columns = list(rows[0])
+        return copy_rows(
+            session.connection(), cls.__tablename__, columns,
+            ([row[name] for name in columns] for row in rows),
+            json_columns=('context',),
+        )
@@ -2,7 +2,6 @@ from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Chec
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 from ..config.database import Base
 
 class User(Base):
@@ -19,9 +18,10 @@ class User(Base):
     - is_email_verified: Email verification status
     """
     __tablename__ = 'users'
+    __repr_fields__ = ('id', 'username', 'org_id')
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())
 
     # Core Fields
     username = Column(Text, nullable=False, unique=True)
@@ -67,10 +67,6 @@ class User(Base):
             "email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$'",
             name="users_email_valid"
         ),
-        Index('idx_users_username', 'username'),
-        Index('idx_users_email', 'email'),
-        Index('idx_users_org_id', 'org_id'),
+        # username and email are indexed by their unique constraints
+        Index('idx_users_org', 'org_id'),
     )
-
-    def __repr__(self):
-        return f"<User(id={self.id}, username='{self.username}', org_id={self.org_id})>"
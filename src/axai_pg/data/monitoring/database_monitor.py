@@ -1,10 +1,12 @@
 from typing import Dict, Any, Optional, Type
 from datetime import datetime
 import functools
+import inspect
 import time
 import logging
 from sqlalchemy.orm import Session
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 
 from ..config.database import DatabaseManager
 from .metrics_collector import MetricsCollector
@@ -14,10 +16,17 @@ class DatabaseMonitor:
     """Integrates monitoring and alerting with database operations."""
     
     _instance = None
+    # Longest rendering of a monitored query's args/kwargs kept in its context
+    MAX_CONTEXT_CHARS = 256
+    # Pool stats are refreshed at most this often (seconds); checkout and
+    # checkin events can fire thousands of times a second
+    POOL_METRICS_INTERVAL = 0.1
     
     def __init__(self):
         self.metrics = MetricsCollector.get_instance()
         self.alerts = AlertManager.get_instance()
+        self._pool = None
+        self._last_pool_update = 0.0
         self._setup_monitoring()
     
     @classmethod
@@ -35,6 +44,7 @@ class DatabaseMonitor:
         try:
             from sqlalchemy import event
             engine = DatabaseManager.get_instance().engine
+            self._pool = engine.pool
             
             # Monitor connection pool
             @event.listens_for(engine, 'checkout')
@@ -49,14 +59,24 @@ class DatabaseMonitor:
             pass
     
     def _update_pool_metrics(self):
-        """Update pool metrics and check thresholds."""
-        engine = DatabaseManager.get_instance().engine
+        """Update pool metrics and check thresholds, at most once per POOL_METRICS_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_pool_update < self.POOL_METRICS_INTERVAL:
+            return
+        self._last_pool_update = now
+        
+        pool = self._pool
+        # NullPool (use_null_pool) keeps no connections to count
+        if not isinstance(pool, QueuePool):
+            return
         pool_status = {
-            "size": engine.pool.size(),
-            "checkedin": engine.pool.checkedin(),
-            "overflow": engine.pool.overflow(),
-            "checkedout": engine.pool.checkedout(),
+            "size": pool.size(),
+            "checkedin": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "checkedout": pool.checkedout(),
         }
+        # Computed once here; the collector and the alert check both read it
+        pool_status["utilization"] = pool_status["checkedout"] / max(pool_status["size"], 1)
         
         self.metrics.update_pool_metrics(pool_status)
         self.alerts.check_pool_utilization(pool_status)
@@ -76,12 +96,13 @@ class DatabaseMonitor:
             finally:
                 duration = time.time() - start_time
                 
-                # Extract query context
-                context = {
-                    "function": func.__name__,
-                    "args": str(args),
-                    "kwargs": str(kwargs)
-                }
+                # Extract query context; arguments can be large (rows, ORM
+                # objects), so they are only rendered, and truncated, for
+                # failed or slow queries
+                context = {"function": func.__name__}
+                if error or duration > 1.0:
+                    context["args"] = repr(args)[:self.MAX_CONTEXT_CHARS]
+                    context["kwargs"] = repr(kwargs)[:self.MAX_CONTEXT_CHARS]
                 
                 if error:
                     self.metrics.log_error(error, context)
@@ -100,62 +121,74 @@ class DatabaseMonitor:
         return wrapper
     
     def monitor_repository(self, cls: Type):
-        """Class decorator to monitor repository operations."""
-        original_init = cls.__init__
-        
-        @functools.wraps(original_init)
-        def init_wrapper(repo_self, *args, **kwargs):
-            original_init(repo_self, *args, **kwargs)
-            
-            # Wrap repository methods
-            for attr_name in dir(repo_self):
-                if not attr_name.startswith('_'):  # Only public methods
-                    attr = getattr(repo_self, attr_name)
-                    if callable(attr):
-                        wrapped = self._wrap_repository_method(attr)
-                        setattr(repo_self, attr_name, wrapped)
-            
-            return repo_self
-        
-        cls.__init__ = init_wrapper
+        """
+        Class decorator to monitor repository operations.
+
+        Public methods, including inherited ones, are wrapped once on the
+        class, so creating a repository instance costs nothing extra.
+        Static and class methods are left as they are.
+        """
+        for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+            if name.startswith('_') or getattr(method, '_monitored', False):
+                continue
+            if inspect.isfunction(inspect.getattr_static(cls, name)):
+                setattr(cls, name, self._wrap_repository_method(method))
         return cls
     
     def _wrap_repository_method(self, method):
-        """Wrap repository methods with monitoring."""
-        @functools.wraps(method)
-        def wrapper(*args, **kwargs):
-            start_time = time.time()
-            error = None
-            try:
-                result = method(*args, **kwargs)
-                return result
-            except Exception as e:
-                error = e
-                raise
-            finally:
-                duration = time.time() - start_time
-                
-                # Extract operation context
-                context = {
-                    "method": method.__name__,
-                    "repository": method.__self__.__class__.__name__,
-                    "duration": duration
-                }
-                
-                if error:
-                    self.metrics.log_error(error, context)
-                    # Update error rate metrics
-                    self.alerts.check_error_rate(1, 1)
-                
-                # Log operation for audit
-                self.metrics.log_audit(
-                    action=method.__name__,
-                    user_id="system",  # Should be replaced with actual user context
-                    details=context
-                )
+        """Wrap repository methods with monitoring; coroutine methods get an async wrapper."""
+        if inspect.iscoroutinefunction(method):
+            # Time the awaited call, not just creating the coroutine, and
+            # see the exceptions it raises
+            @functools.wraps(method)
+            async def wrapper(repo_self, *args, **kwargs):
+                start_time = time.time()
+                error = None
+                try:
+                    return await method(repo_self, *args, **kwargs)
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    self._record_repository_call(method, repo_self, time.time() - start_time, error)
+        else:
+            @functools.wraps(method)
+            def wrapper(repo_self, *args, **kwargs):
+                start_time = time.time()
+                error = None
+                try:
+                    return method(repo_self, *args, **kwargs)
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    self._record_repository_call(method, repo_self, time.time() - start_time, error)
         
+        # A decorated subclass inherits these already wrapped
+        wrapper._monitored = True
         return wrapper
     
+    def _record_repository_call(self, method, repo_self, duration: float, error: Optional[Exception]):
+        """Log one repository call's timing, and its error if it failed."""
+        # Extract operation context
+        context = {
+            "method": method.__name__,
+            "repository": type(repo_self).__name__,
+            "duration": duration
+        }
+        
+        if error:
+            self.metrics.log_error(error, context)
+            # Update error rate metrics
+            self.alerts.check_error_rate(1, 1)
+        
+        # Log operation for audit
+        self.metrics.log_audit(
+            action=method.__name__,
+            user_id="system",  # Should be replaced with actual user context
+            details=context
+        )
+    
     def check_storage_usage(self, organization_id: Optional[str] = None):
         """Check storage usage for organization or overall."""
         try:
@@ -1,7 +1,9 @@
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime, timezone
 import json
 import os
+import time
 from pathlib import Path
 import logging
 from logging.handlers import RotatingFileHandler
@@ -9,16 +11,17 @@ from logging.handlers import RotatingFileHandler
 class MetricsCollector:
     """Collects and manages database metrics and operational monitoring."""
     
-    _instance = None
     METRICS_DIR = "metrics"
     LOGS_DIR = "logs"
     MAX_LOG_DAYS = 7
+    # Recent (epoch_seconds, duration, slow) query samples kept in memory
+    MAX_QUERIES = 100_000
     
     def __init__(self):
         self._setup_directories()
         self._setup_logging()
         self._metrics = {
-            "queries": {},
+            "queries": deque(maxlen=self.MAX_QUERIES),
             "errors": {},
             "pool": {},
             "storage": {}
@@ -26,9 +29,7 @@ class MetricsCollector:
     
     @classmethod
     def get_instance(cls) -> 'MetricsCollector':
-        if cls._instance is None:
-            cls._instance = MetricsCollector()
-        return cls._instance
+        return _METRICS
     
     def _setup_directories(self):
         """Create necessary directories for metrics and logs."""
@@ -37,8 +38,9 @@ class MetricsCollector:
     
     def _setup_logging(self):
         """Configure logging with rotation."""
+        # Loggers are looked up once and kept; the log_* methods run per query
         # Query logger
-        query_logger = logging.getLogger('query_logger')
+        self._query_log = query_logger = logging.getLogger('query_logger')
         query_logger.setLevel(logging.INFO)
         query_handler = RotatingFileHandler(
             f"{self.LOGS_DIR}/queries.log",
@@ -48,7 +50,7 @@ class MetricsCollector:
         query_logger.addHandler(query_handler)
         
         # Error logger
-        error_logger = logging.getLogger('error_logger')
+        self._error_log = error_logger = logging.getLogger('error_logger')
         error_logger.setLevel(logging.ERROR)
         error_handler = RotatingFileHandler(
             f"{self.LOGS_DIR}/errors.log",
@@ -58,7 +60,7 @@ class MetricsCollector:
         error_logger.addHandler(error_handler)
         
         # Performance logger
-        perf_logger = logging.getLogger('performance_logger')
+        self._perf_log = perf_logger = logging.getLogger('performance_logger')
         perf_logger.setLevel(logging.INFO)
         perf_handler = RotatingFileHandler(
             f"{self.LOGS_DIR}/performance.log",
@@ -68,7 +70,7 @@ class MetricsCollector:
         perf_logger.addHandler(perf_handler)
         
         # Audit logger
-        audit_logger = logging.getLogger('audit_logger')
+        self._audit_log = audit_logger = logging.getLogger('audit_logger')
         audit_logger.setLevel(logging.INFO)
         audit_handler = RotatingFileHandler(
             f"{self.LOGS_DIR}/audit.log",
@@ -80,35 +82,35 @@ class MetricsCollector:
     def log_query(self, query: str, duration: float, context: Dict[str, Any] = None):
         """Log query execution with timing."""
         if duration > 1.0:  # Slow query threshold (1s)
-            logging.getLogger('performance_logger').warning(
-                f"Slow query detected: {duration:.2f}s\nQuery: {query}\nContext: {context}"
+            self._perf_log.warning(
+                "Slow query detected: %.2fs\nQuery: %s\nContext: %s", duration, query, context
             )
         
-        logging.getLogger('query_logger').info(
-            json.dumps({
-                "timestamp": datetime.utcnow().isoformat(),
-                "duration": duration,
-                "query": query,
-                "context": context
-            })
-        )
+        # Only serialize records a handler will see
+        if self._query_log.isEnabledFor(logging.INFO):
+            self._query_log.info(
+                json.dumps({
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "duration": duration,
+                    "query": query,
+                    "context": context
+                })
+            )
         
-        # Update query metrics
-        self._metrics["queries"][datetime.utcnow().isoformat()] = {
-            "duration": duration,
-            "slow": duration > 1.0
-        }
+        # Update query metrics; appended in time order, oldest first
+        self._metrics["queries"].append((time.time(), duration, duration > 1.0))
     
     def log_error(self, error: Exception, context: Dict[str, Any] = None):
         """Log error with context."""
-        logging.getLogger('error_logger').error(
-            json.dumps({
-                "timestamp": datetime.utcnow().isoformat(),
-                "error": str(error),
-                "type": type(error).__name__,
-                "context": context
-            })
-        )
+        if self._error_log.isEnabledFor(logging.ERROR):
+            self._error_log.error(
+                json.dumps({
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "error": str(error),
+                    "type": type(error).__name__,
+                    "context": context
+                })
+            )
         
         # Update error metrics
         error_type = type(error).__name__
@@ -118,45 +120,72 @@ class MetricsCollector:
     
     def update_pool_metrics(self, pool_status: Dict[str, Any]):
         """Update connection pool metrics."""
+        # Runs on every connection checkout and checkin; the epoch timestamp
+        # is only formatted when a snapshot is taken
         self._metrics["pool"] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.time(),
             **pool_status
         }
         
-        # Check for pool alerts
-        if pool_status.get("checkedout", 0) / pool_status.get("size", 1) > 0.8:
-            logging.getLogger('performance_logger').warning(
-                f"High pool utilization: {pool_status}"
-            )
+        # Check for pool alerts; DatabaseMonitor precomputes the ratio
+        utilization = pool_status.get("utilization")
+        if utilization is None:
+            utilization = pool_status.get("checkedout", 0) / max(pool_status.get("size", 1), 1)
+        if utilization > 0.8:
+            self._perf_log.warning("High pool utilization: %s", pool_status)
     
     def log_audit(self, action: str, user_id: str, details: Dict[str, Any]):
         """Log audit trail information."""
-        logging.getLogger('audit_logger').info(
-            json.dumps({
-                "timestamp": datetime.utcnow().isoformat(),
-                "action": action,
-                "user_id": user_id,
-                "details": details
-            })
-        )
+        if self._audit_log.isEnabledFor(logging.INFO):
+            self._audit_log.info(
+                json.dumps({
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "action": action,
+                    "user_id": user_id,
+                    "details": details
+                })
+            )
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Get current metrics snapshot."""
+        """
+        Get current metrics snapshot.
+
+        The snapshot is JSON-serializable: query samples are listed oldest
+        first as ``{"timestamp", "duration", "slow"}`` dicts, and times are
+        ISO 8601 UTC strings.
+        """
+        metrics = self._metrics
+        queries = [
+            {
+                "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(),
+                "duration": duration,
+                "slow": slow,
+            }
+            for ts, duration, slow in list(metrics["queries"])
+        ]
+        metrics = {**metrics, "queries": queries}
+        pool = metrics["pool"]
+        if "timestamp" in pool:
+            pool_time = datetime.fromtimestamp(pool["timestamp"], tz=timezone.utc).isoformat()
+            metrics["pool"] = {**pool, "timestamp": pool_time}
         return {
             "timestamp": datetime.utcnow().isoformat(),
-            "metrics": self._metrics
+            "metrics": metrics
         }
     
     def cleanup_old_metrics(self):
         """Clean up metrics older than retention period."""
-        cutoff = datetime.utcnow() - timedelta(days=self.MAX_LOG_DAYS)
+        cutoff = time.time() - self.MAX_LOG_DAYS * 86400
         
-        # Cleanup query metrics
-        self._metrics["queries"] = {
-            k: v for k, v in self._metrics["queries"].items()
-            if datetime.fromisoformat(k) > cutoff
-        }
+        # Cleanup query metrics: expired samples are all at the left end
+        queries = self._metrics["queries"]
+        while queries and queries[0][0] <= cutoff:
+            queries.popleft()
         
         # Reset error counts periodically
         if len(self._metrics["errors"]) > 1000:  # Prevent unbounded growth
             self._metrics["errors"] = {}
+
+# Created at import, which the interpreter serializes, so concurrent
+# get_instance() calls can never build a second collector
+_METRICS = MetricsCollector()
@@ -1,7 +1,8 @@
 from typing import TypeVar, Generic, Optional, Dict, Any, List
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 from ..config.database import DatabaseManager
+from ..models.queries import by_id, loader_options
 from .metrics_utils import track_metrics
 import threading
 
@@ -28,7 +29,7 @@ class BaseRepository(Generic[T]):
     async def find_by_id(self, id: int) -> Optional[T]:
         try:
             with self._get_session() as session:
-                return session.query(self.model_class).filter_by(id=id).first()
+                return session.execute(by_id(self.model_class), {"id": id}).scalar_one_or_none()
         except SQLAlchemyError as e:
             # Log error
             raise RuntimeError(f"Database error in find_by_id: {str(e)}") from e
@@ -37,7 +38,12 @@ class BaseRepository(Generic[T]):
     async def find_many(self, criteria: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> List[T]:
         try:
             with self._get_session() as session:
-                query = session.query(self.model_class)
+                # options['load'] names the relationships the caller will read;
+                # they are batch-loaded, and under AXAI_STRICT_LOADING any
+                # other relationship access raises
+                loaders = [selectinload(getattr(self.model_class, name))
+                           for name in (options or {}).get('load', ())]
+                query = session.query(self.model_class).options(*loader_options(*loaders))
                 
                 # Apply criteria filters
                 for key, value in criteria.items():
@@ -78,7 +84,7 @@ class BaseRepository(Generic[T]):
     async def update(self, id: int, entity: Dict[str, Any]) -> Optional[T]:
         try:
             with self._get_session() as session:
-                db_entity = session.query(self.model_class).filter_by(id=id).first()
+                db_entity = session.execute(by_id(self.model_class), {"id": id}).scalar_one_or_none()
                 if not db_entity:
                     return None
                 
@@ -96,7 +102,7 @@ class BaseRepository(Generic[T]):
     async def delete(self, id: int) -> bool:
         try:
             with self._get_session() as session:
-                entity = session.query(self.model_class).filter_by(id=id).first()
+                entity = session.execute(by_id(self.model_class), {"id": id}).scalar_one_or_none()
                 if not entity:
                     return False
                 session.delete(entity)
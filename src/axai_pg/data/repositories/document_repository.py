@@ -1,11 +1,12 @@
 from typing import List, Optional, Dict, Any
 from datetime import timedelta
-from sqlalchemy import desc, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, func
+from sqlalchemy.orm import Session, raiseload, selectinload, undefer_group
 from .base_repository import BaseRepository
 from .cache_manager import cache_query
 from .metrics_utils import track_metrics, with_metrics
 from ..models.document import Document
+from ..models.queries import GET_DOCUMENT_WITH_CONTENT_BY_ID
 
 @with_metrics
 class DocumentRepository(BaseRepository[Document]):
@@ -108,7 +109,7 @@ class DocumentRepository(BaseRepository[Document]):
         """Update document while creating a new version record."""
         async def _update_with_version(session: Session):
             # Get current document
-            current = session.query(Document).filter_by(id=id).first()
+            current = session.execute(GET_DOCUMENT_WITH_CONTENT_BY_ID, {"id": id}).scalar_one_or_none()
             if not current:
                 raise ValueError(f"Document {id} not found")
             
@@ -143,12 +144,7 @@ class DocumentRepository(BaseRepository[Document]):
             with self._get_session() as session:
                 search_query = session.query(Document)\
                     .filter(Document.org_id == org_id)\
-                    .filter(
-                        or_(
-                            Document.title.ilike(f"%{query}%"),
-                            Document.content.ilike(f"%{query}%")
-                        )
-                    )
+                    .filter(Document.search_vector.op('@@')(func.plainto_tsquery('english', query)))
                 search_query = self._apply_document_options(search_query, options)
                 return search_query.all()
         except Exception as e:
@@ -168,15 +164,29 @@ class DocumentRepository(BaseRepository[Document]):
             raise RuntimeError(f"Error finding documents by status: {str(e)}") from e
     
     def _apply_document_options(self, query, options: Optional[Dict[str, Any]] = None):
-        """Apply document-specific query options."""
-        if not options:
-            return query
+        """
+        Apply document-specific query options.
+
+        Owner and organization are always loaded, plus the relationships
+        asked for (include_summaries, include_topics); every other
+        relationship raises on access instead of issuing one lazy query per
+        returned document.
+        """
+        options = options or {}
+        # Every caller renders the owner and organization
+        loaders = [selectinload(Document.owner), selectinload(Document.organization)]
+            
+        if options.get('include_content'):
+            # content/summary are deferred on the model; load them with the row
+            loaders.append(undefer_group('body'))
             
         if options.get('include_summaries'):
-            query = query.options(joinedload(Document.summaries))
+            loaders.append(selectinload(Document.summaries))
             
         if options.get('include_topics'):
-            query = query.options(joinedload(Document.topics))
+            loaders.append(selectinload(Document.topics_rel))
+            
+        query = query.options(*loaders, raiseload('*'))
             
         if 'offset' in options:
             query = query.offset(options['offset'])
@@ -0,0 +1,184 @@
+from typing import Any, Deque, Dict, List, Mapping
+from collections import deque
+from datetime import datetime, timezone
+from sqlalchemy import Text, bindparam, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DataError, IntegrityError
+from ..models import AuditLog, User
+import asyncio
+import atexit
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ('user_id', 'username', 'action', 'action_time', 'resource_type', 'resource_id', 'details')
+
+# One statement for every batch; username falls back to the user's current
+# name so callers do not need a lookup round-trip before logging
+_INSERT_AUDIT_LOG = insert(AuditLog).values(
+    user_id=bindparam('user_id'),
+    username=func.coalesce(
+        bindparam('username', type_=Text),
+        select(User.username).where(User.id == bindparam('user_id')).scalar_subquery(),
+    ),
+    action=bindparam('action'),
+    action_time=bindparam('action_time'),
+    resource_type=bindparam('resource_type'),
+    resource_id=bindparam('resource_id'),
+    details=bindparam('details'),
+)
+
+
+class AuditLogBuffer:
+    """
+    Collect audit log rows and write them in batches.
+
+    ``append()`` only queues the row; the queue is written with a single
+    executemany INSERT once ``batch_size`` rows are waiting, when
+    ``flush()`` is called, or every ``interval`` seconds while the flusher
+    started by ``start()`` (or the ``run()`` task) is active. ``action_time``
+    is stamped on append, so a delayed write keeps the time the action
+    happened.
+
+    Rows the database rejects on their own (e.g. an unknown ``user_id``
+    leaving ``username`` NULL) are moved to ``dead_letters`` without
+    holding back the rest of the batch; rows that could not be written for
+    any other reason stay queued for the next flush.
+    """
+
+    def __init__(self, engine: Engine, batch_size: int = 500, interval: float = 0.2,
+                 dead_letter_limit: int = 10_000):
+        self._engine = engine
+        self.batch_size = batch_size
+        self.interval = interval
+        self._rows: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self.dead_letters: Deque[Dict[str, Any]] = deque(maxlen=dead_letter_limit)
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def append(self, row: Mapping[str, Any]) -> None:
+        """
+        Queue one audit row.
+
+        Args:
+            row: AuditLog column values; ``action`` and ``resource_type``
+                are required, and ``username`` may be omitted when
+                ``user_id`` is given
+
+        Raises:
+            ValueError: If the row has keys that are not AuditLog columns
+        """
+        unknown = set(row) - set(_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown audit log columns: {sorted(unknown)}")
+
+        values = {column: row.get(column) for column in _COLUMNS}
+        if values['action_time'] is None:
+            values['action_time'] = datetime.now(timezone.utc)
+
+        with self._lock:
+            self._rows.append(values)
+            full = len(self._rows) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all queued rows in one transaction; returns how many were written.
+
+        Never raises, so the caller whose ``append()`` filled the batch is
+        not handed a failure caused by other rows or by the database.
+        """
+        with self._lock:
+            rows: List[Dict[str, Any]] = list(self._rows)
+            self._rows.clear()
+        if not rows:
+            return 0
+
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(_INSERT_AUDIT_LOG, rows)
+            return len(rows)
+        except (IntegrityError, DataError):
+            logger.warning("Audit log batch of %d rows rejected; retrying row by row", len(rows))
+        except Exception:
+            logger.exception("Failed to write %d audit log rows; requeued", len(rows))
+            self._requeue(rows)
+            return 0
+
+        try:
+            return self._write_rows_individually(rows)
+        except Exception:
+            logger.exception("Failed to write %d audit log rows; requeued", len(rows))
+            self._requeue(rows)
+            return 0
+
+    def _write_rows_individually(self, rows: List[Dict[str, Any]]) -> int:
+        """Write rows under one savepoint each and dead-letter the ones rejected."""
+        rejected = []
+        with self._engine.begin() as conn:
+            for row in rows:
+                try:
+                    with conn.begin_nested():
+                        conn.execute(_INSERT_AUDIT_LOG, row)
+                except (IntegrityError, DataError) as e:
+                    rejected.append((row, e))
+
+        # Only once the good rows are committed; a failed commit requeues everything
+        for row, error in rejected:
+            logger.error("Dropping audit log row %r: %s", row, error.orig)
+            self.dead_letters.append(row)
+        return len(rows) - len(rejected)
+
+    def _requeue(self, rows: List[Dict[str, Any]]) -> None:
+        """Put rows back at the front of the queue, ahead of newer ones."""
+        with self._lock:
+            self._rows.extendleft(reversed(rows))
+
+    def start(self) -> None:
+        """
+        Flush every ``interval`` seconds from a daemon thread.
+
+        ``stop()`` is registered with ``atexit``, so rows queued when the
+        process exits are still written.
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._flush_periodically, name='audit-log-flusher', daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Stop the flusher thread and write anything still queued."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.stop)
+        self.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
+    async def run(self) -> None:
+        """
+        Flush every ``interval`` seconds until cancelled.
+
+        Writes happen in a worker thread so the event loop is not blocked.
+        Anything still queued is flushed when the task ends.
+        """
+        try:
+            while True:
+                await asyncio.sleep(self.interval)
+                await asyncio.to_thread(self.flush)
+        finally:
+            self.flush()
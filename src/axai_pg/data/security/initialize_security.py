@@ -1,7 +1,7 @@
 from typing import List
 from sqlalchemy.orm import Session
 from ..config.database import DatabaseManager
-from ..models.security import UserRole, RolePermission
+from ..models.security import Role, UserRole, RolePermission
 from ..models import User
 
 def create_default_permissions(session: Session) -> None:
@@ -62,9 +62,10 @@ def create_admin_user(session: Session) -> None:
         session.flush()  # Flush to get admin.id
         
         # Assign admin role
+        role = session.scalars(Role.named('admin')).first() or Role(name='admin')
         admin_role = UserRole(
             user_id=admin.id,
-            role_name='admin'
+            role=role
         )
         session.add(admin_role)
 
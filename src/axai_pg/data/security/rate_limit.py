@@ -0,0 +1,50 @@
+from uuid import UUID
+from sqlalchemy import Integer, bindparam, cast, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from ..models import RateLimit
+
+# The window is bucketed in SQL from the database clock, so every caller
+# agrees on window_start and concurrent bumps hit the same row
+_WINDOW_START = func.to_timestamp(
+    func.floor(func.extract('epoch', func.now()) / bindparam('bucket_seconds', type_=Integer))
+    * bindparam('bucket_seconds', type_=Integer)
+)
+
+_insert = insert(RateLimit).values(
+    user_id=bindparam('user_id'),
+    action_type=bindparam('action_type'),
+    window_start=_WINDOW_START,
+    count=1,
+)
+
+# SMALLINT ceiling; a window past any configured limit stops counting
+# here instead of overflowing
+_MAX_COUNT = 32767
+
+# One atomic round-trip: the first action in a window inserts the row and
+# later ones increment it under the row lock, so there is no read-then-write race
+_BUMP_RATE_LIMIT = _insert.on_conflict_do_update(
+    constraint='uq_rate_limit',
+    set_={'count': func.least(cast(RateLimit.count, Integer) + 1, _MAX_COUNT)},
+).returning(RateLimit.count)
+
+
+def bump_rate_limit(conn: Connection, user_id: UUID, action: str, bucket_seconds: int = 60) -> int:
+    """
+    Count one action against the user's current rate limit window.
+
+    Args:
+        conn: Connection to run the upsert on; the caller owns the transaction
+        user_id: User performing the action
+        action: Action type being limited
+        bucket_seconds: Window length; windows are aligned to the Unix epoch
+
+    Returns:
+        Number of actions in the current window, including this one,
+        capped at 32767
+    """
+    return conn.execute(
+        _BUMP_RATE_LIMIT,
+        {'user_id': user_id, 'action_type': action, 'bucket_seconds': bucket_seconds},
+    ).scalar_one()
@@ -3,10 +3,11 @@ from sqlalchemy.orm import Session
 from sqlalchemy.sql import select
 from ..config.database import DatabaseManager
 from ..models import User, Organization, Document
+from .audit_buffer import AuditLogBuffer
+from .rate_limit import bump_rate_limit
 from functools import wraps
 import logging
 import time
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,8 @@ class SecurityManager:
     def _initialize(self):
         """Initialize the security manager."""
         self.db = DatabaseManager.get_instance()
+        self.audit_buffer = AuditLogBuffer(self.db.engine)
+        self.audit_buffer.start()
         
     def _get_session(self) -> Session:
         return self.db.get_session()
@@ -44,7 +47,7 @@ class SecurityManager:
         with self._get_session() as session:
             # Query role_permissions table for user's permissions
             stmt = select(['permission_type']).select_from('role_permissions').\
-                   where('role_name IN (SELECT role FROM user_roles WHERE user_id = :user_id)')
+                   where('role_name IN (SELECT role_name FROM user_roles_v WHERE user_id = :user_id)')
             perms = session.execute(stmt, {'user_id': user_id}).fetchall()
             
             permissions = [p[0] for p in perms]
@@ -75,38 +78,31 @@ class SecurityManager:
             return required_permission in self.load_permissions(user_id, doc.org_id)
     
     def log_access(self, user_id: int, action: str, resource: str, resource_id: Optional[int] = None):
-        """Log access attempts for audit."""
-        with self._get_session() as session:
-            session.execute(
-                """
-                INSERT INTO access_log (username, action_type, table_affected, record_id, details)
-                VALUES (:username, :action, :resource, :resource_id, :details)
-                """,
-                {
-                    'username': session.query(User.username).filter_by(id=user_id).scalar(),
-                    'action': action,
-                    'resource': resource,
-                    'resource_id': resource_id,
-                    'details': f"Access at {datetime.utcnow()}"
-                }
-            )
-            session.commit()
+        """
+        Queue an access record for the audit log.
+
+        Records are written in batches by ``audit_buffer``, whose flusher
+        thread writes them at least every ``audit_buffer.interval`` seconds
+        and once more when the process exits.
+        """
+        self.audit_buffer.append({
+            'user_id': user_id,
+            'action': action,
+            'resource_type': resource,
+            'resource_id': resource_id,
+        })
 
     def enforce_rate_limit(self, user_id: int, action: str, limit: int, window: int) -> bool:
-        """Enforce rate limiting for specific actions."""
-        with self._get_session() as session:
-            # Count recent actions within window
-            count = session.execute(
-                """
-                SELECT COUNT(*) FROM access_log 
-                WHERE username = (SELECT username FROM users WHERE id = :user_id)
-                AND action_type = :action
-                AND action_time > NOW() - INTERVAL ':window seconds'
-                """,
-                {'user_id': user_id, 'action': action, 'window': window}
-            ).scalar()
-            
-            return count < limit
+        """
+        Count the action and check it against the limit.
+
+        The count for the current ``window``-second bucket is bumped and
+        read back by a single upsert, so concurrent requests cannot both
+        slip under the limit.
+        """
+        with self.db.engine.begin() as conn:
+            count = bump_rate_limit(conn, user_id, action, bucket_seconds=window)
+        return count <= limit
 
 def require_permission(permission: str):
     """Decorator to enforce permission requirements."""
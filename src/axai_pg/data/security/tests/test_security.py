@@ -1,7 +1,7 @@
 import pytest
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from ...models.security import UserRole, RolePermission, AccessLog, RateLimit
+from ...models.security import Role, UserRole, RolePermission, AccessLog, RateLimit
 from ..security_manager import SecurityManager
 from ..repository_security import SecureRepository, secure_repository
 from ...config.database import DatabaseManager
@@ -26,7 +26,7 @@ async def test_user(db_session):
     db_session.add(user)
     db_session.flush()
     
-    role = UserRole(user_id=user.id, role_name='user')
+    role = UserRole(user_id=user.id, role=Role(name='user'))
     db_session.add(role)
     db_session.commit()
     
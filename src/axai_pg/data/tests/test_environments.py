@@ -1,3 +1,5 @@
+import os
+import dataclasses
 import pytest
 from ..config.environments import Environments, EnvironmentConfig
 from ..config.database import PostgresPoolConfig
@@ -26,17 +28,45 @@ def test_test_config():
     assert config.extra_settings["echo"] is False
     assert config.pool_config.pool_recycle == 300
 
-def test_production_config():
+@pytest.fixture(autouse=True)
+def fresh_presets():
+    """Rebuild the cached presets so each test sees its own environment."""
+    Environments.cache_clear()
+    yield
+    Environments.cache_clear()
+
+def test_production_config(monkeypatch):
     """Test production environment configuration."""
+    for var in ("POSTGRES_POOL_SIZE", "POSTGRES_MAX_OVERFLOW", "POSTGRES_POOL_TIMEOUT",
+                "POSTGRES_POOL_RECYCLE", "POSTGRES_POOL_PRE_PING"):
+        monkeypatch.delenv(var, raising=False)
     config = Environments.get_production_config()
     assert isinstance(config, EnvironmentConfig)
     assert isinstance(config.pool_config, PostgresPoolConfig)
     
     # Verify production-specific settings
-    assert config.pool_config.pool_size == 5
-    assert config.pool_config.max_overflow == 5
+    assert config.pool_config.pool_size == max(10, (os.cpu_count() or 4) * 2)
+    assert config.pool_config.max_overflow == 20
+    assert config.pool_config.pool_use_lifo is True
+    assert config.pool_config.pool_recycle == 1800
+    assert config.pool_config.pool_pre_ping is True
     assert config.extra_settings["echo"] is False
-    assert config.extra_settings["pool_reset_on_return"] == "commit"
+    assert config.extra_settings["pool_reset_on_return"] == "rollback"
+
+def test_production_pool_config_from_env(monkeypatch):
+    """Test that production pool sizing can be overridden from the environment."""
+    monkeypatch.setenv("POSTGRES_POOL_SIZE", "40")
+    monkeypatch.setenv("POSTGRES_MAX_OVERFLOW", "10")
+    monkeypatch.setenv("POSTGRES_POOL_TIMEOUT", "5")
+    monkeypatch.setenv("POSTGRES_POOL_RECYCLE", "3600")
+    monkeypatch.setenv("POSTGRES_POOL_PRE_PING", "false")
+
+    pool_config = Environments.get_production_config().pool_config
+    assert pool_config.pool_size == 40
+    assert pool_config.max_overflow == 10
+    assert pool_config.pool_timeout == 5
+    assert pool_config.pool_recycle == 3600
+    assert pool_config.pool_pre_ping is False
 
 def test_environment_selection():
     """Test environment configuration selection."""
@@ -53,6 +83,20 @@ def test_environment_selection():
     assert dev_config != prod_config
     assert test_config != prod_config
 
+def test_configs_are_cached_and_immutable():
+    """Test that presets are built once and cannot be modified."""
+    config = Environments.get_config("production")
+    assert Environments.get_config("production") is config
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.pool_config.pool_size = 0
+    with pytest.raises(TypeError):
+        config.extra_settings["echo"] = True
+
+    # Frozen configs stay usable as dict keys and set members
+    assert hash(config) == hash(dataclasses.replace(config))
+    assert len({config, Environments.get_config("test")}) == 2
+
 def test_invalid_environment():
     """Test handling of invalid environment name."""
     with pytest.raises(ValueError) as exc_info:
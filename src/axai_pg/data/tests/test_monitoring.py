@@ -1,10 +1,12 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime
+import json
 import time
 import logging
 from unittest.mock import MagicMock, patch
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from ..monitoring import (
     initialize_monitoring,
@@ -61,6 +63,54 @@ def test_metrics_collection(metrics_collector):
     assert "ValueError" in metrics["metrics"]["errors"]
     assert metrics["metrics"]["errors"]["ValueError"] > 0
 
+def test_metrics_snapshot_is_json_serializable(metrics_collector):
+    """Test that snapshots list query samples as plain dicts."""
+    metrics_collector.log_query("SELECT 1", 0.25)
+    metrics = metrics_collector.get_metrics()
+    
+    sample = metrics["metrics"]["queries"][-1]
+    assert sample["duration"] == 0.25 and sample["slow"] is False
+    assert datetime.fromisoformat(sample["timestamp"]).tzinfo is not None
+    json.dumps(metrics)
+
+def test_disabled_query_log_skips_serialization(metrics_collector):
+    """Test that query records are not JSON-encoded when nothing would emit them."""
+    query_log = logging.getLogger('query_logger')
+    query_log.setLevel(logging.WARNING)
+    try:
+        with patch('axai_pg.data.monitoring.metrics_collector.json.dumps') as dumps:
+            metrics_collector.log_query("SELECT 1", 0.1)
+        dumps.assert_not_called()
+    finally:
+        query_log.setLevel(logging.INFO)
+    assert metrics_collector._metrics["queries"][-1][1] == 0.1
+
+def test_pool_timestamp_formatted_on_snapshot(metrics_collector):
+    """Test that pool updates store epoch seconds and snapshots report ISO time."""
+    before = time.time()
+    metrics_collector.update_pool_metrics({"size": 5, "checkedout": 1, "utilization": 0.2})
+    assert before <= metrics_collector._metrics["pool"]["timestamp"] <= time.time()
+
+    pool = metrics_collector.get_metrics()["metrics"]["pool"]
+    assert datetime.fromisoformat(pool["timestamp"]).timestamp() >= before - 1
+    assert pool["checkedout"] == 1
+    assert isinstance(metrics_collector._metrics["pool"]["timestamp"], float)
+
+    # Callers that pass only the counters still work
+    metrics_collector.update_pool_metrics({"size": 5, "checkedout": 1})
+    assert metrics_collector._metrics["pool"]["checkedout"] == 1
+
+def test_singletons_shared_across_threads():
+    """Test that concurrent get_instance() calls all return the module-level instances."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def get_both(_):
+        return MetricsCollector.get_instance(), AlertManager.get_instance()
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = set(pool.map(get_both, range(32)))
+    assert results == {(MetricsCollector.get_instance(), AlertManager.get_instance())}
+
 def test_alert_triggering(alert_manager):
     """Test alert triggering system."""
     # Mock alert handler
@@ -72,7 +122,8 @@ def test_alert_triggering(alert_manager):
         "size": 5,
         "checkedout": 4,  # 80% utilization should trigger warning
         "checkedin": 1,
-        "overflow": 0
+        "overflow": 0,
+        "utilization": 0.8
     }
     alert_manager.check_pool_utilization(pool_status)
     
@@ -80,7 +131,17 @@ def test_alert_triggering(alert_manager):
     mock_handler.assert_called_with(
         "High pool utilization detected",
         AlertSeverity.WARNING,
-        {"utilization": 0.8, **pool_status}
+        pool_status
+    )
+    
+    # Without a precomputed ratio it is derived from the counters
+    alert_manager._last_alerts.pop("pool_utilization", None)
+    counters = {k: v for k, v in pool_status.items() if k != "utilization"}
+    alert_manager.check_pool_utilization(counters)
+    mock_handler.assert_called_with(
+        "High pool utilization detected",
+        AlertSeverity.WARNING,
+        pool_status
     )
 
 @monitor_repository
@@ -107,6 +168,55 @@ def test_repository_monitoring(metrics_collector):
     metrics = metrics_collector.get_metrics()
     assert "ValueError" in metrics["metrics"]["errors"]
 
+def test_repository_methods_wrapped_once(metrics_collector):
+    """Test that methods are wrapped on the class, once, not per instance."""
+    @monitor_repository
+    class ChildRepository(TestRepository):
+        def child_operation(self):
+            return "child"
+
+        @staticmethod
+        def helper():
+            return "static"
+
+    assert ChildRepository.test_operation is TestRepository.test_operation
+    assert ChildRepository.child_operation._monitored
+    assert ChildRepository.helper() == "static"
+
+    repo = ChildRepository()
+    assert "test_operation" not in vars(repo)
+    with patch.object(metrics_collector, 'log_audit') as log_audit:
+        assert repo.child_operation() == "child"
+        assert repo.test_operation() == "test"
+    assert [call.kwargs["details"]["repository"] for call in log_audit.call_args_list] == \
+        ["ChildRepository", "ChildRepository"]
+
+def test_async_repository_methods_are_awaited(metrics_collector):
+    """Test that coroutine methods are timed, and their errors seen, once awaited."""
+    import asyncio
+    import inspect as pyinspect
+
+    @monitor_repository
+    class AsyncRepository:
+        async def slow_operation(self):
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def failing_operation(self):
+            await asyncio.sleep(0)
+            raise ValueError("async failure")
+
+    repo = AsyncRepository()
+    assert pyinspect.iscoroutinefunction(AsyncRepository.slow_operation)
+    with patch.object(metrics_collector, 'log_audit') as log_audit, \
+            patch.object(metrics_collector, 'log_error') as log_error:
+        assert asyncio.run(repo.slow_operation()) == "done"
+        assert log_audit.call_args.kwargs["details"]["duration"] >= 0.05
+
+        with pytest.raises(ValueError):
+            asyncio.run(repo.failing_operation())
+        assert isinstance(log_error.call_args.args[0], ValueError)
+
 @monitor_query
 def test_query(query: str):
     """Test query for monitoring decorator."""
@@ -126,9 +236,50 @@ def test_query_monitoring(metrics_collector):
         test_query("SELECT pg_sleep(2)")
     
     metrics = metrics_collector.get_metrics()
-    slow_queries = [q for q in metrics["metrics"]["queries"].values() if q["slow"]]
+    slow_queries = [q for q in metrics["metrics"]["queries"] if q["slow"]]
     assert len(slow_queries) > 0
 
+def test_query_arguments_rendered_only_when_slow_or_failed(metrics_collector):
+    """Test that monitor_query keeps large arguments out of fast query contexts."""
+    @monitor_query
+    def run(rows):
+        if len(rows) > 1000:
+            raise ValueError("too many rows")
+        return len(rows)
+
+    rows = [("x" * 100,)] * 1000
+    with patch.object(metrics_collector, 'log_query') as log_query:
+        assert run(rows) == 1000
+    assert log_query.call_args.kwargs["context"] == {"function": "run"}
+
+    with patch.object(metrics_collector, 'log_query') as log_query, \
+            patch.object(metrics_collector, 'log_error'):
+        with pytest.raises(ValueError):
+            run(rows * 2)
+    context = log_query.call_args.kwargs["context"]
+    assert context["args"].startswith("([('xxx") and len(context["args"]) == 256
+    assert context["kwargs"] == "{}"
+
+def test_pool_metrics_throttled(metrics_collector):
+    """Test that pool stats are read at most once per interval from the cached pool."""
+    from ..monitoring import monitor
+
+    pool = MagicMock(spec=QueuePool)
+    pool.size.return_value = 5
+    pool.checkedin.return_value = 4
+    pool.overflow.return_value = 0
+    pool.checkedout.return_value = 1
+    with patch.object(monitor, '_pool', pool), patch.object(monitor, '_last_pool_update', 0.0):
+        for _ in range(10):
+            monitor._update_pool_metrics()
+        assert pool.size.call_count == 1
+
+        monitor._last_pool_update -= monitor.POOL_METRICS_INTERVAL
+        monitor._update_pool_metrics()
+        assert pool.size.call_count == 2
+    assert metrics_collector._metrics["pool"]["checkedout"] == 1
+    assert metrics_collector._metrics["pool"]["utilization"] == 0.2
+
 def test_storage_monitoring(setup_test_db):
     """Test storage usage monitoring."""
     monitor = initialize_monitoring()
@@ -148,17 +299,16 @@ def test_storage_monitoring(setup_test_db):
 def test_log_retention(metrics_collector):
     """Test log retention and cleanup."""
     # Add old metrics
-    old_date = (datetime.utcnow() - timedelta(days=8)).isoformat()
-    metrics_collector._metrics["queries"][old_date] = {
-        "duration": 0.1,
-        "slow": False
-    }
+    old_sample = (time.time() - 8 * 86400, 0.1, False)
+    metrics_collector._metrics["queries"].appendleft(old_sample)
+    metrics_collector.log_query("SELECT 1", 0.1)
     
     # Cleanup old metrics
     metrics_collector.cleanup_old_metrics()
     
-    # Verify old metrics were removed
-    assert old_date not in metrics_collector._metrics["queries"]
+    # Verify old metrics were removed and recent ones kept
+    assert old_sample not in metrics_collector._metrics["queries"]
+    assert len(metrics_collector._metrics["queries"]) > 0
 
 def test_alert_cooldown(alert_manager):
     """Test alert cooldown period."""
@@ -172,6 +322,28 @@ def test_alert_cooldown(alert_manager):
     # Immediate second alert should be suppressed
     alert_manager.check_error_rate(10, 100)
     assert mock_handler.call_count == first_call_count  # No new alerts
+    
+    # Once the cooldown has elapsed on the monotonic clock it fires again
+    alert_manager._last_alerts["error_rate"] -= alert_manager._thresholds["error_rate"][2]
+    alert_manager.check_error_rate(10, 100)
+    assert mock_handler.call_count == first_call_count + 1
+
+def test_critical_alert_context(alert_manager):
+    """Test that a ratio past the critical threshold alerts with its context."""
+    mock_handler = MagicMock()
+    alert_manager.add_alert_handler(mock_handler)
+    alert_manager._last_alerts.pop("storage_usage", None)
+    
+    alert_manager.check_storage_usage(95, 100)
+    mock_handler.assert_called_once_with(
+        "Critical storage usage threshold exceeded",
+        AlertSeverity.CRITICAL,
+        {"usage_ratio": 0.95, "used_bytes": 95, "total_bytes": 100}
+    )
+    
+    # Below the warning threshold nothing fires
+    alert_manager.check_slow_queries(1, 100)
+    assert mock_handler.call_count == 1
 
 def test_monitoring_integration(setup_test_db, metrics_collector, alert_manager):
     """Test full monitoring integration."""
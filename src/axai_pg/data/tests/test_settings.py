@@ -1,5 +1,6 @@
 import pytest
 import os
+import dataclasses
 from ..config.settings import Settings, AppSettings
 from ..config.database import PostgresConnectionConfig
 
@@ -55,6 +56,9 @@ def test_missing_required_env_vars(monkeypatch):
     with pytest.raises(ValueError) as exc_info:
         Settings.reload()
     assert "Required environment variable" in str(exc_info.value)
+    # All missing variables are reported at once
+    assert "POSTGRES_HOST" in str(exc_info.value)
+    assert "POSTGRES_PASSWORD" in str(exc_info.value)
 
 def test_invalid_environment(mock_env_vars, monkeypatch):
     """Test handling of invalid environment name."""
@@ -70,14 +74,19 @@ def test_validation(mock_env_vars):
     settings.validate()  # Should not raise any exceptions
     
     # Test invalid pool size
-    settings.env_config.pool_config.pool_size = 0
+    settings = dataclasses.replace(
+        settings,
+        env_config=dataclasses.replace(
+            settings.env_config,
+            pool_config=dataclasses.replace(settings.env_config.pool_config, pool_size=0),
+        ),
+    )
     with pytest.raises(ValueError) as exc_info:
         settings.validate()
     assert "Pool size must be at least 1" in str(exc_info.value)
     
     # Reset pool size and test invalid timeout
-    settings = Settings.reload()
-    settings.connection_timeout = 0
+    settings = dataclasses.replace(Settings.reload(), connection_timeout=0)
     with pytest.raises(ValueError) as exc_info:
         settings.validate()
     assert "Connection timeout must be positive" in str(exc_info.value)
@@ -94,6 +103,32 @@ def test_engine_settings(mock_env_vars):
     assert 'connect_args' in engine_settings
     assert 'connect_timeout' in engine_settings['connect_args']
     assert 'sslmode' in engine_settings['connect_args']
+    assert engine_settings['connect_args']['application_name'] == 'axai-pg'
+    assert engine_settings['connect_args']['options'] == (
+        "-c statement_timeout=30000 -c idle_in_transaction_session_timeout=60000"
+    )
+
+    # Built once per settings instance
+    assert settings.get_engine_settings() is engine_settings
+
+def test_settings_are_immutable(mock_env_vars):
+    """Test that loaded settings cannot be modified in place."""
+    settings = Settings.get()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.log_sql = True
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.conn_config.host = 'other-host'
+    assert hash(settings) == hash(dataclasses.replace(settings))
+
+def test_server_timeouts_from_env(mock_env_vars, monkeypatch):
+    """Test that server-side timeouts are read from the environment."""
+    monkeypatch.setenv('DB_STMT_TIMEOUT_MS', '5000')
+    monkeypatch.setenv('DB_IDLE_TX_TIMEOUT_MS', '0')
+    settings = Settings.reload()
+
+    assert settings.statement_timeout_ms == 5000
+    assert settings.idle_in_transaction_timeout_ms == 0
+    assert "statement_timeout=5000" in settings.get_engine_settings()['connect_args']['options']
 
 def test_different_environments(mock_env_vars, monkeypatch):
     """Test settings across different environments."""
@@ -105,9 +140,10 @@ def test_different_environments(mock_env_vars, monkeypatch):
     
     # Test production environment
     monkeypatch.setenv('APP_ENV', 'production')
+    monkeypatch.setenv('POSTGRES_POOL_SIZE', '20')
     prod_settings = Settings.reload()
     assert prod_settings.environment == 'production'
-    assert prod_settings.env_config.pool_config.pool_size == 5
+    assert prod_settings.env_config.pool_config.pool_size == 20
 
 def test_debug_and_logging_flags(mock_env_vars, monkeypatch):
     """Test debug and logging configuration."""
@@ -10,6 +10,8 @@ from .fixtures import (
     axai_db_session,
     axai_db_config,
     axai_db_manager,
+    axai_bulk_loader,
+    BulkLoader,
 )
 
 __all__ = [
@@ -17,4 +19,6 @@ __all__ = [
     'axai_db_session',
     'axai_db_config',
     'axai_db_manager',
+    'axai_bulk_loader',
+    'BulkLoader',
 ]
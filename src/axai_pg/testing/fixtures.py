@@ -14,10 +14,10 @@ Usage in external test file:
 
 import os
 import pytest
-from typing import Generator
+from typing import Generator, Iterable, Sequence
 
 from ..utils.db_initializer import DatabaseInitializer, DatabaseInitializerConfig
-from ..data.config.database import PostgresConnectionConfig, DatabaseManager
+from ..data.config.database import PostgresConnectionConfig, DatabaseManager, copy_rows
 
 
 @pytest.fixture(scope="session")
@@ -99,7 +99,9 @@ def axai_db_session(axai_test_db: DatabaseInitializer) -> Generator:
     Function-scoped fixture providing a database session with automatic rollback.
 
     Each test gets a fresh session that is rolled back after the test completes,
-    ensuring test isolation without recreating the database.
+    ensuring test isolation without recreating the database. The session joins
+    the outer transaction through a SAVEPOINT, so tests may call commit() or
+    rollback() without persisting anything.
 
     Args:
         axai_test_db: Session-scoped database initializer
@@ -114,9 +116,8 @@ def axai_db_session(axai_test_db: DatabaseInitializer) -> Generator:
     transaction = connection.begin()
 
     # Create a session bound to this connection
-    from sqlalchemy.orm import sessionmaker
-    Session = sessionmaker(bind=connection)
-    session = Session()
+    from sqlalchemy.orm import Session
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
@@ -126,6 +127,70 @@ def axai_db_session(axai_test_db: DatabaseInitializer) -> Generator:
     connection.close()
 
 
+class BulkLoader:
+    """
+    Load test rows straight into a table with COPY, bypassing the ORM.
+
+    Rows are written on the session's own connection, so they are visible to
+    the session and rolled back with it. Columns left out of ``columns`` that
+    have a Python-side default (e.g. ``id`` with ``uuid.uuid4``) are filled
+    in automatically; server-side defaults apply as usual.
+    """
+
+    def __init__(self, session):
+        self._session = session
+
+    def copy(self, model, rows: Iterable[Sequence], columns: Sequence[str]) -> int:
+        """
+        Copy rows into the model's table.
+
+        Args:
+            model: Mapped model class (e.g. Document)
+            rows: Row tuples, in the same order as ``columns``
+            columns: Column names supplied by each row
+
+        Returns:
+            Number of rows copied
+        """
+        table = model.__table__
+        defaults = [
+            column for column in table.columns
+            if column.name not in columns
+            and column.default is not None
+            and (column.default.is_scalar or column.default.is_callable)
+        ]
+        names = list(columns) + [column.name for column in defaults]
+
+        # Make pending ORM objects (e.g. parents of these rows) visible to COPY
+        self._session.flush()
+        records = (
+            tuple(row) + tuple(
+                column.default.arg if column.default.is_scalar else column.default.arg(None)
+                for column in defaults
+            )
+            for row in rows
+        )
+        return copy_rows(self._session.connection(), table.name, names, records)
+
+
+@pytest.fixture(scope="function")
+def axai_bulk_loader(axai_db_session) -> BulkLoader:
+    """
+    Function-scoped fixture providing a COPY-based bulk loader.
+
+    Use it to create many rows of test data without constructing ORM
+    objects. Loaded rows share axai_db_session's transaction and are rolled
+    back after the test.
+
+    Args:
+        axai_db_session: Rollback-isolated database session
+
+    Returns:
+        BulkLoader instance
+    """
+    return BulkLoader(axai_db_session)
+
+
 @pytest.fixture(scope="function")
 def axai_db_manager(axai_test_db: DatabaseInitializer) -> DatabaseManager:
     """
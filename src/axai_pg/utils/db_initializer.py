@@ -16,6 +16,7 @@ Usage:
 """
 
 import os
+import dataclasses
 import logging
 import subprocess
 import time
@@ -115,6 +116,30 @@ class DatabaseInitializer:
                 logger.error(f"Error during database teardown: {e}")
         return False
 
+    def _admin_connection_config(self) -> PostgresConnectionConfig:
+        """
+        The connection config with the server-side timeouts lifted.
+
+        Creating databases, building the schema and its indexes and loading
+        sample data can legitimately run longer than an application
+        statement is allowed to; cancelling them part way would leave a
+        half-built schema.
+        """
+        return dataclasses.replace(
+            self.config.connection_config,
+            statement_timeout_ms=0,
+            idle_in_transaction_timeout_ms=0,
+        )
+
+    def _create_admin_engine(self, database: Optional[str] = None, **kwargs) -> Engine:
+        """Create an engine without server-side timeouts (see _admin_connection_config)."""
+        conn_config = self._admin_connection_config()
+        return create_engine(
+            conn_config.get_url(database=database),
+            connect_args=conn_config.connect_args(),
+            **kwargs,
+        )
+
     def _get_admin_engine(self) -> Engine:
         """
         Get an engine connected to the postgres database (for admin operations).
@@ -122,12 +147,7 @@ class DatabaseInitializer:
         Returns:
             SQLAlchemy engine connected to postgres database
         """
-        conn_config = self.config.connection_config
-        admin_url = (
-            f"postgresql://{conn_config.username}:{conn_config.password}@"
-            f"{conn_config.host}:{conn_config.port}/postgres"
-        )
-        return create_engine(admin_url, isolation_level="AUTOCOMMIT")
+        return self._create_admin_engine(database="postgres", isolation_level="AUTOCOMMIT")
 
     def _wait_for_database(self) -> bool:
         """
@@ -260,13 +280,7 @@ class DatabaseInitializer:
         if use_sqlalchemy:
             logger.info("Applying schema using SQLAlchemy models...")
             try:
-                conn_config = self.config.connection_config
-                db_url = (
-                    f"postgresql://{conn_config.username}:{conn_config.password}@"
-                    f"{conn_config.host}:{conn_config.port}/{conn_config.database}"
-                )
-
-                engine = create_engine(db_url)
+                engine = self._create_admin_engine()
 
                 # Use PostgreSQLSchemaBuilder to create complete schema
                 # Note: build_complete_schema now raises exceptions instead of returning bool
@@ -294,26 +308,22 @@ class DatabaseInitializer:
                 with open(schema_path, 'r') as f:
                     schema_sql = f.read()
 
-                conn_config = self.config.connection_config
-                db_url = (
-                    f"postgresql://{conn_config.username}:{conn_config.password}@"
-                    f"{conn_config.host}:{conn_config.port}/{conn_config.database}"
-                )
-
-                engine = create_engine(db_url)
-                with engine.connect() as conn:
-                    # Execute schema in a transaction
-                    trans = conn.begin()
-                    try:
-                        # Split by semicolon and execute each statement
-                        statements = [s.strip() for s in schema_sql.split(';') if s.strip()]
-                        for statement in statements:
-                            if statement:
-                                conn.execute(text(statement))
-                        trans.commit()
-                    except Exception as e:
-                        trans.rollback()
-                        raise e
+                engine = self._create_admin_engine()
+                # Send the whole file in one execute() on the driver connection:
+                # without bind parameters the server runs every statement from
+                # a single round-trip, and statements containing ';' (e.g.
+                # function bodies) are not broken up by client-side splitting
+                conn = engine.raw_connection()
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute(schema_sql)
+                    cursor.close()
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    raise e
+                finally:
+                    conn.close()
 
                 engine.dispose()
                 logger.info("Schema applied successfully from SQL file")
@@ -349,6 +359,9 @@ class DatabaseInitializer:
                 'POSTGRES_DB': self.config.connection_config.database,
                 'POSTGRES_USER': self.config.connection_config.username,
                 'POSTGRES_PASSWORD': self.config.connection_config.password,
+                # A large seed set may take longer than an application statement
+                'DB_STMT_TIMEOUT_MS': '0',
+                'DB_IDLE_TX_TIMEOUT_MS': '0',
             })
 
             result = subprocess.run(
@@ -425,8 +438,8 @@ class DatabaseInitializer:
         logger.info("Starting database teardown...")
 
         # Close database manager connections
-        if self._db_manager and self._db_manager._engine:
-            self._db_manager._engine.dispose()
+        if self._db_manager:
+            self._db_manager.dispose()
 
         # Drop database if configured to do so
         if self.config.auto_drop_on_exit:
@@ -484,10 +497,14 @@ class DatabaseInitializer:
         return self._db_manager
 
     @contextmanager
-    def session_scope(self):
+    def session_scope(self, no_expire: bool = True):
         """
         Provide a transactional scope for database operations.
 
+        Args:
+            no_expire: Keep loaded objects usable after commit without
+                reloading them; pass False to expire them instead
+
         Yields:
             Database session
 
@@ -495,5 +512,5 @@ class DatabaseInitializer:
             RuntimeError: If database is not set up
         """
         db_manager = self.get_database_manager()
-        with db_manager.session_scope() as session:
+        with db_manager.session_scope(no_expire=no_expire) as session:
             yield session
@@ -76,6 +76,96 @@ class PostgreSQLSchemaBuilder:
 
         logger.info("Update timestamp trigger function created")
 
+    @staticmethod
+    def create_audit_log_partition_functions(engine: Engine):
+        """
+        Create the functions that manage audit_logs' monthly partitions.
+
+        ensure_audit_log_partitions(months_ahead) creates the partitions for
+        the current month and the next ``months_ahead`` months (UTC), moving
+        any matching rows out of audit_logs_default first.
+        drop_audit_log_partitions(older_than) detaches and drops every monthly
+        partition that ends at or before ``older_than``. Both return the
+        number of partitions they created or dropped and are meant to be run
+        from a scheduled job.
+
+        Args:
+            engine: SQLAlchemy engine
+        """
+        logger.info("Creating audit log partition functions...")
+
+        functions = [
+            """
+            CREATE OR REPLACE FUNCTION ensure_audit_log_partitions(months_ahead integer DEFAULT 1)
+            RETURNS integer AS $$
+            DECLARE
+                month_start timestamp;
+                lower_bound timestamptz;
+                upper_bound timestamptz;
+                partition_name text;
+                created integer := 0;
+            BEGIN
+                FOR i IN 0..months_ahead LOOP
+                    month_start := date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => i);
+                    partition_name := 'audit_logs_' || to_char(month_start, 'YYYY_MM');
+                    CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+                    lower_bound := month_start AT TIME ZONE 'UTC';
+                    upper_bound := (month_start + interval '1 month') AT TIME ZONE 'UTC';
+
+                    -- Attaching fails while the default partition holds rows
+                    -- for the new range, so move them across first
+                    EXECUTE format('CREATE TABLE %I (LIKE audit_logs INCLUDING DEFAULTS)', partition_name);
+                    EXECUTE format(
+                        'WITH moved AS (DELETE FROM audit_logs_default '
+                        'WHERE action_time >= $1 AND action_time < $2 RETURNING *) '
+                        'INSERT INTO %I SELECT * FROM moved',
+                        partition_name
+                    ) USING lower_bound, upper_bound;
+                    EXECUTE format(
+                        'ALTER TABLE audit_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, lower_bound, upper_bound
+                    );
+                    created := created + 1;
+                END LOOP;
+                RETURN created;
+            END;
+            $$ LANGUAGE plpgsql;
+            """,
+            """
+            CREATE OR REPLACE FUNCTION drop_audit_log_partitions(older_than timestamptz)
+            RETURNS integer AS $$
+            DECLARE
+                partition_name text;
+                dropped integer := 0;
+            BEGIN
+                FOR partition_name IN
+                    SELECT c.relname
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = 'audit_logs'::regclass
+                      AND c.relname ~ '^audit_logs_[0-9]{4}_[0-9]{2}$'
+                    ORDER BY c.relname
+                LOOP
+                    CONTINUE WHEN (to_date(substr(partition_name, 12), 'YYYY_MM') + interval '1 month')
+                        AT TIME ZONE 'UTC' > older_than;
+                    EXECUTE format('ALTER TABLE audit_logs DETACH PARTITION %I', partition_name);
+                    EXECUTE format('DROP TABLE %I', partition_name);
+                    dropped := dropped + 1;
+                END LOOP;
+                RETURN dropped;
+            END;
+            $$ LANGUAGE plpgsql;
+            """,
+        ]
+
+        with engine.connect() as conn:
+            for function_sql in functions:
+                conn.execute(text(function_sql))
+            conn.commit()
+
+        logger.info("Audit log partition functions created")
+
     @staticmethod
     def create_table_triggers(engine: Engine):
         """
@@ -140,6 +230,7 @@ class PostgreSQLSchemaBuilder:
             'users': 'Users belong to organizations and can own documents',
             'documents': 'Unified document/file storage with ownership and metadata',
             'document_versions': 'Historical versions of documents for version control',
+            'document_tags': 'One row per tag on a document',
             'summaries': 'Document summaries generated by various tools/agents',
             'topics': 'Topics extracted from document content',
             'document_topics': 'Many-to-many relationship between documents and topics',
@@ -162,9 +253,12 @@ class PostgreSQLSchemaBuilder:
         with engine.connect() as conn:
             for table_name, comment in comments.items():
                 try:
+                    # Utility statements can't take bind parameters under
+                    # psycopg 3's server-side binding, so inline the literal
+                    quoted = comment.replace("'", "''")
                     conn.execute(text(
-                        f"COMMENT ON TABLE {table_name} IS :comment"
-                    ), {"comment": comment})
+                        f"COMMENT ON TABLE {table_name} IS '{quoted}'"
+                    ))
                     logger.debug(f"Added comment to table: {table_name}")
                 except Exception as e:
                     logger.warning(f"Could not add comment to {table_name}: {e}")
@@ -183,65 +277,19 @@ class PostgreSQLSchemaBuilder:
         """
         logger.info("Creating performance indexes...")
 
+        # Only indexes the models don't declare; anything repeated here under
+        # another name would be a second copy maintained on every write
         indexes = [
             # Document indexes for common queries
-            "CREATE INDEX IF NOT EXISTS idx_documents_org_status ON documents(org_id, status)",
-            "CREATE INDEX IF NOT EXISTS idx_documents_owner ON documents(owner_id)",
-            "CREATE INDEX IF NOT EXISTS idx_documents_type ON documents(document_type)",
             "CREATE INDEX IF NOT EXISTS idx_documents_processing ON documents(processing_status)",
-            "CREATE INDEX IF NOT EXISTS idx_documents_filename ON documents(filename)",
-
-            # User indexes
-            "CREATE INDEX IF NOT EXISTS idx_users_org ON users(org_id)",
-            "CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)",
 
             # Summary indexes
             "CREATE INDEX IF NOT EXISTS idx_summaries_document ON summaries(document_id)",
             "CREATE INDEX IF NOT EXISTS idx_summaries_type ON summaries(summary_type)",
 
             # Topic indexes
-            "CREATE INDEX IF NOT EXISTS idx_topics_name ON topics(name)",
             "CREATE INDEX IF NOT EXISTS idx_document_topics_document ON document_topics(document_id)",
             "CREATE INDEX IF NOT EXISTS idx_document_topics_topic ON document_topics(topic_id)",
-
-            # Graph indexes (updated for GraphEntity)
-            "CREATE INDEX IF NOT EXISTS idx_graph_entities_document ON graph_entities(document_id)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_entities_entity_type ON graph_entities(entity_type)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_entities_source_file ON graph_entities(source_file_id)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_entities_source_collection ON graph_entities(source_collection_id)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_rel_source ON graph_relationships(source_entity_id)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_rel_target ON graph_relationships(target_entity_id)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_rel_document ON graph_relationships(document_id)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_rel_source_file ON graph_relationships(source_file_id)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_rel_source_collection ON graph_relationships(source_collection_id)",
-
-            # Collection indexes
-            "CREATE INDEX IF NOT EXISTS idx_collections_owner ON collections(owner_id)",
-            "CREATE INDEX IF NOT EXISTS idx_collections_org ON collections(org_id)",
-            "CREATE INDEX IF NOT EXISTS idx_collection_entities_collection ON collection_entities(collection_id)",
-            "CREATE INDEX IF NOT EXISTS idx_collection_entities_entity_id ON collection_entities(entity_id)",
-            "CREATE INDEX IF NOT EXISTS idx_collection_relationships_collection ON collection_relationships(collection_id)",
-            "CREATE INDEX IF NOT EXISTS idx_entity_links_graph_entity ON entity_links(graph_entity_id)",
-            "CREATE INDEX IF NOT EXISTS idx_entity_links_collection_entity ON entity_links(collection_entity_id)",
-            "CREATE INDEX IF NOT EXISTS idx_entity_operations_collection ON entity_operations(collection_id)",
-            "CREATE INDEX IF NOT EXISTS idx_doc_collection_contexts_document ON document_collection_contexts(document_id)",
-            "CREATE INDEX IF NOT EXISTS idx_doc_collection_contexts_collection ON document_collection_contexts(collection_id)",
-
-            # Visibility profile indexes
-            "CREATE INDEX IF NOT EXISTS idx_visibility_profiles_owner ON visibility_profiles(owner_id)",
-
-            # Role and security indexes
-            "CREATE INDEX IF NOT EXISTS idx_roles_name ON roles(name)",
-            "CREATE INDEX IF NOT EXISTS idx_user_roles_user ON user_roles(user_id)",
-            "CREATE INDEX IF NOT EXISTS idx_user_roles_role ON user_roles(role_id)",
-            "CREATE INDEX IF NOT EXISTS idx_tokens_user ON tokens(user_id)",
-            "CREATE INDEX IF NOT EXISTS idx_tokens_expires ON tokens(expires_at)",
-            "CREATE INDEX IF NOT EXISTS idx_audit_logs_user ON audit_logs(user_id)",
-            "CREATE INDEX IF NOT EXISTS idx_audit_logs_time ON audit_logs(action_time)",
-
-            # Feedback indexes
-            "CREATE INDEX IF NOT EXISTS idx_feedback_user ON feedback(user_id)",
-            "CREATE INDEX IF NOT EXISTS idx_feedback_type ON feedback(type)",
         ]
 
         with engine.connect() as conn:
@@ -268,6 +316,7 @@ class PostgreSQLSchemaBuilder:
         4. Creates triggers
         5. Adds table comments
         6. Creates performance indexes
+        7. Creates audit log partitions
 
         Args:
             engine: SQLAlchemy engine
@@ -297,6 +346,12 @@ class PostgreSQLSchemaBuilder:
         # Step 6: Create performance indexes
         cls.create_performance_indexes(engine)
 
+        # Step 7: Create this month's and next month's audit log partitions
+        cls.create_audit_log_partition_functions(engine)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT ensure_audit_log_partitions()"))
+            conn.commit()
+
         logger.info("Complete database schema built successfully")
 
     @classmethod
@@ -320,6 +375,8 @@ class PostgreSQLSchemaBuilder:
         # Drop functions
         with engine.connect() as conn:
             conn.execute(text("DROP FUNCTION IF EXISTS update_modified_column() CASCADE"))
+            conn.execute(text("DROP FUNCTION IF EXISTS ensure_audit_log_partitions(integer)"))
+            conn.execute(text("DROP FUNCTION IF EXISTS drop_audit_log_partitions(timestamptz)"))
             conn.commit()
 
         logger.info("Complete database schema dropped successfully")
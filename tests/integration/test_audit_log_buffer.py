@@ -0,0 +1,146 @@
+"""
+Integration tests for batched audit log writes.
+"""
+
+import asyncio
+import time
+import uuid
+import pytest
+from sqlalchemy import create_engine, delete, select
+
+from axai_pg import User
+from axai_pg.data.models import AuditLog
+from axai_pg.data.security.audit_buffer import AuditLogBuffer
+
+
+@pytest.fixture
+def audit_user(test_engine):
+    """A committed user, removed with its audit rows afterwards."""
+    with test_engine.begin() as conn:
+        user_id = conn.execute(
+            User.__table__.insert().values(username="audited", email="audited@example.com")
+            .returning(User.id)
+        ).scalar_one()
+    yield user_id
+    with test_engine.begin() as conn:
+        conn.execute(delete(AuditLog).where(AuditLog.username == "audited"))
+        conn.execute(delete(User).where(User.id == user_id))
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestAuditLogBuffer:
+    """Test queuing and batch-writing audit rows."""
+
+    def test_batch_is_written_with_one_statement(self, test_engine, audit_user, statement_counter):
+        """A full batch is written by a single executemany, with usernames filled in."""
+        def audit_writes(statements):
+            return [many for statement, many in zip(statements, statements.executemany)
+                    if 'audit_logs' in statement]
+
+        buffer = AuditLogBuffer(test_engine, batch_size=5)
+        with statement_counter(test_engine) as statements:
+            for i in range(4):
+                buffer.append({"user_id": audit_user, "action": f"read-{i}", "resource_type": "documents"})
+            assert audit_writes(statements) == [] and len(buffer) == 4
+
+            buffer.append({"user_id": audit_user, "action": "read-4", "resource_type": "documents"})
+
+        assert audit_writes(statements) == [True]
+        assert len(buffer) == 0
+
+        with test_engine.connect() as conn:
+            rows = conn.execute(
+                select(AuditLog.username, AuditLog.action).where(AuditLog.user_id == audit_user)
+                .order_by(AuditLog.id)
+            ).all()
+        assert rows == [("audited", f"read-{i}") for i in range(5)]
+
+    def test_action_time_is_taken_on_append(self, test_engine, audit_user):
+        """Rows keep the time they were queued, not the time they were written."""
+        buffer = AuditLogBuffer(test_engine)
+        buffer.append({"user_id": audit_user, "action": "read", "resource_type": "documents"})
+        queued_at = buffer._rows[0]["action_time"]
+        assert buffer.flush() == 1
+
+        with test_engine.connect() as conn:
+            written = conn.execute(
+                select(AuditLog.action_time).where(AuditLog.user_id == audit_user)
+            ).scalar_one()
+        assert written == queued_at
+
+    def test_unknown_columns_are_rejected(self, test_engine):
+        """Misspelled keys fail on append rather than when the batch is written."""
+        buffer = AuditLogBuffer(test_engine)
+        with pytest.raises(ValueError):
+            buffer.append({"action_type": "read", "resource_type": "documents"})
+        assert len(buffer) == 0
+
+    def test_background_flusher_drains_queue(self, test_engine, audit_user):
+        """run() writes on its interval and flushes what is left when cancelled."""
+        buffer = AuditLogBuffer(test_engine, interval=0.05)
+
+        async def scenario():
+            task = asyncio.create_task(buffer.run())
+            buffer.append({"user_id": audit_user, "action": "first", "resource_type": "documents"})
+            await asyncio.sleep(0.2)
+            assert len(buffer) == 0
+
+            buffer.append({"user_id": audit_user, "action": "last", "resource_type": "documents"})
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+
+        with test_engine.connect() as conn:
+            actions = conn.execute(
+                select(AuditLog.action).where(AuditLog.user_id == audit_user).order_by(AuditLog.id)
+            ).scalars().all()
+        assert actions == ["first", "last"]
+
+    def test_rejected_row_does_not_fail_the_batch(self, test_engine, audit_user):
+        """A row the database rejects is dead-lettered and the rest are written."""
+        buffer = AuditLogBuffer(test_engine, batch_size=3)
+        unknown = {"user_id": uuid.uuid4(), "action": "ghost", "resource_type": "documents"}
+        buffer.append({"user_id": audit_user, "action": "before", "resource_type": "documents"})
+        buffer.append(unknown)
+        buffer.append({"user_id": audit_user, "action": "after", "resource_type": "documents"})
+
+        assert len(buffer) == 0
+        assert [row["action"] for row in buffer.dead_letters] == ["ghost"]
+        with test_engine.connect() as conn:
+            actions = conn.execute(
+                select(AuditLog.action).where(AuditLog.user_id == audit_user).order_by(AuditLog.id)
+            ).scalars().all()
+        assert actions == ["before", "after"]
+
+    def test_unreachable_database_keeps_rows_queued(self, test_engine):
+        """When nothing can be written the rows stay queued, in order, and flush() does not raise."""
+        broken = create_engine(test_engine.url.set(port=1), pool_pre_ping=False)
+        buffer = AuditLogBuffer(broken)
+        buffer.append({"username": "x", "action": "first", "resource_type": "documents"})
+        buffer.append({"username": "x", "action": "second", "resource_type": "documents"})
+
+        assert buffer.flush() == 0
+        assert [row["action"] for row in buffer._rows] == ["first", "second"]
+        assert not buffer.dead_letters
+        broken.dispose()
+
+    def test_started_flusher_writes_on_stop(self, test_engine, audit_user):
+        """start() flushes on its interval from a thread and stop() writes the remainder."""
+        buffer = AuditLogBuffer(test_engine, interval=0.05)
+        buffer.start()
+        try:
+            buffer.append({"user_id": audit_user, "action": "first", "resource_type": "documents"})
+            time.sleep(0.2)
+            assert len(buffer) == 0
+            buffer.append({"user_id": audit_user, "action": "last", "resource_type": "documents"})
+        finally:
+            buffer.stop()
+
+        with test_engine.connect() as conn:
+            actions = conn.execute(
+                select(AuditLog.action).where(AuditLog.user_id == audit_user).order_by(AuditLog.id)
+            ).scalars().all()
+        assert actions == ["first", "last"]
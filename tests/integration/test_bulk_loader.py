@@ -0,0 +1,60 @@
+"""
+Integration tests for the COPY-based BulkLoader testing utility.
+"""
+
+import pytest
+import uuid
+from sqlalchemy import select, func
+
+from axai_pg import Organization, User, Document
+from axai_pg.testing.fixtures import BulkLoader
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestBulkLoader:
+    """Test loading rows with BulkLoader."""
+
+    def test_copy_fills_python_defaults(self, db_session):
+        """Rows are copied and missing Python-side defaults (id, status) are generated."""
+        org = Organization(name="Bulk Org")
+        user = User(username="bulkuser", email="bulk@example.com")
+        db_session.add_all([org, user])
+        db_session.flush()
+
+        loader = BulkLoader(db_session)
+        rows = [
+            (f"Doc {i}", f"doc_{i}.txt", user.id, org.id, f"/docs/doc_{i}.txt", 10, "text/plain", "text")
+            for i in range(50)
+        ]
+        count = loader.copy(
+            Document,
+            rows,
+            columns=("title", "filename", "owner_id", "org_id", "file_path",
+                     "size", "content_type", "document_type"),
+        )
+        assert count == 50
+
+        docs = db_session.execute(
+            select(Document.id, Document.status, Document.version).where(Document.org_id == org.id)
+        ).all()
+        assert len(docs) == 50
+        assert all(isinstance(doc.id, uuid.UUID) for doc in docs)
+        assert len({doc.id for doc in docs}) == 50
+        assert {(doc.status, doc.version) for doc in docs} == {("draft", 1)}
+
+    def test_copy_sees_pending_orm_objects(self, db_session):
+        """Unflushed parent objects are flushed before the COPY runs."""
+        org = Organization(id=uuid.uuid4(), name="Pending Org")
+        db_session.add(org)
+
+        BulkLoader(db_session).copy(
+            User,
+            [("pending1", "pending1@example.com", org.id)],
+            columns=("username", "email", "org_id"),
+        )
+
+        count = db_session.execute(
+            select(func.count()).select_from(User).where(User.org_id == org.id)
+        ).scalar_one()
+        assert count == 1
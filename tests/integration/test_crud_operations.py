@@ -8,6 +8,7 @@ PostgreSQL database, including relationships and queries.
 import pytest
 import uuid
 from axai_pg import Organization, User, Document, Summary, Topic, DocumentTopic, Collection, VisibilityProfile
+from axai_pg.data.models import CollectionClosure
 
 
 @pytest.mark.integration
@@ -43,7 +44,7 @@ class TestCRUDOperations:
 
         # Verify relationship
         assert user.organization.id == org.id
-        assert org.users.first().id == user.id
+        assert db_session.scalars(org.users.select()).first().id == user.id
 
     def test_create_document_with_summary(self, db_session):
         """Test creating document with summary and relationships."""
@@ -352,6 +353,219 @@ class TestCRUDOperations:
         assert root_collection.subcollections.first().id == child_collection.id
         assert root_collection.owner.id == user.id
 
+    def test_collection_closure_tracks_hierarchy(self, db_session):
+        """Test that the closure table follows inserts, moves and deletes."""
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        # Parents are linked through the relationship and flushed together
+        root = Collection(name="Root", owner_id=user.id, org_id=org.id)
+        child = Collection(name="Child", owner_id=user.id, org_id=org.id, parent=root)
+        grandchild = Collection(name="Grandchild", owner_id=user.id, org_id=org.id, parent=child)
+        other = Collection(name="Other Root", owner_id=user.id, org_id=org.id)
+        db_session.add_all([root, child, grandchild, other])
+        db_session.flush()
+
+        def subtree(collection, include_self=True):
+            query = Collection.subtree(collection.id, include_self=include_self)
+            return {c.name for c in db_session.scalars(query)}
+
+        assert subtree(root) == {"Root", "Child", "Grandchild"}
+        assert subtree(root, include_self=False) == {"Child", "Grandchild"}
+        depth = db_session.query(CollectionClosure.depth).filter_by(
+            ancestor_id=root.id, descendant_id=grandchild.id
+        ).scalar()
+        assert depth == 2
+
+        # Moving a collection carries its own descendants along
+        child.parent_id = other.id
+        db_session.flush()
+        assert subtree(root) == {"Root"}
+        assert subtree(other) == {"Other Root", "Child", "Grandchild"}
+        assert subtree(child) == {"Child", "Grandchild"}
+
+        # Deleting a collection drops its closure rows
+        db_session.delete(grandchild)
+        db_session.flush()
+        assert subtree(other) == {"Other Root", "Child"}
+        assert db_session.query(CollectionClosure).filter_by(descendant_id=grandchild.id).count() == 0
+
+    def test_collection_closure_follows_core_and_out_of_order_inserts(self, db_session):
+        """Test that the closure is complete when children are inserted before their parents."""
+        from sqlalchemy import insert
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        # Core executemany, leaf first; parent_id is checked at commit
+        root_id, child_id, leaf_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        db_session.execute(insert(Collection), [
+            {"id": leaf_id, "name": "Leaf", "owner_id": user.id, "parent_id": child_id},
+            {"id": child_id, "name": "Child", "owner_id": user.id, "parent_id": root_id},
+        ])
+        db_session.execute(insert(Collection), [{"id": root_id, "name": "Root", "owner_id": user.id}])
+
+        def subtree(collection_id):
+            return {c.name for c in db_session.scalars(Collection.subtree(collection_id))}
+
+        assert subtree(root_id) == {"Root", "Child", "Leaf"}
+        assert subtree(child_id) == {"Child", "Leaf"}
+        depth = db_session.query(CollectionClosure.depth).filter_by(
+            ancestor_id=root_id, descendant_id=leaf_id
+        ).scalar()
+        assert depth == 2
+        assert db_session.query(CollectionClosure).count() == 6
+
+    def test_bulk_entity_links_and_operations_skip_duplicates(self, db_session):
+        """Test batched EntityLink/EntityOperation inserts are idempotent."""
+        from datetime import datetime, timezone
+        from axai_pg import GraphEntity
+        from axai_pg.data.models import CollectionEntity, EntityLink, EntityOperation, OperationType, uuid7
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        collection = Collection(name="Collection", owner_id=user.id, org_id=org.id)
+        db_session.add(collection)
+        db_session.flush()
+
+        entities = [
+            GraphEntity(entity_id=f"e{i}", entity_type="Person", name=f"Person {i}", created_by_tool="test-tool")
+            for i in range(3)
+        ]
+        merged = CollectionEntity(collection_id=collection.id, entity_id="merged", entity_type="Person", name="Person")
+        db_session.add_all(entities + [merged])
+        db_session.flush()
+
+        links = [
+            {"graph_entity_id": e.id, "collection_entity_id": merged.id, "link_type": "exact_match"}
+            for e in entities
+        ]
+        assert EntityLink.bulk_upsert(db_session, links) == 3
+        assert EntityLink.bulk_upsert(db_session, links) == 0
+        assert EntityLink.bulk_upsert(db_session, []) == 0
+        assert db_session.query(EntityLink).filter_by(collection_entity_id=merged.id).count() == 3
+
+        performed_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        operations = [
+            {"id": uuid7(), "collection_id": collection.id, "entity_id": e.entity_id,
+             "operation_type": OperationType.merged, "performed_at": performed_at, "performed_by_id": user.id}
+            for e in entities
+        ]
+        assert EntityOperation.bulk_insert(db_session, operations) == 3
+        assert EntityOperation.bulk_insert(db_session, operations) == 0
+        assert db_session.query(EntityOperation).filter_by(collection_id=collection.id).count() == 3
+
+        # The same operation repeated in one transaction is recorded each time
+        repeated = {"collection_id": collection.id, "entity_id": "e0", "operation_type": OperationType.updated}
+        assert EntityOperation.bulk_insert(db_session, [repeated, repeated]) == 2
+        db_session.add_all([EntityOperation(**repeated), EntityOperation(**repeated)])
+        db_session.flush()
+        assert db_session.query(EntityOperation).filter_by(
+            collection_id=collection.id, operation_type=OperationType.updated
+        ).count() == 4
+
+    @pytest.mark.lazy_loads
+    def test_document_graph_entities_use_source_file(self, db_session):
+        """Test that a document reaches its graph entities through source_file_id alone."""
+        from axai_pg import GraphEntity
+        from axai_pg.data.models import SourceType
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        content = "Entity source"
+        document = Document(
+            title="Entity Source",
+            content=content,
+            owner_id=user.id,
+            org_id=org.id,
+            document_type="text",
+            status="draft",
+            filename="entities.txt",
+            file_path="/test/path/entities.txt",
+            size=len(content),
+            content_type="text/plain"
+        )
+        db_session.add(document)
+        db_session.flush()
+
+        entity = GraphEntity(
+            entity_id="doc-entities", entity_type="document", name="Entity Source",
+            source_type=SourceType.document, source_file_id=document.id,
+            created_by_tool="test-tool"
+        )
+        db_session.add(entity)
+        db_session.flush()
+
+        assert not hasattr(GraphEntity, 'document_id')
+        assert document.graph_entities.first() is entity
+        assert entity.source_file is document
+
+        # Entities are removed by the database cascade, not loaded and deleted
+        entity_id = entity.id
+        db_session.delete(document)
+        db_session.flush()
+        db_session.expunge_all()
+        assert db_session.get(GraphEntity, entity_id) is None
+
+    @pytest.mark.lazy_loads
+    def test_graph_edge_endpoints_load_in_one_batch(self, db_session, statement_counter):
+        """Test that edge endpoints load with one extra query per side, not per edge."""
+        from axai_pg import GraphEntity, GraphRelationship
+
+        entities = [
+            GraphEntity(entity_id=f"e{i}", entity_type="Person", name=f"Person {i}", created_by_tool="test-tool")
+            for i in range(4)
+        ]
+        db_session.add_all(entities)
+        db_session.flush()
+        for source, target in [(0, 1), (1, 2), (2, 3)]:
+            db_session.add(GraphRelationship(
+                source_entity_id=entities[source].id, target_entity_id=entities[target].id,
+                relationship_type="knows", created_by_tool="test-tool"
+            ))
+        db_session.flush()
+        hub_id = entities[1].id
+        db_session.expunge_all()
+
+        with statement_counter(db_session.get_bind()) as statements:
+            edges = db_session.query(GraphRelationship).filter_by(relationship_type="knows").all()
+            names = sorted((e.source_entity.name, e.target_entity.name) for e in edges)
+
+        assert names == [("Person 0", "Person 1"), ("Person 1", "Person 2"), ("Person 2", "Person 3")]
+        # One ``id IN (...)`` query for source entities and one for targets
+        assert len([s for s in statements if "FROM graph_entities" in s]) == 2
+
+        # Edge collections are plain lists, and deleting an entity leaves
+        # its edges to the database cascade
+        hub = db_session.get(GraphEntity, hub_id)
+        assert len(hub.outgoing_relationships) == 1
+        assert len(hub.incoming_relationships) == 1
+        db_session.delete(hub)
+        db_session.flush()
+        db_session.expunge_all()
+        assert db_session.query(GraphRelationship).filter_by(relationship_type="knows").count() == 1
+
     def test_create_visibility_profile_for_file(self, db_session):
         """Test creating visibility profile linked to a file/document."""
         # Create organization, user, and document
@@ -574,4 +788,425 @@ class TestCRUDOperations:
         assert updated_profile.name == "Updated Profile"
         assert updated_profile.enabled_entities == ["Person", "Organization", "Location"]
         assert updated_profile.is_active is False
-        assert updated_profile.owner_id == user.id  # Foreign key unchanged
\ No newline at end of file
+        assert updated_profile.owner_id == user.id  # Foreign key unchanged
+
+    def test_prebuilt_lookup_statements(self, db_session):
+        """Test that the shared by-id statements return the right rows."""
+        from sqlalchemy import inspect as sa_inspect
+        from axai_pg.data.models.queries import (
+            GET_COLLECTION_BY_ID, GET_DOCUMENT_BY_ID, GET_DOCUMENT_WITH_CONTENT_BY_ID, by_id
+        )
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        collection = Collection(name="Collection", owner_id=user.id, org_id=org.id)
+        document = Document(
+            title="Document",
+            content="content",
+            owner_id=user.id,
+            org_id=org.id,
+            document_type="text",
+            status="draft",
+            filename="doc.txt",
+            file_path="/test/path/doc.txt",
+            size=7,
+            content_type="text/plain"
+        )
+        db_session.add_all([collection, document])
+        db_session.flush()
+
+        assert db_session.execute(GET_DOCUMENT_BY_ID, {"id": document.id}).scalar_one() is document
+        assert db_session.execute(GET_COLLECTION_BY_ID, {"id": collection.id}).scalar_one() is collection
+        assert db_session.execute(by_id(Document), {"id": uuid.uuid4()}).scalar_one_or_none() is None
+        assert by_id(Document) is GET_DOCUMENT_BY_ID
+
+        db_session.expunge_all()
+        loaded = db_session.execute(GET_DOCUMENT_WITH_CONTENT_BY_ID, {"id": document.id}).scalar_one()
+        assert 'content' not in sa_inspect(loaded).unloaded
+        assert 'summary' in sa_inspect(loaded).unloaded
+
+    def test_full_text_search_vector(self, db_session):
+        """Test that the generated search_vector matches words from title and content."""
+        from sqlalchemy import func
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        for title, content in [("Graph Databases", "Storing knowledge graphs"),
+                               ("Cooking Notes", "Recipes for bread")]:
+            db_session.add(Document(
+                title=title,
+                content=content,
+                owner_id=user.id,
+                org_id=org.id,
+                document_type="text",
+                status="draft",
+                filename=f"{title}.txt",
+                file_path=f"/test/path/{title}.txt",
+                size=len(content),
+                content_type="text/plain"
+            ))
+        db_session.flush()
+
+        def search(terms):
+            matches = db_session.query(Document.title).filter(
+                Document.org_id == org.id,
+                Document.search_vector.op('@@')(func.plainto_tsquery('english', terms))
+            )
+            return {title for title, in matches}
+
+        # Stemming matches "graph" against "graphs"; content words are indexed too
+        assert search("graph") == {"Graph Databases"}
+        assert search("recipe bread") == {"Cooking Notes"}
+        assert search("spaceship") == set()
+
+    def test_content_hash_stores_raw_digest(self, db_session):
+        """Test that content hashes are stored as 32-byte digests and found by equality."""
+        import hashlib
+        from sqlalchemy.exc import IntegrityError
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        content = "Hashed content"
+        digest = hashlib.sha256(content.encode()).digest()
+        document = Document(
+            title="Hashed",
+            content=content,
+            owner_id=user.id,
+            org_id=org.id,
+            document_type="text",
+            status="draft",
+            filename="hashed.txt",
+            file_path="/test/path/hashed.txt",
+            size=len(content),
+            content_type="text/plain",
+            content_hash=digest
+        )
+        db_session.add(document)
+        db_session.flush()
+
+        found = db_session.query(Document).filter(Document.content_hash == digest).one()
+        assert found.id == document.id
+        assert len(found.content_hash) == 32
+
+        # Hex strings are rejected
+        with pytest.raises(IntegrityError):
+            with db_session.begin_nested():
+                document.content_hash = hashlib.sha256(content.encode()).hexdigest().encode()
+                db_session.flush()
+
+    def test_strict_loading_catches_lazy_loads(self, strict_db_session):
+        """Test that only explicitly loaded relationships are readable under strict loading."""
+        from sqlalchemy.exc import InvalidRequestError
+        from axai_pg.data.models.queries import DOCUMENTS_WITH_CHILDREN
+
+        db_session = strict_db_session
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        document = Document(
+            title="Document",
+            content="content",
+            owner_id=user.id,
+            org_id=org.id,
+            document_type="text",
+            status="draft",
+            filename="doc.txt",
+            file_path="/test/path/doc.txt",
+            size=7,
+            content_type="text/plain"
+        )
+        db_session.add(document)
+        db_session.flush()
+        db_session.expunge_all()
+
+        loaded = db_session.scalars(
+            DOCUMENTS_WITH_CHILDREN.where(Document.id == document.id)
+        ).one()
+        assert loaded.versions == []
+        assert loaded.topics_rel == []
+        with pytest.raises(InvalidRequestError):
+            loaded.summaries
+        with pytest.raises(InvalidRequestError):
+            loaded.owner
+
+    @pytest.mark.lazy_loads
+    def test_loader_options_follow_strict_flag(self, db_session, monkeypatch):
+        """Test that repository loaders add raiseload('*') only under AXAI_STRICT_LOADING."""
+        from sqlalchemy.exc import InvalidRequestError
+        from axai_pg.data.models.queries import loader_options
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+        db_session.expunge_all()
+
+        monkeypatch.setenv("AXAI_STRICT_LOADING", "true")
+        loaded = db_session.query(User).filter_by(id=user.id).options(*loader_options()).one()
+        with pytest.raises(InvalidRequestError):
+            loaded.organization
+
+        db_session.expunge_all()
+        monkeypatch.setenv("AXAI_STRICT_LOADING", "false")
+        loaded = db_session.query(User).filter_by(id=user.id).options(*loader_options()).one()
+        assert loaded.organization.name == "Test Org"
+
+    def test_organization_documents_stream_in_batches(self, db_session):
+        """Test that tenant-wide collections are queried explicitly and streamed."""
+        import psycopg
+        from sqlalchemy import event
+        from axai_pg.data.models.queries import stream
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        for i in range(5):
+            content = f"Document {i}"
+            org.documents.add(Document(
+                title=f"Document {i}",
+                content=content,
+                owner_id=user.id,
+                document_type="text",
+                status="draft",
+                filename=f"doc_{i}.txt",
+                file_path=f"/test/path/doc_{i}.txt",
+                size=len(content),
+                content_type="text/plain"
+            ))
+        db_session.flush()
+
+        cursors = []
+
+        def record_cursor(conn, cursor, statement, parameters, context, executemany):
+            if "FROM documents" in statement:
+                cursors.append(cursor)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record_cursor)
+        try:
+            titles = [d.title for d in stream(db_session, org.documents.select().order_by(Document.title), batch_size=2)]
+        finally:
+            event.remove(engine, "before_cursor_execute", record_cursor)
+
+        assert titles == [f"Document {i}" for i in range(5)]
+        assert len(cursors) == 1 and isinstance(cursors[0], psycopg.ServerCursor)
+
+    def test_large_document_columns_are_deferred(self, db_session):
+        """Test that content and legacy graph blobs are left out of default document loads."""
+        from sqlalchemy import inspect as sa_inspect
+        from sqlalchemy.orm import undefer_group
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        content = "x" * 10000
+        document = Document(
+            title="Large Document",
+            content=content,
+            owner_id=user.id,
+            org_id=org.id,
+            document_type="text",
+            status="draft",
+            filename="large.txt",
+            file_path="/test/path/large.txt",
+            size=len(content),
+            content_type="text/plain",
+            graph_nodes=[{"id": "n1"}]
+        )
+        db_session.add(document)
+        db_session.flush()
+        db_session.expunge_all()
+
+        loaded = db_session.query(Document).filter_by(id=document.id).one()
+        unloaded = sa_inspect(loaded).unloaded
+        assert {'content', 'summary', 'graph_nodes', 'graph_relationships'} <= unloaded
+        assert loaded.content == content
+
+        db_session.expunge_all()
+        loaded = db_session.query(Document).filter_by(id=document.id)\
+            .options(undefer_group('body')).one()
+        assert 'content' not in sa_inspect(loaded).unloaded
+        assert 'graph_nodes' in sa_inspect(loaded).unloaded
+
+    def test_document_tags_side_table(self, db_session):
+        """Test that tags are stored one row per tag and found by tag."""
+        from axai_pg.data.models import DocumentTag
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        documents = []
+        for i, tags in enumerate([["finance", "q3"], ["finance"], ["legal"]]):
+            content = f"Document {i}"
+            document = Document(
+                title=f"Document {i}",
+                content=content,
+                owner_id=user.id,
+                org_id=org.id,
+                document_type="text",
+                status="draft",
+                filename=f"doc_{i}.txt",
+                file_path=f"/test/path/doc_{i}.txt",
+                size=len(content),
+                content_type="text/plain",
+                tags_rel=[DocumentTag(tag=tag) for tag in tags]
+            )
+            db_session.add(document)
+            documents.append(document)
+        db_session.flush()
+
+        finance = db_session.execute(Document.tagged("finance")).scalars().all()
+        assert {d.id for d in finance} == {documents[0].id, documents[1].id}
+
+        # Removing a tag deletes just that row
+        documents[0].tags_rel = [t for t in documents[0].tags_rel if t.tag != "q3"]
+        db_session.flush()
+        assert db_session.query(DocumentTag).filter_by(document_id=documents[0].id).count() == 1
+
+        # Tags go with their document
+        db_session.delete(documents[2])
+        db_session.flush()
+        assert db_session.execute(Document.tagged("legal")).first() is None
+
+    @pytest.mark.lazy_loads
+    def test_document_children_load_in_one_batch(self, db_session, statement_counter):
+        """Test that summaries for many documents load with a single extra query."""
+        from sqlalchemy.orm import raiseload, selectinload
+        from sqlalchemy.exc import InvalidRequestError
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        for i in range(5):
+            content = f"Document {i}"
+            document = Document(
+                title=f"Document {i}",
+                content=content,
+                owner_id=user.id,
+                org_id=org.id,
+                document_type="text",
+                status="draft",
+                filename=f"doc_{i}.txt",
+                file_path=f"/test/path/doc_{i}.txt",
+                size=len(content),
+                content_type="text/plain"
+            )
+            document.summaries.append(Summary(
+                content=f"Summary {i}",
+                summary_type="abstract",
+                tool_agent="test-agent"
+            ))
+            db_session.add(document)
+        db_session.flush()
+        db_session.expunge_all()
+
+        with statement_counter(db_session.get_bind()) as statements:
+            documents = db_session.query(Document).filter_by(org_id=org.id).all()
+            assert [len(d.summaries) for d in documents] == [1] * 5
+            assert {d.owner.username for d in documents} == {"testuser"}
+            assert {d.organization.name for d in documents} == {"Test Org"}
+
+        # A single ``IN (...)`` query per relationship covers all five documents
+        for table in ("summaries", "users", "organizations"):
+            assert len([s for s in statements if f"FROM {table}" in s]) == 1, table
+
+        db_session.expunge_all()
+        strict = db_session.query(Document)\
+            .filter_by(org_id=org.id)\
+            .options(selectinload(Document.summaries), raiseload('*'))\
+            .first()
+        assert len(strict.summaries) == 1
+        with pytest.raises(InvalidRequestError):
+            strict.owner
+
+    def test_repr_never_loads(self, db_session, statement_counter):
+        """Test that repr() of an expired or detached object emits no SQL and does not raise."""
+        org = Organization(name="Repr Org")
+        assert repr(org) == "<Organization(id=None, name='Repr Org')>"
+        db_session.add(org)
+        db_session.flush()
+        assert repr(org) == f"<Organization(id={org.id}, name='Repr Org')>"
+
+        db_session.expire(org)
+        with statement_counter(db_session.get_bind()) as statements:
+            assert repr(org) == "<Organization(id=<not loaded>, name=<not loaded>)>"
+            db_session.expunge(org)
+            assert repr(org) == "<Organization(id=<not loaded>, name=<not loaded>)>"
+        assert statements == []
+
+    def test_document_topics_bulk_insert(self, db_session, monkeypatch, statement_counter):
+        """Test batched DocumentTopic inserts through executemany and through COPY."""
+        user = User(username="tagger", email="tagger@example.com")
+        db_session.add(user)
+        db_session.flush()
+        document = Document(
+            title="Topics", content="Topics", owner_id=user.id, document_type="text",
+            filename="topics.txt", file_path="/test/topics.txt", size=6, content_type="text/plain"
+        )
+        topics = [Topic(name=f"Bulk Topic {i}") for i in range(5)]
+        db_session.add_all([document] + topics)
+        db_session.flush()
+
+        def rows(selected):
+            return [
+                {"document_id": document.id, "topic_id": topic.id, "relevance_score": 0.5,
+                 "context": {"rank": i}, "extracted_by_tool": "test-tool"}
+                for i, topic in enumerate(selected)
+            ]
+
+        with statement_counter(db_session.get_bind()) as statements:
+            assert DocumentTopic.bulk_insert(db_session, rows(topics[:2])) == 2
+        assert len(statements) == 1
+
+        monkeypatch.setattr(DocumentTopic, "COPY_THRESHOLD", 3)
+        assert DocumentTopic.bulk_insert(db_session, rows(topics[2:])) == 3
+        assert DocumentTopic.bulk_insert(db_session, []) == 0
+
+        linked = db_session.query(DocumentTopic).filter_by(document_id=document.id).all()
+        assert len(linked) == 5
+        assert sorted(link.context["rank"] for link in linked) == [0, 0, 1, 1, 2]
+        assert all(link.id.version == 7 for link in linked)
@@ -7,12 +7,16 @@ DatabaseManager.
 """
 
 import pytest
+import dataclasses
 import os
+import asyncio
+import threading
 from pathlib import Path
 from sqlalchemy import create_engine, text, inspect
+from sqlalchemy.pool import NullPool
 
 from src.axai_pg.utils.db_initializer import DatabaseInitializer, DatabaseInitializerConfig
-from src.axai_pg.data.config.database import PostgresConnectionConfig
+from src.axai_pg.data.config.database import PostgresConnectionConfig, PostgresPoolConfig, DatabaseManager
 
 
 @pytest.mark.integration
@@ -62,7 +66,7 @@ class TestDatabaseInitializer:
         # After context exit, database should be cleaned up
         # Verify database was dropped
         admin_url = (
-            f"postgresql://{test_db_config.username}:{test_db_config.password}@"
+            f"postgresql+psycopg://{test_db_config.username}:{test_db_config.password}@"
             f"{test_db_config.host}:{test_db_config.port}/postgres"
         )
         admin_engine = create_engine(admin_url, isolation_level="AUTOCOMMIT")
@@ -79,6 +83,36 @@ class TestDatabaseInitializer:
         # Skip this test since SQL files are deprecated and have syntax issues
         pytest.skip("SQL file approach is deprecated - SQLAlchemy is the recommended approach")
 
+    def test_apply_schema_from_sql_file_runs_whole_script(self, test_db_config, tmp_path):
+        """Test that a SQL file is applied as one script, including ';' inside function bodies."""
+        schema_file = tmp_path / "schema.sql"
+        schema_file.write_text(
+            "CREATE TABLE script_items (id integer PRIMARY KEY);\n"
+            "CREATE FUNCTION script_answer() RETURNS integer AS $$\n"
+            "BEGIN\n"
+            "    RETURN 42;\n"
+            "END;\n"
+            "$$ LANGUAGE plpgsql;\n"
+        )
+
+        config = DatabaseInitializerConfig(
+            connection_config=test_db_config,
+            auto_create_db=True,
+            auto_drop_on_exit=True
+        )
+
+        with DatabaseInitializer(config) as db_init:
+            assert db_init.create_database() is True
+            assert db_init.apply_schema(str(schema_file), use_sqlalchemy=False) is True
+            assert db_init.setup_database(apply_schema=False) is True
+
+            with db_init.session_scope() as session:
+                assert session.execute(text("SELECT script_answer()")).scalar() == 42
+                assert session.execute(text("SELECT COUNT(*) FROM script_items")).scalar() == 0
+
+            # A failing script is rolled back as a whole
+            assert db_init.apply_schema(str(schema_file), use_sqlalchemy=False) is False
+
     def test_context_manager_auto_cleanup(self, test_db_config):
         """Test that context manager with auto_drop_on_exit=True cleans up."""
         config = DatabaseInitializerConfig(
@@ -95,7 +129,7 @@ class TestDatabaseInitializer:
 
         # After exit, verify database was dropped
         admin_url = (
-            f"postgresql://{test_db_config.username}:{test_db_config.password}@"
+            f"postgresql+psycopg://{test_db_config.username}:{test_db_config.password}@"
             f"{test_db_config.host}:{test_db_config.port}/postgres"
         )
         admin_engine = create_engine(admin_url, isolation_level="AUTOCOMMIT")
@@ -122,7 +156,7 @@ class TestDatabaseInitializer:
 
             # After exit, verify database still exists
             admin_url = (
-                f"postgresql://{test_db_config.username}:{test_db_config.password}@"
+                f"postgresql+psycopg://{test_db_config.username}:{test_db_config.password}@"
                 f"{test_db_config.host}:{test_db_config.port}/postgres"
             )
             admin_engine = create_engine(admin_url, isolation_level="AUTOCOMMIT")
@@ -188,6 +222,21 @@ class TestDatabaseInitializer:
                 result = session.execute(text("SELECT 1"))
                 assert result.scalar() == 1, "Database should be healthy and responsive"
 
+    def test_database_manager_check_health(self, test_db_config):
+        """Test that DatabaseManager.check_health() reports a healthy database."""
+        config = DatabaseInitializerConfig(
+            connection_config=test_db_config,
+            auto_create_db=True,
+            auto_drop_on_exit=True
+        )
+
+        with DatabaseInitializer(config) as db_init:
+            db_init.setup_database()
+
+            health = asyncio.run(db_init.get_database_manager().check_health())
+            assert health["status"] == "healthy", health
+            assert "checkedout" in health["pool"]
+
     def test_database_manager_integration(self, test_db_config):
         """Test that get_database_manager() returns working DatabaseManager."""
         config = DatabaseInitializerConfig(
@@ -209,6 +258,193 @@ class TestDatabaseInitializer:
                 result = session.execute(text("SELECT 1"))
                 assert result.scalar() == 1
 
+                # Connections are tagged for pg_stat_activity
+                app_name = session.execute(text(
+                    "SELECT application_name FROM pg_stat_activity WHERE pid = pg_backend_pid()"
+                )).scalar()
+                assert app_name == "axai-pg"
+
+            # Room for every distinct statement in the hot paths
+            assert db_manager.engine._compiled_cache.capacity == 1200
+
+    def test_session_scope_keeps_objects_loaded_after_commit(self, test_db_config):
+        """Test that objects stay readable after session_scope commits and closes."""
+        from src.axai_pg.data.models import Organization
+
+        config = DatabaseInitializerConfig(
+            connection_config=test_db_config,
+            auto_create_db=True,
+            auto_drop_on_exit=True
+        )
+
+        with DatabaseInitializer(config) as db_init:
+            db_init.setup_database()
+
+            with db_init.session_scope() as session:
+                org = Organization(name="Kept Loaded Org")
+                session.add(org)
+
+            # Detached, but not expired: no reload needed
+            assert org.name == "Kept Loaded Org"
+            assert org.id is not None
+
+    def test_database_manager_bulk_insert(self, test_db_config):
+        """Test that bulk_insert() loads all records with a single COPY."""
+        import uuid
+
+        config = DatabaseInitializerConfig(
+            connection_config=test_db_config,
+            auto_create_db=True,
+            auto_drop_on_exit=True
+        )
+
+        with DatabaseInitializer(config) as db_init:
+            db_init.setup_database()
+            db_manager = db_init.get_database_manager()
+
+            records = ((uuid.uuid4(), f"Bulk Org {i}") for i in range(250))
+            assert db_manager.bulk_insert("organizations", ("id", "name"), records) == 250
+
+            with db_init.session_scope() as session:
+                count = session.execute(text(
+                    "SELECT count(*) FROM organizations WHERE name LIKE 'Bulk Org %'"
+                )).scalar()
+                assert count == 250
+
+    def test_slow_transaction_metrics_are_buffered(self, test_db_config):
+        """Test that slow-transaction metrics are queued while the flusher runs."""
+        from src.axai_pg.data.config import database
+
+        config = DatabaseInitializerConfig(
+            connection_config=test_db_config,
+            auto_create_db=True,
+            auto_drop_on_exit=True
+        )
+        recorded = []
+
+        async def run():
+            flusher = asyncio.create_task(database.run_metrics_flusher(interval=60))
+            await asyncio.sleep(0)
+            try:
+                with db_init.session_scope() as session:
+                    session.execute(text("SELECT pg_sleep(1.1)"))
+                # Buffered, not yet delivered
+                assert recorded == []
+                assert len(database._metric_queue) == 1
+            finally:
+                flusher.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await flusher
+
+        with DatabaseInitializer(config) as db_init:
+            db_init.setup_database()
+            database.set_monitoring_handlers(lambda *args: recorded.append(args), None)
+            try:
+                asyncio.run(run())
+            finally:
+                database.set_monitoring_handlers(None, None)
+
+        # Flushed when the flusher stops
+        assert len(recorded) == 1
+        name, duration, labels = recorded[0]
+        assert name == "Transaction" and duration > 1.0
+        assert labels["status"] == "commit"
+
+    def test_database_manager_reuses_engine(self, test_db_config):
+        """Test that re-initializing DatabaseManager for the same target reuses its engine."""
+        config = DatabaseInitializerConfig(
+            connection_config=test_db_config,
+            auto_create_db=True,
+            auto_drop_on_exit=True
+        )
+
+        with DatabaseInitializer(config) as db_init:
+            db_init.setup_database()
+            engine = db_init.get_database_manager().engine
+
+            DatabaseManager.initialize(test_db_config)
+            assert DatabaseManager.get_instance().engine is engine
+
+    def test_database_manager_rebuilds_engine_for_new_pool(self, test_db_config):
+        """Test that a new pool config or a dispose() gets a fresh engine."""
+        DatabaseManager.initialize(test_db_config, PostgresPoolConfig(use_null_pool=True))
+        manager = DatabaseManager.get_instance()
+        assert isinstance(manager.engine.pool, NullPool)
+
+        DatabaseManager.initialize(test_db_config, PostgresPoolConfig(pool_size=3))
+        engine = manager.engine
+        assert engine.pool.size() == 3
+
+        manager.dispose()
+        with pytest.raises(RuntimeError):
+            manager.engine
+        DatabaseManager.initialize(test_db_config, PostgresPoolConfig(pool_size=3))
+        assert manager.engine is not engine
+
+        # Any connection setting, not just the target, needs a new engine
+        engine = manager.engine
+        DatabaseManager.initialize(test_db_config, PostgresPoolConfig(pool_size=3))
+        assert manager.engine is engine
+        rotated = dataclasses.replace(test_db_config, password="rotated", statement_timeout_ms=5)
+        DatabaseManager.initialize(rotated, PostgresPoolConfig(pool_size=3))
+        assert manager.engine is not engine
+        assert manager.engine.url.password == "rotated"
+        manager.dispose()
+
+    def test_database_manager_check_health_without_pool(self, test_db_config):
+        """Test that check_health() works on a NullPool engine, which has no pool counters."""
+        conn_config = dataclasses.replace(test_db_config, database="postgres")
+        DatabaseManager.initialize(conn_config, PostgresPoolConfig(use_null_pool=True))
+        manager = DatabaseManager.get_instance()
+
+        health = asyncio.run(manager.check_health())
+        assert health["status"] == "healthy", health
+        assert health["pool"] == {}
+        manager.dispose()
+
+    def test_database_manager_applies_server_timeouts(self, test_db_config):
+        """Test that connection config timeouts reach DatabaseManager connections."""
+        conn_config = dataclasses.replace(
+            test_db_config, database="postgres",
+            statement_timeout_ms=1234, idle_in_transaction_timeout_ms=5678
+        )
+        DatabaseManager.initialize(conn_config)
+        manager = DatabaseManager.get_instance()
+        with manager.session_scope() as session:
+            assert session.execute(text("SHOW statement_timeout")).scalar() == "1234ms"
+            assert session.execute(text("SHOW idle_in_transaction_session_timeout")).scalar() == "5678ms"
+        manager.dispose()
+
+    def test_initializer_admin_connections_skip_server_timeouts(self, test_db_config):
+        """Test that schema and admin work is not bound by the application statement timeout."""
+        conn_config = dataclasses.replace(test_db_config, statement_timeout_ms=1234)
+        db_init = DatabaseInitializer(DatabaseInitializerConfig(connection_config=conn_config))
+
+        engine = db_init._get_admin_engine()
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("SHOW statement_timeout")).scalar() == "0"
+                assert conn.execute(text("SHOW application_name")).scalar() == "axai-pg"
+        finally:
+            engine.dispose()
+
+    def test_database_manager_concurrent_initialize(self, test_db_config):
+        """Test that concurrent initialize() calls for one target share a single engine."""
+        engines = []
+
+        def init():
+            DatabaseManager.initialize(test_db_config)
+            engines.append(DatabaseManager.get_instance().engine)
+
+        threads = [threading.Thread(target=init) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(engines) == 10
+        assert len(set(map(id, engines))) == 1
+
     def test_create_database_idempotent(self, test_db_config):
         """Test that create_database can be called multiple times safely."""
         config = DatabaseInitializerConfig(
@@ -225,3 +461,47 @@ class TestDatabaseInitializer:
 
             # Verify database exists
             assert db_init._database_exists() is True
+
+    def test_setup_database_loads_sample_data(self, test_db_config):
+        """Test that setup_database(load_sample_data=True) seeds every sample table."""
+        config = DatabaseInitializerConfig(
+            connection_config=test_db_config,
+            auto_create_db=True,
+            auto_drop_on_exit=True
+        )
+
+        with DatabaseInitializer(config) as db_init:
+            success = db_init.setup_database(load_sample_data=True)
+            assert success is True, "Setup with sample data should succeed"
+
+            expected_counts = {
+                'organizations': 2,
+                'users': 3,
+                'documents': 3,
+                'summaries': 3,
+                'topics': 3,
+                'document_topics': 4,
+                'graph_entities': 3,
+                'graph_relationships': 2,
+            }
+
+            with db_init.session_scope() as session:
+                for table, expected in expected_counts.items():
+                    count = session.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+                    assert count == expected, f"{table} should have {expected} rows, got {count}"
+
+                # Server-side defaults are still applied to COPY-loaded rows
+                missing_timestamps = session.execute(text(
+                    "SELECT COUNT(*) FROM documents WHERE created_at IS NULL"
+                )).scalar()
+                assert missing_timestamps == 0
+
+                keywords = session.execute(text(
+                    "SELECT keywords FROM topics WHERE name = 'Machine Learning'"
+                )).scalar()
+                assert keywords == ["AI", "machine learning", "neural networks"]
+
+                properties = session.execute(text(
+                    "SELECT properties FROM graph_entities WHERE entity_id = 'doc-paper'"
+                )).scalar()
+                assert properties == {"keywords": ["graphs", "document analysis"]}
@@ -0,0 +1,76 @@
+"""
+Integration tests for the rate limit upsert.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sqlalchemy import delete, select, update
+
+from axai_pg import User
+from axai_pg.data.models import RateLimit
+from axai_pg.data.security.rate_limit import bump_rate_limit
+
+
+@pytest.fixture
+def limited_user(test_engine):
+    """A committed user, removed with its rate limit rows afterwards."""
+    with test_engine.begin() as conn:
+        user_id = conn.execute(
+            User.__table__.insert().values(username="limited", email="limited@example.com")
+            .returning(User.id)
+        ).scalar_one()
+    yield user_id
+    with test_engine.begin() as conn:
+        conn.execute(delete(RateLimit).where(RateLimit.user_id == user_id))
+        conn.execute(delete(User).where(User.id == user_id))
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestBumpRateLimit:
+    """Test counting actions with a single upsert."""
+
+    def test_counts_accumulate_in_one_row(self, test_engine, limited_user, statement_counter):
+        """Each bump is one statement and returns the running count for the window."""
+        with statement_counter(test_engine) as statements:
+            with test_engine.begin() as conn:
+                counts = [bump_rate_limit(conn, limited_user, "export", bucket_seconds=3600) for _ in range(3)]
+
+        assert counts == [1, 2, 3]
+        assert len(statements) == 3
+
+        with test_engine.connect() as conn:
+            rows = conn.execute(
+                select(RateLimit.window_start, RateLimit.count).where(RateLimit.user_id == limited_user)
+            ).all()
+        assert len(rows) == 1
+        window_start, count = rows[0]
+        assert count == 3
+        assert window_start.timestamp() % 3600 == 0
+
+    def test_actions_are_counted_separately(self, test_engine, limited_user):
+        """Different actions get their own counters."""
+        with test_engine.begin() as conn:
+            bump_rate_limit(conn, limited_user, "export", bucket_seconds=3600)
+            assert bump_rate_limit(conn, limited_user, "delete", bucket_seconds=3600) == 1
+
+    def test_concurrent_bumps_are_not_lost(self, test_engine, limited_user):
+        """Bumps from parallel transactions all land on the same counter."""
+        def bump(_):
+            with test_engine.begin() as conn:
+                return bump_rate_limit(conn, limited_user, "export", bucket_seconds=3600)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            counts = list(pool.map(bump, range(20)))
+
+        assert sorted(counts) == list(range(1, 21))
+
+    def test_count_saturates_at_smallint_limit(self, test_engine, limited_user):
+        """A runaway window stops counting at the column's limit instead of overflowing."""
+        with test_engine.begin() as conn:
+            bump_rate_limit(conn, limited_user, "export", bucket_seconds=3600)
+            conn.execute(
+                update(RateLimit).where(RateLimit.user_id == limited_user).values(count=32766)
+            )
+            assert bump_rate_limit(conn, limited_user, "export", bucket_seconds=3600) == 32767
+            assert bump_rate_limit(conn, limited_user, "export", bucket_seconds=3600) == 32767
@@ -88,6 +88,9 @@ class TestPostgreSQLSchemaBuilder:
 
     def test_create_extensions(self, test_engine):
         """Test that create_extensions installs uuid-ossp extension."""
+        # Key defaults depend on the extension, so drop the schema first
+        PostgreSQLSchemaBuilder.drop_complete_schema(test_engine)
+
         # Drop extension if exists
         with test_engine.connect() as conn:
             conn.execute(text('DROP EXTENSION IF EXISTS "uuid-ossp"'))
@@ -104,6 +107,9 @@ class TestPostgreSQLSchemaBuilder:
             assert result.scalar() is True, "uuid-ossp extension should be created"
             conn.commit()
 
+        # Rebuild for other tests
+        PostgreSQLSchemaBuilder.build_complete_schema(test_engine)
+
     def test_create_update_timestamp_trigger(self, test_engine):
         """Test that create_update_timestamp_trigger creates the function."""
         # Drop function if exists
@@ -193,8 +199,8 @@ class TestPostgreSQLSchemaBuilder:
 
         # Drop some performance indexes
         with test_engine.connect() as conn:
-            conn.execute(text("DROP INDEX IF EXISTS idx_documents_org_status"))
-            conn.execute(text("DROP INDEX IF EXISTS idx_users_org"))
+            conn.execute(text("DROP INDEX IF EXISTS idx_documents_processing"))
+            conn.execute(text("DROP INDEX IF EXISTS idx_summaries_type"))
             conn.commit()
 
         # Create indexes
@@ -203,10 +209,10 @@ class TestPostgreSQLSchemaBuilder:
         # Verify indexes exist
         inspector = inspect(test_engine)
         doc_indexes = {idx['name'] for idx in inspector.get_indexes('documents')}
-        assert 'idx_documents_org_status' in doc_indexes, "documents org_status index should exist"
+        assert 'idx_documents_processing' in doc_indexes, "documents processing index should exist"
 
-        user_indexes = {idx['name'] for idx in inspector.get_indexes('users')}
-        assert 'idx_users_org' in user_indexes, "users org index should exist"
+        summary_indexes = {idx['name'] for idx in inspector.get_indexes('summaries')}
+        assert 'idx_summaries_type' in summary_indexes, "summaries type index should exist"
 
     def test_schema_builder_with_empty_database(self, test_engine):
         """Test that schema builder works starting from completely empty database."""
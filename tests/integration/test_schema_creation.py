@@ -27,12 +27,14 @@ class TestSchemaCreation:
             'users',
             'documents',
             'document_versions',
+            'document_tags',
             'summaries',
             'topics',
             'document_topics',
             'graph_entities',
             'graph_relationships',
             'collections',
+            'collection_closure',
             'collection_entities',
             'collection_relationships',
             'visibility_profiles',
@@ -44,6 +46,17 @@ class TestSchemaCreation:
         for table in expected_tables:
             assert table in tables, f"Table {table} should exist"
 
+    def test_each_table_is_mapped_once(self):
+        """Test that no model class is defined twice for the same table."""
+        from collections import Counter
+        from src.axai_pg.data.config.database import Base
+        from src.axai_pg.data.models import collection, graph
+
+        mapped = Counter(mapper.local_table.name for mapper in Base.registry.mappers)
+        duplicates = [name for name, count in mapped.items() if count > 1]
+        assert duplicates == []
+        assert collection.SourceType is graph.SourceType
+
     def test_uuid_extension_exists(self, db_session):
         """Test that the uuid-ossp extension is installed."""
         result = db_session.execute(text(
@@ -147,6 +160,58 @@ class TestSchemaCreation:
         assert "organizations_name_not_empty" in str(exc_info.value) or "check constraint" in str(exc_info.value).lower()
         db_session.rollback()
 
+    def test_names_are_unique_ignoring_case(self, db_session):
+        """Test that organization and role names are looked up and deduplicated case-insensitively."""
+        from sqlalchemy.exc import IntegrityError
+        from src.axai_pg.data.models.security import Role
+
+        for model, index_name in ((Organization, 'idx_organizations_name_ci'), (Role, 'idx_roles_name_ci')):
+            row = model(name="Acme Research")
+            db_session.add(row)
+            db_session.flush()
+            assert db_session.scalars(model.named("  acme RESEARCH ")).one() is row
+
+            db_session.execute(text("SET LOCAL enable_seqscan = off"))
+            compiled = model.named("acme").compile(db_session.bind, compile_kwargs={"literal_binds": True})
+            plan = db_session.execute(text(f"EXPLAIN {compiled}")).scalars().all()
+            assert index_name in '\n'.join(plan)
+
+            savepoint = db_session.begin_nested()
+            db_session.add(model(name="ACME research "))
+            with pytest.raises(IntegrityError) as exc_info:
+                db_session.flush()
+            assert index_name in str(exc_info.value)
+            savepoint.rollback()
+
+    def test_user_role_name_reads_through_role(self, db_session):
+        """Test that role assignments store only role_id and expose the name from roles."""
+        from sqlalchemy import select
+        from src.axai_pg.data.models.security import Role, UserRole
+
+        columns = {col['name'] for col in inspect(db_session.bind).get_columns('user_roles')}
+        assert 'role_id' in columns and 'role_name' not in columns
+
+        user = User(username="roleholder", email="roleholder@example.com")
+        role = Role(name="reviewer")
+        db_session.add_all([user, role])
+        db_session.flush()
+        assignment = UserRole(user_id=user.id, role=role)
+        db_session.add(assignment)
+        db_session.flush()
+
+        assert assignment.role_name == "reviewer"
+        assert db_session.scalars(select(UserRole).where(UserRole.role_name == "reviewer")).one() is assignment
+        assert db_session.execute(text(
+            "SELECT role_name FROM user_roles_v WHERE user_id = :user_id"
+        ), {"user_id": user.id}).scalar_one() == "reviewer"
+
+        # A rename shows up in the view without touching the assignments
+        role.name = "editor"
+        db_session.flush()
+        assert db_session.execute(text(
+            "SELECT role_name FROM user_roles_v WHERE user_id = :user_id"
+        ), {"user_id": user.id}).scalar_one() == "editor"
+
     def test_check_constraint_users_email(self, db_session):
         """Test that users email validation check constraint works."""
         # Create org first
@@ -230,6 +295,90 @@ class TestSchemaCreation:
         assert "documents_valid_version" in str(exc_info.value) or "check constraint" in str(exc_info.value).lower()
         db_session.rollback()
 
+    def test_document_versions_unique_per_document(self, db_session):
+        """Test that a version number is used once per document and the latest is found by index."""
+        from sqlalchemy.exc import IntegrityError
+
+        user = User(username="versioner", email="versioner@example.com")
+        db_session.add(user)
+        db_session.flush()
+        doc = Document(
+            title="Versioned", content="v1", owner_id=user.id, document_type="text",
+            filename="versioned.txt", file_path="/test/versioned.txt", size=2, content_type="text/plain"
+        )
+        db_session.add(doc)
+        db_session.flush()
+
+        def version(number):
+            return DocumentVersion(
+                document_id=doc.id, version=number, content=f"v{number}", title="Versioned",
+                status="draft", created_by_id=user.id, file_path="/test/versioned.txt",
+                content_type="text/plain"
+            )
+
+        db_session.add_all([version(1), version(2)])
+        db_session.flush()
+
+        savepoint = db_session.begin_nested()
+        db_session.add(version(2))
+        with pytest.raises(IntegrityError) as exc_info:
+            db_session.flush()
+        assert "uq_document_versions_doc_ver" in str(exc_info.value)
+        savepoint.rollback()
+
+        db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+        plan = '\n'.join(db_session.execute(text(
+            "EXPLAIN SELECT version FROM document_versions "
+            "WHERE document_id = :document_id ORDER BY version DESC LIMIT 1"
+        ), {"document_id": doc.id}).scalars())
+        assert "Index Only Scan Backward using uq_document_versions_doc_ver" in plan
+        assert "Sort" not in plan
+
+    def test_small_counters_use_smallint(self, db_session):
+        """Test that version numbers and rate limit counts are stored in two bytes."""
+        types = dict(db_session.execute(text(
+            "SELECT table_name || '.' || column_name, data_type FROM information_schema.columns "
+            "WHERE (table_name, column_name) IN "
+            "(('documents', 'version'), ('document_versions', 'version'), ('rate_limits', 'count'))"
+        )).all())
+        assert types == {
+            'documents.version': 'smallint',
+            'document_versions.version': 'smallint',
+            'rate_limits.count': 'smallint',
+        }
+
+    def test_graph_scores_use_real(self, db_session):
+        """Test that relationship weights and confidences are float4 and keep their range checks."""
+        types = dict(db_session.execute(text(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_name = 'graph_relationships' AND column_name IN ('weight', 'confidence_score')"
+        )).all())
+        assert types == {'weight': 'real', 'confidence_score': 'real'}
+
+        checks = db_session.execute(text(
+            "SELECT conname FROM pg_constraint WHERE conrelid = 'graph_relationships'::regclass AND contype = 'c'"
+        )).scalars().all()
+        assert {'graph_relationships_valid_confidence', 'graph_relationships_valid_weight'} <= set(checks)
+
+    def test_text_column_storage(self, db_session):
+        """Test that short descriptions stay in the row and document bodies keep compressed TOAST storage."""
+        storage = dict(db_session.execute(text(
+            "SELECT attrelid::regclass::text || '.' || attname, attstorage FROM pg_attribute "
+            "WHERE (attrelid, attname) IN (('feedback'::regclass, 'description'), "
+            "('graph_entities'::regclass, 'description'), ('documents'::regclass, 'content'), "
+            "('document_versions'::regclass, 'content'))"
+        )).all())
+        assert storage == {
+            'feedback.description': 'm',
+            'graph_entities.description': 'm',
+            'documents.content': 'x',
+            'document_versions.content': 'x',
+        }
+
+        # Version bodies are only read when asked for
+        assert inspect(DocumentVersion).column_attrs['content'].deferred
+
     def test_indexes_exist(self, db_session):
         """Test that performance indexes are created."""
         inspector = inspect(db_session.bind)
@@ -238,15 +387,50 @@ class TestSchemaCreation:
         doc_indexes = {idx['name']: idx for idx in inspector.get_indexes('documents')}
 
         expected_indexes = [
-            'idx_documents_org_id',
+            'idx_documents_org_status',
             'idx_documents_owner_id',
-            'idx_documents_type',
-            'idx_documents_status',
+            'idx_documents_org_type_status',
         ]
 
         for idx_name in expected_indexes:
             assert idx_name in doc_indexes, f"Index {idx_name} should exist"
 
+    def test_no_duplicate_indexes(self, db_session):
+        """Test that no two indexes on a table cover the same columns the same way."""
+        duplicates = db_session.execute(text("""
+            SELECT t.relname, string_agg(i.relname, ', ' ORDER BY i.relname)
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            JOIN pg_class t ON t.oid = x.indrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname = current_schema()
+            GROUP BY t.relname, i.relam, x.indkey::text, x.indclass::text,
+                     coalesce(pg_get_expr(x.indexprs, x.indrelid), ''),
+                     coalesce(pg_get_expr(x.indpred, x.indrelid), '')
+            HAVING count(*) > 1
+        """)).all()
+        assert duplicates == []
+
+    def test_no_indexes_covered_by_a_longer_index(self, db_session):
+        """Test that no plain index is a leading prefix of another index on the same table."""
+        covered = db_session.execute(text("""
+            SELECT a.relname, b.relname
+            FROM pg_index x
+            JOIN pg_index y ON y.indrelid = x.indrelid AND y.indexrelid <> x.indexrelid
+            JOIN pg_class a ON a.oid = x.indexrelid
+            JOIN pg_class b ON b.oid = y.indexrelid
+            JOIN pg_class t ON t.oid = x.indrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname = current_schema()
+              AND NOT t.relispartition
+              AND NOT x.indisunique
+              AND a.relam = b.relam
+              AND x.indpred IS NULL AND y.indpred IS NULL
+              AND x.indexprs IS NULL AND y.indexprs IS NULL
+              AND (y.indkey::text || ' ') LIKE (x.indkey::text || ' %')
+        """)).all()
+        assert covered == []
+
     def test_foreign_key_constraints_exist(self, db_session):
         """Test that foreign key relationships are properly created."""
         inspector = inspect(db_session.bind)
@@ -351,6 +535,292 @@ class TestSchemaCreation:
         retrieved_doc = db_session.query(Document).filter_by(id=doc.id).first()
         assert retrieved_doc.document_metadata == {"key": "value", "nested": {"data": 123}}
 
+    def test_collection_ids_are_time_ordered(self, db_session):
+        """Test that new primary keys are UUIDv7 and sort in insertion order."""
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        collections = [Collection(name=f"Collection {i}", owner_id=user.id) for i in range(5)]
+        for collection in collections:
+            db_session.add(collection)
+            db_session.flush()
+
+        ids = [collection.id for collection in collections]
+        assert all(collection_id.version == 7 for collection_id in ids)
+        assert ids == sorted(ids)
+
+    def test_time_ordered_keys_default_server_side(self, db_session):
+        """Test that UUIDv7 keys are generated by the database when a bulk insert omits them."""
+        from sqlalchemy import insert
+
+        inspector = inspect(db_session.bind)
+        for table in ('documents', 'topics', 'document_topics', 'users'):
+            columns = {col['name']: col for col in inspector.get_columns(table)}
+            assert columns['id']['default'] == 'uuid_generate_v7()', table
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        ids = db_session.scalars(
+            insert(Collection).returning(Collection.id),
+            [{"name": f"Bulk Collection {i}", "owner_id": user.id} for i in range(3)],
+        ).all()
+        assert len(set(ids)) == 3
+        assert all(collection_id.version == 7 for collection_id in ids)
+
+    def test_uuid_primary_keys_default_server_side(self, db_session):
+        """Test that random UUID keys are filled in by the database on bulk insert."""
+        from sqlalchemy import insert
+
+        inspector = inspect(db_session.bind)
+        org_columns = {col['name']: col for col in inspector.get_columns('organizations')}
+        assert 'uuid_generate_v4()' in org_columns['id']['default']
+
+        ids = db_session.scalars(
+            insert(Organization).returning(Organization.id),
+            [{"name": f"Bulk Org {i}"} for i in range(3)],
+        ).all()
+        assert len(set(ids)) == 3
+        assert all(org_id.version == 4 for org_id in ids)
+
+    def test_audit_tables_use_bigint_identity_keys(self, db_session):
+        """Test that append-only audit tables get sequential BIGINT keys from the database."""
+        from sqlalchemy import insert
+        from src.axai_pg.data.models.security import AuditLog
+
+        identity = dict(db_session.execute(text(
+            "SELECT table_name, data_type FROM information_schema.columns "
+            "WHERE column_name = 'id' AND is_identity = 'YES' "
+            "AND table_name IN ('audit_logs', 'rate_limits')"
+        )).all())
+        assert identity == {'audit_logs': 'bigint', 'rate_limits': 'bigint'}
+
+        ids = db_session.scalars(
+            insert(AuditLog).returning(AuditLog.id),
+            [{"username": "auditor", "action": "read", "resource_type": "documents"} for _ in range(3)],
+        ).all()
+        assert ids == sorted(ids) and len(set(ids)) == 3
+
+    def test_security_types_use_native_enums(self, db_session):
+        """Test that permission and policy types are PostgreSQL enums that still accept plain strings."""
+        from src.axai_pg.data.models.security import RolePermission, PermissionType
+
+        udt_names = dict(db_session.execute(text(
+            "SELECT column_name, udt_name FROM information_schema.columns "
+            "WHERE (table_name, column_name) IN "
+            "(('role_permissions', 'permission_type'), ('security_policies', 'policy_type'))"
+        )).all())
+        assert udt_names == {'permission_type': 'permission_type', 'policy_type': 'policy_type'}
+
+        permission = RolePermission(role_name="editor", resource_name="documents", permission_type="UPDATE")
+        db_session.add(permission)
+        db_session.flush()
+        db_session.expire(permission)
+        assert permission.permission_type is PermissionType.UPDATE
+        assert permission.permission_type == "UPDATE"
+
+        with pytest.raises(Exception) as exc_info:
+            db_session.execute(text(
+                "INSERT INTO role_permissions (role_name, resource_name, permission_type) "
+                "VALUES ('editor', 'documents', 'ALL')"
+            ))
+        assert "invalid input value for enum permission_type" in str(exc_info.value)
+
+    def test_audit_logs_partitioned_by_month(self, db_session):
+        """Test that audit rows route to monthly partitions that can be added and dropped."""
+        from sqlalchemy import insert
+        from src.axai_pg.data.models.security import AuditLog
+
+        def partition_of(action_time):
+            return db_session.execute(
+                insert(AuditLog).values(
+                    username="auditor", action="read", resource_type="documents",
+                    action_time=action_time,
+                ).returning(text("tableoid::regclass::text"))
+            ).scalar_one()
+
+        assert db_session.execute(text(
+            "SELECT relkind FROM pg_class WHERE relname = 'audit_logs'"
+        )).scalar_one() == 'p'
+        pk_columns = inspect(db_session.bind).get_pk_constraint('audit_logs')['constrained_columns']
+        assert sorted(pk_columns) == ['action_time', 'id']
+
+        current = db_session.execute(text(
+            "SELECT 'audit_logs_' || to_char(now() AT TIME ZONE 'UTC', 'YYYY_MM')"
+        )).scalar_one()
+        assert partition_of(text("now()")) == current
+
+        # Rows outside the prepared months fall back to the default partition
+        # and move when their month is created
+        assert partition_of(text("now() + interval '6 months'")) == 'audit_logs_default'
+        assert db_session.execute(text("SELECT ensure_audit_log_partitions(6)")).scalar_one() == 5
+        assert db_session.execute(text(
+            "SELECT count(*) FROM audit_logs_default"
+        )).scalar_one() == 0
+        assert db_session.execute(text("SELECT ensure_audit_log_partitions(6)")).scalar_one() == 0
+
+        # Retention drops whole months, leaving newer ones in place
+        assert db_session.execute(text(
+            "SELECT drop_audit_log_partitions(date_trunc('month', now() AT TIME ZONE 'UTC') "
+            "AT TIME ZONE 'UTC' + interval '1 month')"
+        )).scalar_one() == 1
+        assert db_session.execute(text("SELECT to_regclass(:name)"), {"name": current}).scalar() is None
+        assert db_session.execute(text("SELECT count(*) FROM audit_logs")).scalar_one() == 1
+
+    def test_jsonb_gin_indexes_exist(self, db_session):
+        """Test that filtered JSONB columns have GIN indexes usable for @> queries."""
+        inspector = inspect(db_session.bind)
+
+        doc_indexes = {idx['name'] for idx in inspector.get_indexes('documents')}
+        assert 'idx_documents_metadata_gin' in doc_indexes
+        assert 'idx_documents_tags_gin' in doc_indexes
+
+        entity_indexes = {idx['name'] for idx in inspector.get_indexes('collection_entities')}
+        assert 'idx_collection_entities_properties_gin' in entity_indexes
+
+        graph_indexes = {idx['name'] for idx in inspector.get_indexes('graph_entities')}
+        assert 'idx_graph_entities_properties_gin' in graph_indexes
+        audit_indexes = {idx['name'] for idx in inspector.get_indexes('audit_logs')}
+        assert 'idx_audit_logs_details_gin' in audit_indexes
+
+        # No plain JSON columns remain
+        json_columns = db_session.execute(text(
+            "SELECT table_name || '.' || column_name FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND data_type = 'json'"
+        )).scalars().all()
+        assert json_columns == []
+
+        # Containment on JSONB works (JSON columns would reject @>)
+        found = db_session.execute(text(
+            "SELECT count(*) FROM documents WHERE tags @> '[\"x\"]' OR metadata @> '{\"k\": 1}'"
+        )).scalar()
+        assert found == 0
+
+    def test_document_search_vector_index(self, db_session):
+        """Test that documents have a generated tsvector column with a GIN index."""
+        inspector = inspect(db_session.bind)
+        columns = {col['name']: col for col in inspector.get_columns('documents')}
+        assert 'TSVECTOR' in str(columns['search_vector']['type'])
+        assert columns['search_vector'].get('computed', {}).get('persisted') is True
+
+        indexdef = db_session.execute(text(
+            "SELECT indexdef FROM pg_indexes WHERE indexname = 'idx_documents_search'"
+        )).scalar()
+        assert indexdef is not None and 'USING gin' in indexdef
+
+    def test_metadata_language_expression_index(self, db_session):
+        """Test that metadata->>'language' filters can use the expression index."""
+        indexdef = db_session.execute(text(
+            "SELECT indexdef FROM pg_indexes WHERE indexname = 'idx_documents_meta_lang'"
+        )).scalar()
+        assert indexdef is not None
+        assert "'language'" in indexdef
+
+        query = db_session.query(Document.id).filter(
+            Document.document_metadata['language'].astext == 'en'
+        )
+        compiled = query.statement.compile(
+            dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(db_session.execute(text(f"EXPLAIN {compiled}")).scalars())
+        assert 'idx_documents_meta_lang' in plan
+
+    def test_soft_delete_partial_indexes(self, db_session):
+        """Test that live-row lookups use partial indexes instead of an is_deleted btree."""
+        rows = db_session.execute(text(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE tablename IN ('documents', 'collections')"
+        )).all()
+        indexes = dict(rows)
+
+        for name in ('idx_documents_live_org', 'idx_collections_live_org', 'idx_collections_live_parent'):
+            assert name in indexes, f"Index {name} should exist"
+            assert 'WHERE (is_deleted = false)' in indexes[name]
+        assert 'idx_documents_is_deleted' not in indexes
+        assert 'idx_collections_is_deleted' not in indexes
+
+    def test_append_only_timestamps_use_brin(self, db_session):
+        """Test that append-only timestamp columns are indexed with BRIN."""
+        rows = db_session.execute(text(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE tablename IN ('entity_operations', 'document_versions', 'audit_logs', 'feedback')"
+        )).all()
+        indexes = dict(rows)
+
+        for name in ('idx_entity_operations_performed_at_brin', 'idx_document_versions_created_at_brin',
+                     'idx_audit_logs_action_time_brin', 'idx_feedback_created_at_brin'):
+            assert name in indexes, f"Index {name} should exist"
+            assert 'USING brin' in indexes[name]
+        for name in ('idx_entity_operations_performed_at', 'idx_audit_logs_action_time', 'idx_feedback_created_at'):
+            assert name not in indexes
+
+    def test_valid_token_lookup_is_index_only(self, db_session):
+        """Test that looking up a user's live tokens is served by the partial covering index."""
+        import uuid
+
+        indexes = dict(db_session.execute(text(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'tokens'"
+        )).all())
+        assert 'idx_tokens_is_revoked' not in indexes
+        assert 'INCLUDE (token_type) WHERE (is_revoked = false)' in indexes['idx_tokens_user_valid']
+
+        # The table is empty here, so steer the planner off the plans that
+        # win for tiny tables
+        db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+        plan = db_session.execute(text(
+            "EXPLAIN SELECT token_type, expires_at FROM tokens "
+            "WHERE user_id = :user_id AND is_revoked = false AND expires_at > now()"
+        ), {"user_id": uuid.uuid4()}).scalars().all()
+
+        # tokens is hash-partitioned on id, so each partition is probed
+        # through its own copy of idx_tokens_user_valid
+        partition_indexes = set(db_session.execute(text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'idx_tokens_user_valid'::regclass"
+        )).scalars())
+        scans = [line for line in plan if ' Scan ' in line]
+        assert scans and all('Index Only Scan using' in line for line in scans)
+        assert {line.split(' using ')[1].split()[0] for line in scans} <= partition_indexes
+
+    def test_tokens_hash_partitioned_on_jti(self, db_session):
+        """Test that tokens spread over hash partitions and a JTI lookup touches only one."""
+        from datetime import datetime, timedelta, timezone
+        from src.axai_pg.data.models.token import Token, TOKEN_PARTITIONS
+
+        assert db_session.execute(text(
+            "SELECT count(*) FROM pg_inherits WHERE inhparent = 'tokens'::regclass"
+        )).scalar_one() == TOKEN_PARTITIONS
+
+        user = User(username="tokenholder", email="tokenholder@example.com")
+        db_session.add(user)
+        db_session.flush()
+        expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        db_session.add_all([
+            Token(id=f"jti-{i}", token_type="access", user_id=user.id, expires_at=expires)
+            for i in range(64)
+        ])
+        db_session.flush()
+
+        assert db_session.execute(text(
+            "SELECT count(DISTINCT tableoid) FROM tokens"
+        )).scalar_one() > 1
+        plan = '\n'.join(db_session.execute(text(
+            "EXPLAIN SELECT * FROM tokens WHERE id = 'jti-7'"
+        )).scalars().all())
+        assert plan.count(' on tokens_p') == 1
+
     def test_collection_parent_foreign_key(self, db_session):
         """Test that collection self-referential FK is properly created."""
         inspector = inspect(db_session.bind)
@@ -384,6 +854,37 @@ class TestSchemaCreation:
         assert file_fk is not None, "VisibilityProfile should have FK to documents"
         assert collection_fk is not None, "VisibilityProfile should have FK to collections"
 
+    def test_cyclic_foreign_keys_are_deferred(self, db_session):
+        """Test that hierarchy and visibility-profile FKs are checked at commit."""
+        from sqlalchemy import insert
+        from src.axai_pg.data.models.ids import uuid7
+
+        deferred = dict(db_session.execute(text(
+            "SELECT conname, condeferred FROM pg_constraint "
+            "WHERE conname IN ('fk_collection_parent', 'fk_visibility_profile_document', "
+            "'documents_default_visibility_profile_id_fkey')"
+        )).all())
+        assert deferred == {
+            'fk_collection_parent': True,
+            'fk_visibility_profile_document': True,
+            'documents_default_visibility_profile_id_fkey': True,
+        }
+
+        org = Organization(name="Test Org")
+        db_session.add(org)
+        db_session.flush()
+        user = User(username="testuser", email="test@example.com", org_id=org.id)
+        db_session.add(user)
+        db_session.flush()
+
+        # Child row first, parent second: valid once the statement batch ends
+        parent_id, child_id = uuid7(), uuid7()
+        db_session.execute(insert(Collection), [
+            {"id": child_id, "name": "Child", "owner_id": user.id, "parent_id": parent_id},
+            {"id": parent_id, "name": "Parent", "owner_id": user.id},
+        ])
+        db_session.execute(text("SET CONSTRAINTS ALL IMMEDIATE"))
+
     def test_check_constraint_visibility_profile_type(self, db_session):
         """Test that visibility profile type check constraint works."""
         # Create dependencies